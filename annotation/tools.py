@@ -8,6 +8,7 @@ from django.db import transaction
 from django.db.utils import IntegrityError
 from django.core.management.base import CommandError
 
+from api.cache import bump_generation
 from annotation.models import Annotation, Inference, Feature, Repeat
 from staphopia.utils import timeit, gziplines, read_fasta, read_json
 
@@ -45,6 +46,8 @@ def insert_annotation(sample, version, files, force=False):
     except IntegrityError as exception:
         raise CommandError(f'{sample.name} Annotation save error: {exception}')
 
+    bump_generation(sample.pk)
+
 
 @transaction.atomic
 def delete_annotation(sample, version):
@@ -0,0 +1,83 @@
+"""
+Bitmaps of sample ids, the members of SNPs and InDels.
+
+Bit `i` of a bitmap is set when sample `i` is a member. Sample ids are dense,
+so a bitmap of every public sample is a few KB. Bitmaps are stored as is in
+SNPMember.bitmap and IndelMember.bitmap, bit `i` being bit `i % 8` of byte
+`i // 8`, so ingest can set a sample's bit with set_bit() (see
+variant.members). PostgreSQL compresses values over 2KB itself. Bitmaps are
+Python ints, so the intersection, union or difference of two is a single
+operation in C, however many samples they hold.
+
+To use:
+from api.bitmaps import SampleBitmap
+"""
+from functools import reduce
+
+# Offsets of the set bits of each byte value
+BYTE_BITS = [tuple(i for i in range(8) if byte >> i & 1)
+             for byte in range(256)]
+
+
+class SampleBitmap(object):
+    """A set of sample ids, supporting &, |, - and len() like a set."""
+
+    __slots__ = ('bits',)
+
+    def __init__(self, sample_ids=(), bits=0):
+        if sample_ids:
+            data = bytearray(max(sample_ids) // 8 + 1)
+            for sample_id in sample_ids:
+                data[sample_id >> 3] |= 1 << (sample_id & 7)
+            bits |= int.from_bytes(data, 'little')
+        self.bits = bits
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Return the bitmap stored in a member row."""
+        return cls(bits=int.from_bytes(data, 'little'))
+
+    def to_bytes(self):
+        """Return the bitmap as stored in a member row."""
+        return self.bits.to_bytes((self.bits.bit_length() + 7) // 8, 'little')
+
+    def __and__(self, other):
+        return SampleBitmap(bits=self.bits & other.bits)
+
+    def __or__(self, other):
+        return SampleBitmap(bits=self.bits | other.bits)
+
+    def __sub__(self, other):
+        return SampleBitmap(bits=self.bits & ~other.bits)
+
+    def __eq__(self, other):
+        return isinstance(other, SampleBitmap) and self.bits == other.bits
+
+    def __contains__(self, sample_id):
+        return bool(self.bits >> sample_id & 1)
+
+    def __bool__(self):
+        return bool(self.bits)
+
+    def __len__(self):
+        return bin(self.bits).count('1')
+
+    def __iter__(self):
+        """Yield the sample ids in ascending order."""
+        for offset, byte in enumerate(self.to_bytes()):
+            if byte:
+                for bit in BYTE_BITS[byte]:
+                    yield offset * 8 + bit
+
+    def __repr__(self):
+        return f'SampleBitmap({len(self)} samples)'
+
+
+def intersection(bitmaps):
+    """Return the samples in every bitmap."""
+    return reduce(lambda a, b: a & b, bitmaps) if bitmaps else SampleBitmap()
+
+
+def union(bitmaps):
+    """Return the samples in any bitmap."""
+    return reduce(lambda a, b: a | b, bitmaps, SampleBitmap())
@@ -0,0 +1,236 @@
+"""
+Cache the results of api.queries functions.
+
+Results are stored in the API_CACHE_ALIAS cache (see CACHES) and keyed on the
+query function, its normalized arguments, the permission scope and the
+generation stamps of the samples it covers.
+
+Generation stamps are random tokens, not counters. The ingest tools replace a
+sample's stamp whenever its results change, which orphans every cached entry
+for that sample (they are then evicted by TTL or culling). If a stamp itself
+is evicted, a new one is created, which has the same effect. Queries that are
+not tied to samples use the GLOBAL stamp, replaced on every ingest, and every
+key includes the EVERYTHING stamp, replaced by bulk operations. Catalog tables
+(e.g. SCCmec cassettes) have a stamp per app (see catalog_stamp), replaced by
+their loaders.
+
+Results read from a replica are only cached once it has replayed the
+primary's WAL up to where it was when the stamps were last replaced, else
+results older than the stamps would be cached under them.
+
+Expensive queries can be coalesced: on a miss only one process on the host
+runs the query while concurrent callers wait on a lock file for its result.
+
+To use:
+from api.cache import cached_query, bump_generation
+"""
+from contextlib import contextmanager
+import fcntl
+import functools
+import hashlib
+import inspect
+import os
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db import transaction
+
+from staphopia.db.routers import (
+    get_read_database,
+    get_wal_position,
+    has_replayed,
+    read_from
+)
+
+GLOBAL = 'global'
+EVERYTHING = 'all'
+# The primary's WAL position when stamps were last replaced
+WAL_KEY = 'wal-position'
+MISSING = object()
+
+
+def get_cache():
+    """Return the API cache, or None if caching is disabled."""
+    alias = getattr(settings, 'API_CACHE_ALIAS', None)
+    if alias and alias in settings.CACHES:
+        return caches[alias]
+    return None
+
+
+def get_permission_scope():
+    """Return which samples queries can see, see get_sample_permisions."""
+    return 'all' if settings.VIEW_ALL_SAMPLES else 'public'
+
+
+def as_ids(ids):
+    """Return sample ids as a tuple."""
+    if isinstance(ids, (list, tuple, set)):
+        return tuple(ids)
+    return (ids,)
+
+
+def normalize(value):
+    """Return a hashable, repr-stable version of a query argument."""
+    if isinstance(value, (list, tuple)):
+        return tuple(normalize(v) for v in value)
+    elif isinstance(value, (set, frozenset)):
+        # Set order varies with PYTHONHASHSEED, so between processes
+        return tuple(sorted(normalize(v) for v in value))
+    elif isinstance(value, dict):
+        return tuple(sorted((k, normalize(v)) for k, v in value.items()))
+    return value
+
+
+def catalog_stamp(app_label):
+    """Return the generation stamp name of an app's catalog tables."""
+    return f'catalog:{app_label}'
+
+
+def stamp_key(name):
+    return f'generation:{name}'
+
+
+def get_generations(names):
+    """Return the generation stamps for a list of samples (or GLOBAL)."""
+    cache = get_cache()
+    keys = [stamp_key(name) for name in [EVERYTHING] + list(names)]
+    stamps = cache.get_many(keys)
+    missing = [key for key in keys if key not in stamps]
+    if missing:
+        # Keep a stamp created meanwhile by another process, so concurrent
+        # callers agree on the key
+        for key in missing:
+            cache.add(key, uuid.uuid4().hex, timeout=None)
+        stamps.update(cache.get_many(missing))
+    return tuple(stamps[key] for key in keys)
+
+
+def bump_generation(*names):
+    """
+    Replace the generation stamps of samples (and GLOBAL).
+
+    The stamps are replaced once the current transaction commits, so a request
+    can not cache the old results under the new stamps.
+    """
+    cache = get_cache()
+    if cache is None:
+        return
+
+    keys = [stamp_key(name) for name in list(names) + [GLOBAL]]
+
+    def replace():
+        # Recorded before the stamps, so results read from a replica are
+        # only cached under them once it has replayed the commit
+        position = get_wal_position()
+        if position is not None and position > cache.get(WAL_KEY, 0):
+            cache.set(WAL_KEY, position, timeout=None)
+        cache.set_many({key: uuid.uuid4().hex for key in keys}, timeout=None)
+    transaction.on_commit(replace)
+
+
+def invalidate_all():
+    """Orphan every cached result, e.g. after bulk updates to samples."""
+    bump_generation(EVERYTHING)
+
+
+@contextmanager
+def single_flight(key, timeout=None):
+    """
+    Hold an exclusive lock on `key` shared by all processes of the host.
+
+    Yields False, without the lock, if it was not released within `timeout`
+    (default API_COALESCE_TIMEOUT) seconds.
+    """
+    if timeout is None:
+        timeout = settings.API_COALESCE_TIMEOUT
+    os.makedirs(settings.API_COALESCE_DIR, exist_ok=True)
+    deadline = time.time() + timeout
+    with open(os.path.join(settings.API_COALESCE_DIR, f'{key}.lock'),
+              'a') as lock:
+        while True:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.time() >= deadline:
+                    yield False
+                    return
+                time.sleep(0.05)
+
+        try:
+            yield True
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def cached_query(sample_arg=None, coalesce=False):
+    """
+    Cache the results of a query function.
+
+    `sample_arg` is the name of the argument with the sample ids the results
+    depend on. Queries with more than API_CACHE_MAX_IDS samples are not
+    cached. Without `sample_arg` the results depend on the GLOBAL stamp and
+    expire after API_CACHE_GLOBAL_TIMEOUT, as they may also change outside
+    of ingest (e.g. publications).
+
+    With `coalesce` concurrent misses of the same key wait for the first
+    caller (see single_flight) and share its results, instead of all
+    running the query.
+    """
+    def decorator(fun):
+        signature = inspect.signature(fun)
+        name = f'{fun.__module__}.{fun.__qualname__}'
+
+        @functools.wraps(fun)
+        def wrapper(*args, **kwargs):
+            cache = get_cache()
+            if cache is None:
+                return fun(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = tuple(
+                (key, normalize(val)) for key, val in bound.arguments.items()
+            )
+
+            if sample_arg:
+                sample_ids = as_ids(bound.arguments[sample_arg])
+                if len(sample_ids) > settings.API_CACHE_MAX_IDS:
+                    return fun(*args, **kwargs)
+                stamps = get_generations(sample_ids)
+                timeout = DEFAULT_TIMEOUT
+            else:
+                stamps = get_generations([GLOBAL])
+                timeout = settings.API_CACHE_GLOBAL_TIMEOUT
+
+            key = hashlib.sha1(repr(
+                (name, arguments, get_permission_scope(), stamps)
+            ).encode()).hexdigest()
+            results = cache.get(f'query:{key}', MISSING)
+            if results is not MISSING:
+                return results
+            elif coalesce:
+                with single_flight(key):
+                    # Cached by another process while waiting
+                    results = cache.get(f'query:{key}', MISSING)
+                    if results is MISSING:
+                        results = run_query(cache, key, timeout, args, kwargs)
+                return results
+            return run_query(cache, key, timeout, args, kwargs)
+
+        def run_query(cache, key, timeout, args, kwargs):
+            # A lagging replica may return results older than the stamps
+            position = cache.get(WAL_KEY)
+            database = get_read_database()
+            with read_from(database):
+                results = fun(*args, **kwargs)
+            if has_replayed(database, position):
+                cache.set(f'query:{key}', results, timeout=timeout)
+            return results
+
+        wrapper.uncached = fun
+        return wrapper
+    return decorator
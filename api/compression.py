@@ -0,0 +1,92 @@
+"""
+Response compression for the API.
+
+CompressionMiddleware (see api/middleware.py) uses these to compress API
+responses with zstd (if zstandard is installed) or gzip, based on the
+Accept-Encoding of the request. Streamed responses are compressed one chunk
+at a time, each chunk is flushed so clients can decode it as it arrives.
+
+To use:
+from api.compression import select_encoding, compress, compress_chunks
+"""
+from importlib.util import find_spec
+import zlib
+
+from django.conf import settings
+
+
+class GzipCompressor(object):
+    def __init__(self, level):
+        # wbits of 31 writes a gzip header and trailer
+        self.compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data):
+        return self.compressor.compress(data)
+
+    def flush(self, finish=True):
+        return self.compressor.flush(
+            zlib.Z_FINISH if finish else zlib.Z_SYNC_FLUSH
+        )
+
+
+class ZstdCompressor(object):
+    def __init__(self, level):
+        import zstandard
+        self.flush_block = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        self.compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data):
+        return self.compressor.compress(data)
+
+    def flush(self, finish=True):
+        if finish:
+            return self.compressor.flush()
+        return self.compressor.flush(self.flush_block)
+
+
+# In order of preference
+COMPRESSORS = {}
+if find_spec('zstandard') is not None:
+    COMPRESSORS['zstd'] = ZstdCompressor
+COMPRESSORS['gzip'] = GzipCompressor
+
+
+def select_encoding(accept_encoding):
+    """Return the preferred encoding accepted by the client, or None."""
+    accepted = set()
+    for encoding in accept_encoding.lower().split(','):
+        encoding, _, params = encoding.partition(';')
+        params = params.replace(' ', '')
+        try:
+            quality = float(params[2:]) if params.startswith('q=') else 1
+        except ValueError:
+            quality = 1
+        if quality > 0:
+            accepted.add(encoding.strip())
+
+    for encoding in COMPRESSORS:
+        if encoding in accepted:
+            return encoding
+    return None
+
+
+def get_compressor(encoding, level=None):
+    if level is None:
+        level = settings.API_COMPRESS_LEVEL[encoding]
+    return COMPRESSORS[encoding](level)
+
+
+def compress(content, encoding, level=None):
+    """Return the compressed content."""
+    compressor = get_compressor(encoding, level=level)
+    return compressor.compress(content) + compressor.flush()
+
+
+def compress_chunks(chunks, encoding, level=None):
+    """Yield the compressed chunks, flushing after each one."""
+    compressor = get_compressor(encoding, level=level)
+    for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush(finish=False)
+        if data:
+            yield data
+    yield compressor.flush()
@@ -0,0 +1,122 @@
+"""
+Build sample dossiers, the results of several sample queries in one document.
+
+Each requested section (see SECTIONS) is queried for every sample at once,
+and the sections run concurrently on at most API_DOSSIER_WORKERS threads.
+Each thread has its own database connection, reads from the same database
+as the request (see staphopia.db.routers) and closes it when done. With a
+pooled database (see staphopia.db.backends.postgresql_pool) the request
+holds one of the pool's connections, so at most MAX_SIZE - 1 threads run.
+
+To use:
+from api.dossier import get_dossiers, SECTIONS
+"""
+from collections import OrderedDict
+from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from django.conf import settings
+from django.db import connections
+
+from api.middleware import set_statement_timeout
+from api.queries.assemblies import get_assembly_stats
+from api.queries.publications import get_pmids
+from api.queries.resistances import get_ariba_resistance
+from api.queries.samples import get_samples, get_sample_metadata
+from api.queries.sccmecs import (
+    get_sccmec_coverage_by_sample,
+    get_sccmec_primers_by_sample
+)
+from api.queries.sequence_types import get_sequence_type
+from api.queries.sequences import get_sequencing_stats
+from api.queries.tags import get_tags_by_sample
+from api.queries.variants import get_variant_counts
+from api.queries.virulences import get_ariba_virulence
+from staphopia.db.routers import get_read_database, read_from
+
+# Sections of a dossier, called with a list of sample ids and the user_id,
+# named after the matching /api/sample/<id>/<section>/ route
+SECTIONS = OrderedDict((
+    ('assembly', get_assembly_stats),
+    ('qc', get_sequencing_stats),
+    ('st', get_sequence_type),
+    ('sccmec_coverages', get_sccmec_coverage_by_sample),
+    ('sccmec_primers', get_sccmec_primers_by_sample),
+    ('sccmec_subtypes', partial(get_sccmec_primers_by_sample,
+                                is_subtypes=True)),
+    ('resistance', get_ariba_resistance),
+    ('virulence', get_ariba_virulence),
+    ('tags', get_tags_by_sample),
+    ('metadata', get_sample_metadata),
+    ('pmid', get_pmids),
+    ('variant_count', get_variant_counts)
+))
+
+
+def run_query(query, sample_ids, user_id, database, request=None):
+    """Run a section's query in a worker thread, on its own connection."""
+    connection = connections[database]
+    try:
+        with read_from(database), ExitStack() as stack:
+            if request is not None:
+                stack.enter_context(connection.execute_wrapper(
+                    partial(set_statement_timeout, request, [])
+                ))
+            # Some queries return None instead of an empty list
+            return list(query(sample_ids, user_id) or [])
+    finally:
+        # Connections are per thread, close it before the thread is reused
+        connection.close()
+
+
+def get_max_workers(database, sections):
+    """Return the threads to run `sections` on, one per free connection."""
+    workers = min(settings.API_DOSSIER_WORKERS, len(sections) + 1)
+    pool = getattr(connections[database], 'pool', None)
+    if pool is not None:
+        workers = min(workers, max(pool.max_size - 1, 1))
+    return workers
+
+
+def get_samples_by_id(sample_ids, user_id):
+    return get_samples(user_id, sample_ids=sample_ids)
+
+
+def get_dossiers(sample_ids, sections, user_id, request=None):
+    """
+    Return a dossier for each sample `user_id` can see.
+
+    A dossier holds the sample (as in /api/sample/bulk/) and a list of
+    results for each of `sections`. Given the `request`, section queries use
+    its endpoint's statement timeout.
+    """
+    database = get_read_database()
+    with ThreadPoolExecutor(
+        max_workers=get_max_workers(database, sections)
+    ) as executor:
+        samples = executor.submit(run_query, get_samples_by_id, sample_ids,
+                                  user_id, database, request=request)
+        futures = OrderedDict(
+            (section, executor.submit(run_query, SECTIONS[section],
+                                      sample_ids, user_id, database,
+                                      request=request))
+            for section in sections
+        )
+
+        dossiers = OrderedDict()
+        for sample in samples.result():
+            dossiers[sample['sample_id']] = OrderedDict((
+                ('sample_id', sample['sample_id']),
+                ('sample', sample),
+                *[(section, []) for section in sections]
+            ))
+
+        for section, future in futures.items():
+            for result in future.result():
+                # get_sample_metadata returns a placeholder without a
+                # sample_id when no sample has metadata
+                if result.get('sample_id') in dossiers:
+                    dossiers[result['sample_id']][section].append(result)
+
+    return list(dossiers.values())
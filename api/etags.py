@@ -0,0 +1,106 @@
+"""
+ETags and conditional GETs backed by generation stamps (see api/cache.py).
+
+A response's ETag hashes the generation stamps of the data it shows (the
+requested sample, or a catalog such as 'catalog:sccmec') with the user, URL
+and format of the request. As stamps only change when ingest replaces them,
+a request whose If-None-Match holds the current ETag is answered with a 304
+before any query runs.
+
+To use:
+from api.etags import conditional, ConditionalCatalogMixin
+"""
+import functools
+import hashlib
+
+from rest_framework import status
+from rest_framework.response import Response
+
+from api.cache import (
+    catalog_stamp,
+    get_cache,
+    get_generations,
+    get_permission_scope
+)
+
+
+def get_etag(request, names):
+    """Return the ETag of a request showing the data stamped by `names`."""
+    renderer = getattr(request, 'accepted_renderer', None)
+    key = hashlib.sha1(repr((
+        request.user.pk, request.get_full_path(),
+        getattr(renderer, 'format', None), get_permission_scope(),
+        get_generations(names)
+    )).encode()).hexdigest()
+    return f'"{key}"'
+
+
+def matches(etag, if_none_match):
+    """Return True if `etag` is one of the ETags in If-None-Match."""
+    if if_none_match.strip() == '*':
+        return True
+    # Compression weakens ETags (W/"..."), a GET compares them weakly
+    return etag in [
+        tag.strip().replace('W/', '', 1) for tag in if_none_match.split(',')
+    ]
+
+
+def conditional_response(request, names, respond):
+    """
+    Return a 304 if If-None-Match is current, else `respond()` with an ETag.
+    """
+    if get_cache() is None or request.method not in ('GET', 'HEAD'):
+        return respond()
+
+    etag = get_etag(request, names)
+    if matches(etag, request.META.get('HTTP_IF_NONE_MATCH', '')):
+        return Response(status=status.HTTP_304_NOT_MODIFIED,
+                        headers={'ETag': etag})
+
+    response = respond()
+    if response.status_code == status.HTTP_200_OK:
+        response['ETag'] = etag
+    return response
+
+
+def conditional(*names):
+    """
+    Add ETags to a viewset action.
+
+    Without `names` the action shows data of the sample in `pk`.
+    """
+    def decorator(fun):
+        @functools.wraps(fun)
+        def wrapper(self, request, *args, **kwargs):
+            stamps = names or [kwargs['pk']]
+            return conditional_response(
+                request, stamps, lambda: fun(self, request, *args, **kwargs)
+            )
+        return wrapper
+    return decorator
+
+
+class ConditionalCatalogMixin(object):
+    """
+    ETags for listing and retrieving a catalog table (e.g. SCCmec cassettes).
+
+    `catalog` is the app label whose catalog stamp the loaders bump.
+    """
+
+    catalog = None
+
+    def list(self, request, *args, **kwargs):
+        return conditional_response(
+            request, [catalog_stamp(self.catalog)],
+            lambda: super(ConditionalCatalogMixin, self).list(
+                request, *args, **kwargs
+            )
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        return conditional_response(
+            request, [catalog_stamp(self.catalog)],
+            lambda: super(ConditionalCatalogMixin, self).retrieve(
+                request, *args, **kwargs
+            )
+        )
@@ -0,0 +1,232 @@
+"""Middleware for the API."""
+from contextlib import ExitStack
+from functools import partial
+import json
+import logging
+import re
+
+from django.conf import settings
+from django.db import OperationalError, connections
+from django.http import JsonResponse
+from django.utils.cache import patch_vary_headers
+
+from api.compression import compress, compress_chunks, select_encoding
+from api.profiling import start_profile, stop_profile, time_query
+from staphopia.db.routers import use_replicas
+
+slow_logger = logging.getLogger('api.slow')
+
+# SQLSTATE of a query cancelled by statement_timeout
+QUERY_CANCELED = '57014'
+
+
+class QueryProfileMiddleware(object):
+    """
+    Profile the SQL queries of each API request.
+
+    Requests slower than API_SLOW_REQUEST_MS are logged (as JSON) to the
+    'api.slow' logger. Staff users (or any user when DEBUG is on) can pass
+    ?profile to get the breakdown in the response and a Server-Timing header.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not request.path.startswith('/api/'):
+            return self.get_response(request)
+
+        profile = start_profile(measure_bytes='profile' in request.GET)
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(time_query))
+                response = self.get_response(request)
+        finally:
+            stop_profile()
+
+        summary = profile.summary()
+        if summary['total_ms'] >= settings.API_SLOW_REQUEST_MS:
+            self.log_slow_request(request, response, summary)
+
+        if 'profile' in request.GET and self.can_profile(request):
+            self.add_profile(response, summary)
+
+        return response
+
+    def can_profile(self, request):
+        user = getattr(request, 'user', None)
+        return settings.DEBUG or (user is not None and user.is_staff)
+
+    def log_slow_request(self, request, response, summary):
+        user = getattr(request, 'user', None)
+        slow_logger.warning(json.dumps({
+            'method': request.method,
+            'path': request.path,
+            'query': request.META.get('QUERY_STRING', ''),
+            'status': response.status_code,
+            'user_id': user.pk if user is not None else None,
+            **{k: v for k, v in summary.items() if k != 'queries'},
+            'queries': summary['queries'][:5]
+        }))
+
+    def add_profile(self, response, summary):
+        """Add a Server-Timing header, and the breakdown to JSON responses."""
+        response['Server-Timing'] = ', '.join([
+            f'{key[:-3]};dur={val}' for key, val in summary.items()
+            if key.endswith('_ms')
+        ])
+
+        if response.streaming:
+            return
+        if not response.get('Content-Type', '').startswith('application/json'):
+            return
+
+        data = json.loads(response.content)
+        if isinstance(data, dict):
+            data['profile'] = summary
+            response.content = json.dumps(data, separators=(',', ':'))
+
+
+class ReadReplicaMiddleware(object):
+    """Send the reads of API requests to API_READ_REPLICAS, if any."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not request.path.startswith('/api/'):
+            return self.get_response(request)
+
+        with use_replicas():
+            return self.get_response(request)
+
+
+def get_statement_timeout(request):
+    """Return the statement timeout (ms) of the requested endpoint."""
+    url_name = getattr(request.resolver_match, 'url_name', None)
+    timeouts = settings.API_STATEMENT_TIMEOUTS
+    return timeouts.get(url_name, timeouts['default'])
+
+
+def set_statement_timeout(request, connections_set, execute, sql, params,
+                          many, context):
+    """Execute wrapper setting the endpoint's statement_timeout first."""
+    connection = context['connection']
+    if connection.vendor == 'postgresql' and connection not in connections_set:
+        timeout = get_statement_timeout(request)
+        if timeout:
+            # The raw cursor, so the SET does not go through the wrappers
+            with connection.wrap_database_errors:
+                context['cursor'].cursor.execute(
+                    'SET statement_timeout = %s', [int(timeout)]
+                )
+            connections_set.append(connection)
+    return execute(sql, params, many, context)
+
+
+class StatementTimeoutMiddleware(object):
+    """
+    Cancel API queries running longer than their endpoint allows.
+
+    Timeouts are milliseconds in API_STATEMENT_TIMEOUTS by URL name (or its
+    'default'), a cancelled query returns a 503 instead of holding the worker
+    until the socket times out. Queries of streamed responses run after the
+    view returns and use the database's own timeout.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not request.path.startswith('/api/'):
+            return self.get_response(request)
+
+        connections_set = []
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(
+                        partial(set_statement_timeout, request,
+                                connections_set)
+                    ))
+                return self.get_response(request)
+        finally:
+            for connection in connections_set:
+                self.reset_statement_timeout(connection)
+
+    def reset_statement_timeout(self, connection):
+        if connection.connection is None:
+            return
+        try:
+            with connection.connection.cursor() as cursor:
+                cursor.execute('RESET statement_timeout')
+        except connection.Database.Error:
+            # e.g. an aborted transaction, the connection is not reused
+            pass
+
+    def process_exception(self, request, exception):
+        if not isinstance(exception, OperationalError):
+            return None
+        elif getattr(exception.__cause__, 'pgcode', None) != QUERY_CANCELED:
+            return None
+
+        timeout = get_statement_timeout(request)
+        return JsonResponse({
+            "has_errors": True,
+            "message": (f"Query was cancelled after {timeout / 1000:.0f}s, "
+                        "try fewer ids or ?async for large requests.")
+        }, status=503)
+
+
+class CompressionMiddleware(object):
+    """
+    Compress API responses with zstd or gzip, based on Accept-Encoding.
+
+    Unlike Django's GZipMiddleware the minimum size (API_COMPRESS_MIN_SIZE)
+    and level (API_COMPRESS_LEVEL) are settings, and zstd is preferred when
+    the zstandard package is installed. Streamed responses are compressed a
+    chunk at a time, so the body is never buffered.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if not request.path.startswith('/api/'):
+            return response
+        elif response.has_header('Content-Encoding'):
+            return response
+
+        content_type = response.get('Content-Type', '').split(';')[0]
+        if content_type in settings.API_COMPRESS_SKIP_TYPES:
+            return response
+        elif (not response.streaming and
+                len(response.content) < settings.API_COMPRESS_MIN_SIZE):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        encoding = select_encoding(
+            request.META.get('HTTP_ACCEPT_ENCODING', '')
+        )
+        if not encoding:
+            return response
+
+        if response.streaming:
+            response.streaming_content = compress_chunks(
+                response.streaming_content, encoding
+            )
+            del response['Content-Length']
+        else:
+            content = compress(response.content, encoding)
+            if len(content) >= len(response.content):
+                return response
+            response.content = content
+            response['Content-Length'] = str(len(content))
+
+        # The compressed body is no longer byte for byte the same
+        if response.has_header('ETag'):
+            response['ETag'] = re.sub(r'^"', 'W/"', response['ETag'])
+        response['Content-Encoding'] = encoding
+        return response
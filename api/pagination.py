@@ -1,10 +1,38 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
 from collections import OrderedDict
+import binascii
+import json
 import time
 
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.urls import reverse
+
 from rest_framework.response import Response
 from rest_framework import mixins, status as rf_status, viewsets
+from rest_framework.utils.urls import replace_query_param
+
+from api.renderers import ColumnarRenderer
+from api.utils import format_results, project, stream_results, timeit
+from job.tools import submit_job
+
+
+def encode_cursor(values):
+    """Return an opaque cursor for the key values of the last row."""
+    return urlsafe_b64encode(json.dumps(values).encode()).decode()
+
 
-from api.utils import format_results
+def decode_cursor(cursor, total_keys):
+    """Return the key values of a cursor, or None if it is not valid."""
+    try:
+        values = json.loads(urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
+
+    if (not isinstance(values, list) or len(values) != total_keys or
+            not all(isinstance(i, int) for i in values)):
+        return None
+    return values
 
 
 class CustomReadOnlyModelViewSet(mixins.RetrieveModelMixin,
@@ -12,13 +40,39 @@ class CustomReadOnlyModelViewSet(mixins.RetrieveModelMixin,
                                  viewsets.GenericViewSet):
     """
     A viewset that provides default `list()` and `retrieve()` actions.
+
+    Responses only include sample_id and the fields listed in ?fields=
+    (comma separated), views pass `get_fields()` on to queries that can skip
+    the other columns.
     """
 
+    def get_fields(self):
+        """Return the set of fields in ?fields=, or None for all fields."""
+        fields = self.request.GET.get('fields')
+        if not fields:
+            return None
+        return frozenset(
+            [f.strip() for f in fields.split(',') if f.strip()] +
+            ['sample_id']
+        )
+
+    def project_fields(self, results):
+        """Drop fields not in ?fields= that a query did not skip."""
+        fields = self.get_fields()
+        if fields is None:
+            return results
+        elif isinstance(results, (list, tuple)):
+            if all(set(result) <= fields for result in results[:1]):
+                return results
+            return list(project(results, fields))
+        return project(results, fields)
+
     def formatted_response(self, data, query_time=None, return_empty=False,
                            status=rf_status.HTTP_200_OK, limit=None):
         if len(data) or return_empty:
             return Response(
-                format_results(data, query_time=query_time, limit=limit),
+                format_results(self.project_fields(data),
+                               query_time=query_time, limit=limit),
                 status=status
             )
         else:
@@ -31,6 +85,83 @@ class CustomReadOnlyModelViewSet(mixins.RetrieveModelMixin,
                 status=rf_status.HTTP_200_OK
             )
 
+    def streaming_response(self, results, status=rf_status.HTTP_200_OK):
+        """
+        Stream results (e.g. from stream_query) as they are produced.
+
+        Results are JSON unless a columnar format (e.g. ?format=tsv) was
+        negotiated, see api/renderers.py.
+        """
+        results = self.project_fields(results)
+        renderer = getattr(self.request, 'accepted_renderer', None)
+        if isinstance(renderer, ColumnarRenderer):
+            content_type = renderer.media_type
+            if renderer.charset:
+                content_type = f'{content_type}; charset={renderer.charset}'
+            return StreamingHttpResponse(renderer.stream(results),
+                                         status=status,
+                                         content_type=content_type)
+
+        return StreamingHttpResponse(
+            stream_results(results),
+            status=status,
+            content_type='application/json'
+        )
+
+    def max_query(self, limit):
+        """Return the ids allowed in a bulk request, more for jobs."""
+        if 'async' in self.request.GET:
+            return max(limit, settings.API_JOB_MAX_IDS)
+        return limit
+
+    def job_response(self, query, **arguments):
+        """Queue a query (see job.tools.JOBS) and return the job to poll."""
+        job = submit_job(query, self.request.user.pk, **arguments)
+        return Response(OrderedDict((
+            ("message", "Job queued, poll the url for its status."),
+            ("job_id", job.pk),
+            ("status", job.status),
+            ("url", self.request.build_absolute_uri(
+                reverse('job-detail', args=[job.pk])
+            ))
+        )), status=rf_status.HTTP_202_ACCEPTED)
+
+    def keyset_paginate(self, query, keys=('sample_id',), page_size=None):
+        """
+        Return the page of results following the position in ?cursor.
+
+        `query` is called with `after` (the `keys` of the last row of the
+        previous page, None for the first page) and `limit`, and must return
+        rows ordered by `keys`. Unlike `paginate` only a single page is
+        queried, so walking every page reads each row once.
+        """
+        page_size = page_size or self.paginator.page_size
+        after = None
+        if self.request.GET.get('cursor'):
+            after = decode_cursor(self.request.GET['cursor'], len(keys))
+            if after is None:
+                return Response({
+                    "has_errors": True,
+                    "message": "Invalid cursor.",
+                    "data": self.request.GET['cursor']
+                })
+
+        # Query an extra row to determine if there is a next page
+        results, query_time = timeit(query, after=after, limit=page_size + 1)
+        next_url = None
+        if len(results) > page_size:
+            results = results[:page_size]
+            next_url = replace_query_param(
+                self.request.build_absolute_uri(), 'cursor',
+                encode_cursor([results[-1][key] for key in keys])
+            )
+
+        data = format_results(self.project_fields(results),
+                              query_time=query_time)
+        data['next'] = next_url
+        data.move_to_end('results')
+        return Response(data)
+
     def paginate(self, queryset, serializer=None, page_size=None,
                  is_serialized=False, query_time=None):
         if page_size:
@@ -39,7 +170,7 @@ class CustomReadOnlyModelViewSet(mixins.RetrieveModelMixin,
         page = self.paginate_queryset(queryset)
         if page is not None:
             if is_serialized:
-                return self.get_paginated_response(page)
+                return self.get_paginated_response(self.project_fields(page))
             else:
                 serialized = serializer(page, many=True)
                 return self.get_paginated_response(serialized.data)
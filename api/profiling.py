@@ -0,0 +1,129 @@
+"""
+Per-request SQL profiling.
+
+QueryProfileMiddleware (see api/middleware.py) starts a Profile for each API
+request. Every query sent through a Django connection is timed by
+`time_query`, query_database adds the rows it read (and the approximate
+bytes, which is only measured when ?profile is given) and the JSON renderer
+adds the time spent rendering.
+
+To use:
+from api.profiling import get_profile, record_rows
+"""
+from collections import OrderedDict
+import re
+import threading
+import time
+
+_local = threading.local()
+
+FINGERPRINT_PATTERNS = [
+    # String literals, including int[] literals from IdArray
+    (re.compile(r"'(?:[^']|'')*'"), '?'),
+    (re.compile(r'\b\d+(?:\.\d+)?\b'), '?'),
+    # Collapse IN lists to a single placeholder
+    (re.compile(r'\?(?:\s*,\s*\?)+'), '?+'),
+    (re.compile(r'\s+'), ' '),
+]
+
+
+def fingerprint(sql):
+    """Return SQL with literal values replaced, to group similar queries."""
+    for pattern, replacement in FINGERPRINT_PATTERNS:
+        sql = pattern.sub(replacement, sql)
+    return sql.strip()
+
+
+class Profile(object):
+    """Queries and timings recorded during a request."""
+
+    def __init__(self, measure_bytes=False):
+        self.start_time = time.time()
+        self.measure_bytes = measure_bytes
+        self.queries = []
+        self.timings = OrderedDict()
+
+    def record_query(self, sql, duration):
+        self.queries.append({
+            'fingerprint': fingerprint(sql), 'ms': duration, 'rows': None,
+            'bytes': None
+        })
+
+    def record_rows(self, rows):
+        """Add the rows read by the most recent query."""
+        if not self.queries:
+            return
+        query = self.queries[-1]
+        query['rows'] = len(rows)
+        if self.measure_bytes:
+            query['bytes'] = sum(
+                len(str(value)) for row in rows for value in row.values()
+                if value is not None
+            )
+
+    def add_timing(self, name, duration):
+        self.timings[name] = self.timings.get(name, 0) + duration
+
+    def summary(self, top=None):
+        """Return a breakdown of the request time and the queries by cost."""
+        total = (time.time() - self.start_time) * 1000
+        sql = sum(query['ms'] for query in self.queries)
+
+        grouped = OrderedDict()
+        for query in self.queries:
+            stats = grouped.setdefault(query['fingerprint'], OrderedDict((
+                ('fingerprint', query['fingerprint']), ('count', 0),
+                ('ms', 0), ('rows', 0), ('bytes', 0)
+            )))
+            stats['count'] += 1
+            stats['ms'] += query['ms']
+            stats['rows'] += query['rows'] or 0
+            stats['bytes'] += query['bytes'] or 0
+        queries = sorted(grouped.values(), key=lambda q: q['ms'], reverse=True)
+
+        breakdown = OrderedDict((
+            ('total_ms', round(total, 2)),
+            ('sql_ms', round(sql, 2)),
+        ))
+        for name, duration in self.timings.items():
+            breakdown[f'{name}_ms'] = round(duration, 2)
+        breakdown['python_ms'] = round(
+            total - sql - sum(self.timings.values()), 2
+        )
+        breakdown['query_count'] = len(self.queries)
+        for query in queries:
+            query['ms'] = round(query['ms'], 2)
+        breakdown['queries'] = queries[:top] if top else queries
+        return breakdown
+
+
+def start_profile(measure_bytes=False):
+    _local.profile = Profile(measure_bytes=measure_bytes)
+    return _local.profile
+
+
+def get_profile():
+    """Return the Profile of the current request, or None."""
+    return getattr(_local, 'profile', None)
+
+
+def stop_profile():
+    _local.profile = None
+
+
+def time_query(execute, sql, params, many, context):
+    """Execute wrapper (see connection.execute_wrapper) timing each query."""
+    start_time = time.time()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        profile = get_profile()
+        if profile:
+            profile.record_query(sql, (time.time() - start_time) * 1000)
+
+
+def record_rows(rows):
+    """Add the rows read by the last query to the current profile."""
+    profile = get_profile()
+    if profile:
+        profile.record_rows(rows)
@@ -1,10 +1,12 @@
 """API utilities for Assembly related viewsets."""
-from api.utils import query_database
+from api.cache import cached_query
+from api.utils import IdArray, query_database, select_columns, wants_field
 import json
 
 
-def get_assembly_stats(sample_id, user_id, is_plasmids=None):
-    """Return assembly stats for a set of sample ids."""
+@cached_query('sample_id')
+def get_assembly_stats(sample_id, user_id, is_plasmids=None, fields=None):
+    """Return assembly stats (limited to `fields`) for a set of sample ids."""
     cols = [
         'sample_id', 'total_contig',  'total_contig_length',
         'min_contig_length', 'median_contig_length', 'mean_contig_length',
@@ -21,64 +23,57 @@ def get_assembly_stats(sample_id, user_id, is_plasmids=None):
     table = 'plasmid_summary' if is_plasmids else 'assembly_summary'
     sql = """SELECT {0}
              FROM {1} AS a
-             LEFT JOIN sample_sample as s
-             ON s.id=a.sample_id
-             WHERE sample_id IN ({2}) USER_PERMISSION
+             WHERE sample_id IN %s VISIBLE(sample_id)
              ORDER BY sample_id;""".format(
-        ','.join(cols),
-        table,
-        ','.join([str(i) for i in sample_id])
+        ','.join(select_columns(cols, fields)),
+        table
     )
 
-    return query_database(sql)
+    return query_database(sql, values=[IdArray(sample_id)], user_id=user_id)
 
 
 def get_assembly_contigs(sample_id, user_id, is_plasmids=False, contig=None,
-                         exclude_sequence=False):
-    """Return assembled contigs for a set of sample ids."""
-    # Get contigs
-    table = 'plasmid_sequence' if is_plasmids else 'assembly_sequence'
-    sql = """SELECT c.sample_id, c.fasta
-             FROM {0} AS c
-             LEFT JOIN sample_sample as s
-             ON s.id=c.sample_id
-             WHERE c.sample_id IN ({1}) USER_PERMISSION
-             ORDER BY sample_id ASC;""".format(
-        table,
-        ','.join([str(i) for i in sample_id])
-    )
+                         exclude_sequence=False, fields=None):
+    """
+    Return assembled contigs for a set of sample ids.
+
+    The sequences are not queried if excluded or not in `fields`.
+    """
+    exclude_sequence = exclude_sequence or not wants_field('sequence', fields)
+    values = [IdArray(sample_id)]
     results = []
     contigs = {}
-    for row in query_database(sql):
-        contigs[row['sample_id']] = row['fasta']
+    if not exclude_sequence:
+        # Get contigs
+        table = 'plasmid_sequence' if is_plasmids else 'assembly_sequence'
+        sql = """SELECT c.sample_id, c.fasta
+                 FROM {0} AS c
+                 WHERE c.sample_id IN %s VISIBLE(c.sample_id)
+                 ORDER BY sample_id ASC;""".format(table)
+        for row in query_database(sql, values=values, user_id=user_id):
+            contigs[row['sample_id']] = row['fasta']
 
     # Get contig names
     names = {}
     table = 'plasmid_contig' if is_plasmids else 'assembly_contig'
     sql = """SELECT sample_id, spades, staphopia
              FROM {0} AS c
-             LEFT JOIN sample_sample as s
-             ON s.id=c.sample_id
-             WHERE c.sample_id IN ({1}) USER_PERMISSION
-             ORDER BY sample_id ASC, c.id ASC;""".format(
-        table,
-        ','.join([str(i) for i in sample_id])
-    )
-    for row in query_database(sql):
+             WHERE c.sample_id IN %s VISIBLE(c.sample_id)
+             ORDER BY sample_id ASC, c.id ASC;""".format(table)
+    for row in query_database(sql, values=values, user_id=user_id):
         # Spades: NODE_37_length_341_cov_381.897727
         cols = row['spades'].split("_")
         sequence = None
         if contig and int(cols[1]) != contig:
             continue
 
-        if is_plasmids:
+        if exclude_sequence:
+            sequence = ''
+        elif is_plasmids:
             sequence = contigs[row['sample_id']][row['staphopia']]
         else:
             sequence = contigs[row['sample_id']][cols[1]]
 
-        if exclude_sequence:
-            sequence = ''
-
         results.append({
             'sample_id': row['sample_id'],
             'contig': cols[1],
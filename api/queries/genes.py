@@ -1,7 +1,7 @@
 """API utilities for gene related viewsets."""
 from collections import OrderedDict
 
-from api.utils import query_database
+from api.utils import IdArray, query_database, wants_field
 
 COLUMNS = {
     'gene_features': [
@@ -18,25 +18,38 @@ COLUMNS = {
 
 
 def get_genes_by_sample(sample_id, user_id, product_id=None,
-                        exclude_sequence=False):
-    """Return genes associated with a sample."""
+                        exclude_sequence=False, fields=None):
+    """
+    Return genes associated with a sample.
+
+    The gene, protein and RNA sequences are only read if a field derived
+    from them (dna, aa, length) is in `fields`.
+    """
     sql = None
     inference = {}
     sql = "SELECT * FROM annotation_inference"
     for row in query_database(sql):
         inference[row['id']] = row
 
-    sql = """SELECT sample_id, info, gene, protein, rna
+    is_dna = not exclude_sequence and wants_field('dna', fields)
+    is_aa = not exclude_sequence and wants_field('aa', fields)
+    is_length = wants_field('length', fields)
+    is_header = not exclude_sequence and wants_field('header', fields)
+    cols = ['sample_id', 'info']
+    if is_dna or is_length:
+        cols.extend(['gene', 'rna'])
+    if is_aa:
+        cols.append('protein')
+
+    sql = """SELECT {0}
              FROM annotation_annotation as a
-             LEFT JOIN sample_sample as s
-             ON a.sample_id=s.id
-             WHERE a.sample_id IN ({0}) USER_PERMISSION;""".format(
-        ','.join([str(i) for i in sample_id]),
-        user_id
+             WHERE a.sample_id IN %s VISIBLE(a.sample_id);""".format(
+        ','.join(cols)
     )
 
     results = []
-    for row in query_database(sql):
+    for row in query_database(sql, values=[IdArray(sample_id)],
+                              user_id=user_id):
         for info in row['info']:
             new = OrderedDict()
             new['sample_id'] = row['sample_id']
@@ -54,17 +67,21 @@ def get_genes_by_sample(sample_id, user_id, product_id=None,
                     new[k] = v
 
             if new['type'] == 'RNA':
-                new['length'] = len(row['rna'][info['locus_tag']])
-                if not exclude_sequence:
+                if is_length:
+                    new['length'] = len(row['rna'][info['locus_tag']])
+                if is_dna:
                     new['dna'] = row['rna'][info['locus_tag']]
+                if is_aa:
                     new['aa'] = ''
             else:
-                new['length'] = len(row['gene'][info['locus_tag']])
-                if not exclude_sequence:
+                if is_length:
+                    new['length'] = len(row['gene'][info['locus_tag']])
+                if is_dna:
                     new['dna'] = row['gene'][info['locus_tag']]
+                if is_aa:
                     new['aa'] = row['protein'][info['locus_tag']]
 
-            if not exclude_sequence:
+            if is_header:
                 new['header'] = (
                     "{0}|{1}|{2}|{3} [product={4}] [name={5}] [note={6}]"
                 ).format(
@@ -89,23 +106,24 @@ def get_genes_by_sample(sample_id, user_id, product_id=None,
 def get_gene_products(product_id, is_term=False):
     """Return a list of gene products."""
     sql = None
+    values = None
     if is_term:
         sql = """SELECT id as product_id, inference, product, name, note
                  FROM annotation_inference
-                 WHERE product ILIKE '%{0}%' OR name ILIKE '%{0}%'
-                       OR note ILIKE '%{0}%' OR inference ILIKE '%{0}%'
-                 ORDER BY id;""".format(product_id)
+                 WHERE product ILIKE %(term)s OR name ILIKE %(term)s
+                       OR note ILIKE %(term)s OR inference ILIKE %(term)s
+                 ORDER BY id;"""
+        values = {'term': f'%{product_id}%'}
     elif not product_id:
         sql = """SELECT id as product_id, inference, product, name, note
                  FROM annotation_inference;"""
     else:
         sql = """SELECT id as product_id, inference, product, name, note
                  FROM annotation_inference
-                 WHERE id IN ({0});""".format(
-            ','.join([str(i) for i in product_id]),
-        )
+                 WHERE id IN %s;"""
+        values = [IdArray(product_id)]
 
-    return query_database(sql)
+    return query_database(sql, values=values)
 
 
 def get_clusters_by_samples(sample_id, user_id):
@@ -119,25 +137,20 @@ def get_clusters_by_samples(sample_id, user_id):
              ON c.id = g.cluster_id
              LEFT JOIN gene_referencemapping as a
              ON c.id = a.cluster_id
-             LEFT JOIN sample_sample as s
-             ON g.sample_id=s.id
-             WHERE sample_id IN ({1}) USER_PERMISSION
-                                      AND g."is_tRNA"=FALSE;""".format(
-        ','.join(columns),
-        ','.join([str(i) for i in sample_id]),
-        user_id
+             WHERE g.sample_id IN %s VISIBLE(g.sample_id)
+                   AND g."is_tRNA"=FALSE;""".format(
+        ','.join(columns)
     )
 
-    return query_database(sql)
+    return query_database(sql, values=[IdArray(sample_id)], user_id=user_id)
 
 
 def get_cluster_counts_by_samples(ids):
     """Return cluster counts associated with a set of samples."""
-    sql = 'SELECT * FROM cluster_counts(ARRAY[{0}]);'.format(
-        ','.join([str(i) for i in ids])
-    )
+    # ARRAY(subquery) turns the IdArray back into an int[] argument
+    sql = 'SELECT * FROM cluster_counts(ARRAY%s);'
 
-    return query_database(sql)
+    return query_database(sql, values=[IdArray(ids)])
 
 
 def get_gene_feature(feature_id):
@@ -1,7 +1,9 @@
 """API utilities for info related queries."""
+from api.cache import cached_query
 from api.utils import query_database
 
 
+@cached_query()
 def get_sequencing_stats_by_year(is_original=False):
     """Return sequencing stats by year sample was first public."""
     original = 'TRUE' if is_original else 'FALSE'
@@ -9,6 +11,7 @@ def get_sequencing_stats_by_year(is_original=False):
     return query_database(sql)
 
 
+@cached_query(coalesce=True)
 def get_cgmlst_patterns():
     """Return cgmlst patterns and counts of public samples."""
     loci = []
@@ -17,9 +20,7 @@ def get_cgmlst_patterns():
 
     sql = """SELECT mentalist
              FROM cgmlst_cgmlst AS m
-             LEFT JOIN sample_basic AS s
-             ON m.sample_id=s.sample_id
-             WHERE s.sample_id > 0 USER_PERMISSION
+             WHERE m.sample_id > 0 VISIBLE(m.sample_id)
              ORDER BY m.sample_id ASC;"""
 
     patterns = {}
@@ -49,6 +50,7 @@ def get_cgmlst_patterns():
     return results
 
 
+@cached_query()
 def get_assembly_stats_by_year(is_scaffolds=False, is_plasmids=False):
     """Return metadata associated with a sample."""
     scaffold = 'TRUE' if is_scaffolds else 'FALSE'
@@ -59,6 +61,7 @@ def get_assembly_stats_by_year(is_scaffolds=False, is_plasmids=False):
     return query_database(sql)
 
 
+@cached_query()
 def get_publication_links():
     """Return how publication links wer made."""
     sql = """SELECT s.name, e.sra_to_pubmed, e.publication_id
@@ -95,6 +98,7 @@ def get_publication_links():
     return [results]
 
 
+@cached_query(coalesce=True)
 def get_submission_by_year(all_submissions=False):
     """Return the published submissions by year."""
     sql = None
@@ -152,6 +156,7 @@ def get_submission_by_year(all_submissions=False):
     return results
 
 
+@cached_query(coalesce=True)
 def get_rank_by_year(is_original=False):
     """Return the published submissions by year."""
     results = []
@@ -204,21 +209,20 @@ def get_rank_by_year(is_original=False):
     return results
 
 
+@cached_query(coalesce=True)
 def get_st_by_year():
     """Return the published submissions by year."""
     results = []
     sql = """SELECT metadata->'first_public' AS first_public, t.st,
                     predicted_novel, ariba, mentalist, blast, is_paired
              FROM sample_metadata AS m
-             LEFT JOIN sample_basic AS s
-             ON m.sample_id=s.sample_id
              LEFT JOIN mlst_mlst AS t
              ON m.sample_id=t.sample_id
              LEFT JOIN sequence_summary AS q
              ON m.sample_id=q.sample_id
              LEFT JOIN sequence_stage AS w
              ON w.id=q.stage_id
-             WHERE w.name='cleanup' USER_PERMISSION
+             WHERE w.name='cleanup' VISIBLE(m.sample_id)
              ORDER BY first_public;"""
 
     years = {}
@@ -408,3 +412,19 @@ def get_st_by_year():
         })
 
     return results
+
+
+@cached_query(coalesce=True)
+def get_top_sequence_types():
+    """Return the number of public samples of each sequence type."""
+    sql = """SELECT sequence_type as st, count
+             FROM top_sequence_types()"""
+    return query_database(sql)
+
+
+@cached_query(coalesce=True)
+def get_top_sequencing_centers(total):
+    """Return the sequencing centers with the most public samples."""
+    sql = """SELECT sequencing_center, count
+             FROM top_sequencing_centers({0})""".format(total)
+    return query_database(sql)
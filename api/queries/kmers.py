@@ -4,9 +4,8 @@
 def get_kmer_by_string(kmer, samples=None):
     """Query kmer against Elasticsearch cluster."""
     import requests
-    from kmer.partitions import PARTITIONS
-    child = kmer[-7:]
-    table = 'kmer_{0}'.format(PARTITIONS[child].lower())
+    from kmer.partitions import get_partition
+    table = 'kmer_{0}'.format(get_partition(kmer).lower())
     url = 'http://localhost:9200/{0}/kmer/{1}/'.format(table, kmer)
     r = requests.get(url)
     json = r.json()
@@ -60,14 +59,13 @@ def get_kmer_by_partition(partition, kmers, samples):
 def get_kmer_by_sequence(sequence, samples):
     """Query kmer against Elasticsearch cluster."""
     import requests
-    from kmer.partitions import PARTITIONS
+    from kmer.partitions import get_partition
     complement = {'A': 'T', 'T': 'A', 'G': 'C', 'C': 'G'}
     k = 31
     kmers = [sequence[i:i + k] for i in range(0, len(sequence)+1-k)]
     tables = {}
     for kmer in kmers:
-        child = kmer[-7:]
-        table = 'kmer_{0}'.format(PARTITIONS[child].lower())
+        table = 'kmer_{0}'.format(get_partition(kmer).lower())
         if table not in tables:
             tables[table] = []
         tables[table].append(kmer)
@@ -76,8 +74,7 @@ def get_kmer_by_sequence(sequence, samples):
         rc_kmer = ''.join(
             [complement[base] for base in kmer][::-1]
         )
-        child = rc_kmer[-7:]
-        table = 'kmer_{0}'.format(PARTITIONS[child].lower())
+        table = 'kmer_{0}'.format(get_partition(rc_kmer).lower())
         if table not in tables:
             tables[table] = []
         tables[table].append(rc_kmer)
@@ -1,5 +1,5 @@
 """API utilities for publication related viewsets."""
-from api.utils import query_database
+from api.utils import IdArray, query_database
 
 
 def get_pmids(sample_id, user_id):
@@ -10,13 +10,12 @@ def get_pmids(sample_id, user_id):
              ON p.sample_id=s.sample_id
              LEFT JOIN publication_publication as q
              ON p.publication_id=q.id
-             WHERE s.sample_id IN ({0}) USER_PERMISSION
-             ORDER BY s.sample_id ASC;""".format(
-        ','.join([str(i) for i in sample_id])
-    )
+             WHERE s.sample_id IN %s USER_PERMISSION
+             ORDER BY s.sample_id ASC;"""
 
     results = []
-    for row in query_database(sql):
+    for row in query_database(sql, values=[IdArray(sample_id)],
+                              user_id=user_id):
         if row['pmid']:
             results.append({
                 'sample_id': row['sample_id'],
@@ -31,13 +30,11 @@ def get_publications(pmid):
     if pmid:
         sql = """SELECT pmid, authors, title, abstract, reference_ids, keywords
                  FROM publication_publication
-                 WHERE pmid IN ({0})
-                 ORDER BY pmid ASC;""".format(
-            ','.join([str(i) for i in pmid])
-        )
+                 WHERE pmid IN %s
+                 ORDER BY pmid ASC;"""
     else:
         sql = """SELECT pmid, authors, title, abstract, reference_ids, keywords
                  FROM publication_publication
                  ORDER BY pmid ASC;"""
 
-    return query_database(sql)
+    return query_database(sql, values=[IdArray(pmid)] if pmid else None)
@@ -1,8 +1,10 @@
 """API utilities for resistance related viewsets."""
 from collections import OrderedDict
-from api.utils import query_database
+from api.cache import cached_query
+from api.utils import IdArray, query_database
 
 
+@cached_query('sample_id')
 def get_ariba_resistance(sample_id, user_id, mec_only=False):
     """Return resistance results associated with a sample."""
     cluster = {}
@@ -12,15 +14,12 @@ def get_ariba_resistance(sample_id, user_id, mec_only=False):
 
     sql = """SELECT r.sample_id, results
              FROM resistance_ariba AS r
-             LEFT JOIN sample_basic AS s
-             ON r.sample_id=s.sample_id
-             WHERE r.sample_id IN ({0}) USER_PERMISSION
-             ORDER BY r.sample_id ASC;""".format(
-        ','.join([str(i) for i in sample_id])
-    )
+             WHERE r.sample_id IN %s VISIBLE(r.sample_id)
+             ORDER BY r.sample_id ASC;"""
 
     results = []
-    for row in query_database(sql):
+    for row in query_database(sql, values=[IdArray(sample_id)],
+                              user_id=user_id):
         if row['results']:
             for i in row['results']:
                 result = {}
@@ -43,6 +42,7 @@ def get_ariba_resistance(sample_id, user_id, mec_only=False):
     return results
 
 
+@cached_query('sample_id')
 def get_ariba_resistance_report(sample_id, user_id, by_cluster=False,
                                 include_all=False, mec_only=False):
     """Return resistance report based on class associated with a sample."""
@@ -87,15 +87,12 @@ def get_ariba_resistance_report(sample_id, user_id, by_cluster=False,
 
     sql = """SELECT r.sample_id, summary
              FROM resistance_ariba AS r
-             LEFT JOIN sample_basic AS s
-             ON r.sample_id=s.sample_id
-             WHERE r.sample_id IN ({0}) USER_PERMISSION
-             ORDER BY r.sample_id ASC;""".format(
-        ','.join([str(i) for i in sample_id])
-    )
+             WHERE r.sample_id IN %s VISIBLE(r.sample_id)
+             ORDER BY r.sample_id ASC;"""
 
     results = []
-    for row in query_database(sql):
+    for row in query_database(sql, values=[IdArray(sample_id)],
+                              user_id=user_id):
         sample = OrderedDict()
         sample['sample_id'] = row['sample_id']
         for c in resistance_class:
@@ -131,19 +128,17 @@ def get_ariba_resistance_report(sample_id, user_id, by_cluster=False,
     return results
 
 
+@cached_query('sample_id')
 def get_ariba_resistance_summary(sample_id, user_id, mec_only=False):
     """Return resistance summary based on class associated with a sample."""
     sql = """SELECT r.sample_id, summary
              FROM resistance_ariba AS r
-             LEFT JOIN sample_basic AS s
-             ON r.sample_id=s.sample_id
-             WHERE r.sample_id IN ({0}) USER_PERMISSION
-             ORDER BY r.sample_id ASC;""".format(
-        ','.join([str(i) for i in sample_id])
-    )
+             WHERE r.sample_id IN %s VISIBLE(r.sample_id)
+             ORDER BY r.sample_id ASC;"""
 
     results = []
-    for row in query_database(sql):
+    for row in query_database(sql, values=[IdArray(sample_id)],
+                              user_id=user_id):
         for r in row['summary']:
             sample = OrderedDict()
             sample['sample_id'] = row['sample_id']
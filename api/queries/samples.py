@@ -1,21 +1,30 @@
 """API utilities for sample related viewsets."""
-from api.utils import query_database
+from api.utils import IdArray, keyset_sql, query_database, stream_query
 from collections import OrderedDict
 
 
 def get_samples(user_id, sample_id=None, sample_ids=None, user_only=False,
-                st=False, name=False):
-    """Return samples."""
+                st=False, name=False, stream=False, after=None, limit=None):
+    """
+    Return samples, or a generator of samples if stream is True.
+
+    When listing samples, `after` and `limit` select a keyset page ordered by
+    sample_id (see keyset_sql).
+    """
     sql = None
+    values = None
     st_sql = ""
     if st:
         st_sql = f'AND st={st}'
 
+    after_sql, order_sql = keyset_sql(['sample_id'], after=after, limit=limit)
     if user_only:
+        if not after and not limit:
+            order_sql = 'ORDER BY sample_id DESC'
         sql = """SELECT sample_id, name, is_public, is_published, st, rank
                  FROM sample_basic
-                 WHERE user_id={0} {1}
-                 ORDER BY sample_id DESC""".format(user_id, st_sql)
+                 WHERE user_id={0} {1} {2}
+                 {3}""".format(user_id, st_sql, after_sql, order_sql)
     elif name:
         sql = """SELECT sample_id, name, is_public, is_published, st, rank
                  FROM sample_basic
@@ -27,25 +36,32 @@ def get_samples(user_id, sample_id=None, sample_ids=None, user_only=False,
     elif sample_ids:
         sql = """SELECT sample_id, name, is_public, is_published, st, rank
                  FROM sample_basic
-                 WHERE sample_id IN ({0}) USER_PERMISSION
-                 ORDER BY sample_id""".format(
-            ','.join([str(i) for i in sample_ids])
-        )
+                 WHERE sample_id IN %s USER_PERMISSION
+                 ORDER BY sample_id"""
+        values = [IdArray(sample_ids)]
     else:
         sql = """SELECT sample_id, name, is_public, is_published, st, rank
                  FROM sample_basic
-                 WHERE sample_id > 0 {1} USER_PERMISSION""".format(
-            user_id, st_sql
+                 WHERE sample_id > 0 {1} {2} USER_PERMISSION
+                 {3}""".format(
+            user_id, st_sql, after_sql, order_sql
         )
 
-    return query_database(sql)
+    if stream:
+        return stream_query(sql, values=values, user_id=user_id)
+    return query_database(sql, values=values, user_id=user_id)
+
 
+def get_public_samples(is_published=False, include_location=False, limit=None,
+                       after=None):
+    """
+    Return sample info associated with a tag.
 
-def get_public_samples(is_published=False, include_location=False, limit=None):
-    """Return sample info associated with a tag."""
-    limit_sql = ""
-    if limit:
-        limit_sql = f'LIMIT {limit}'
+    Samples are ordered by sample_id, `after` and `limit` select a keyset page
+    (see keyset_sql).
+    """
+    after_sql, order_sql = keyset_sql(['p.sample_id'], after=after,
+                                      limit=limit)
 
     table = 'public_ena_samples'
     if is_published:
@@ -58,36 +74,51 @@ def get_public_samples(is_published=False, include_location=False, limit=None):
                         metadata->>'country' AS country
                  FROM {0} AS p
                  LEFT JOIN sample_metadata AS m
-                 ON p.sample_id=m.sample_id {1}""".format(table, limit_sql)
+                 ON p.sample_id=m.sample_id
+                 WHERE p.sample_id > 0 {1}
+                 {2}""".format(table, after_sql, order_sql)
         return query_database(sql)
     else:
         sql = """SELECT sample_id, name, is_public, is_published, st, rank
-                 FROM {0} {1};""".format(table, limit_sql)
+                 FROM {0} AS p
+                 WHERE p.sample_id > 0 {1}
+                 {2};""".format(table, after_sql, order_sql)
         return query_database(sql)
 
 
-def get_sample_metadata(sample_id, user_id):
-    """Return metadata associated with a sample."""
-    fields = []
+def get_sample_metadata(sample_id, user_id, fields=None):
+    """
+    Return metadata associated with a sample.
+
+    With `fields` only those keys are extracted from the metadata.
+    """
+    metadata_fields = []
     for row in query_database("SELECT field FROM sample_metadatafields;"):
-        fields.append(row['field'])
+        if fields is None or row['field'] in fields:
+            metadata_fields.append(row['field'])
+
+    metadata_sql = 'metadata'
+    values = [IdArray(sample_id)]
+    if fields is not None:
+        metadata_sql = """(SELECT jsonb_object_agg(key, value)
+                           FROM jsonb_each(metadata)
+                           WHERE key = ANY(%s)) AS metadata"""
+        values.insert(0, metadata_fields)
 
-    sql = """SELECT s.sample_id, metadata
+    sql = """SELECT s.sample_id, {0}
              FROM sample_basic as s
              LEFT JOIN sample_metadata as m
              ON s.sample_id = m.sample_id
-             WHERE s.sample_id IN ({0}) USER_PERMISSION
-             ORDER BY s.sample_id""".format(
-        ','.join([str(i) for i in sample_id])
-    )
+             WHERE s.sample_id IN %s USER_PERMISSION
+             ORDER BY s.sample_id""".format(metadata_sql)
 
     results = []
-    for row in query_database(sql):
+    for row in query_database(sql, values=values, user_id=user_id):
         result = OrderedDict()
         if 'metadata' in row:
             if row['metadata']:
                 result['sample_id'] = row['sample_id']
-                for field in sorted(fields):
+                for field in sorted(metadata_fields):
                     if field in row['metadata']:
                         result[field] = row['metadata'][field]
                     else:
@@ -98,6 +129,6 @@ def get_sample_metadata(sample_id, user_id):
         return results
 
     result = OrderedDict()
-    for field in sorted(fields):
+    for field in sorted(metadata_fields):
         result[field] = ''
     return [result]
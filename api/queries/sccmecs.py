@@ -1,52 +1,69 @@
 """API utilities for XYZ related viewsets."""
 from collections import OrderedDict
 
-from sccmec.tools import predict_type_by_primers, predict_subtype_by_primers
+from api.cache import cached_query
+from api.utils import IdArray, column_name, query_database, select_columns
 
-from api.utils import query_database
+HIT_COLUMNS = [
+    'p.sample_id', 'p.contig', 'b.title', 'p.hamming_distance', 'p.bitscore',
+    'p.evalue', 'b.length', 'p.identity', 'p.mismatch', 'p.gaps',
+    'p.query_from', 'p.query_to', 'p.hit_from', 'p.hit_to', 'p.align_len',
+    'p.qseq', 'p.hseq'
+]
 
 
+def get_hit_columns(fields=None):
+    """Return the SELECT expressions and names of the hit columns in fields."""
+    if fields is not None and {'target', 'description'} & set(fields):
+        # Both are split from the title
+        fields = set(fields) | {'title'}
+    columns = select_columns(HIT_COLUMNS, fields)
+    return [columns, [column_name(col) for col in columns]]
+
+
+@cached_query('sample_id')
 def get_sccmec_primers_by_sample(sample_id, user_id, is_subtypes=False,
                                  exact_hits=False, predict=False,
-                                 hamming_distance=False):
+                                 hamming_distance=False, fields=None):
     """Return SCCmec primer hits asscociated with a sample_id."""
-    sql = """SELECT p.sample_id, p.contig, b.title, p.hamming_distance,
-                    p.bitscore, p.evalue, p.identity, b.length, p.mismatch,
-                    p.gaps, p.query_from, p.query_to, p.hit_from, p.hit_to,
-                    p.align_len, p.qseq, p.hseq
+    if predict or hamming_distance:
+        # Predictions need every column of the hits
+        fields = None
+    columns, cols = get_hit_columns(fields)
+    sql = """SELECT {2}
              FROM {0} AS p
              LEFT JOIN staphopia_blastquery AS b
              ON p.query_id=b.id
-             LEFT JOIN sample_basic AS s
-             ON p.sample_id=s.sample_id
-             WHERE p.sample_id IN ({1}) USER_PERMISSION
-                   AND p.hamming_distance{2}0
+             WHERE p.sample_id IN %s VISIBLE(p.sample_id)
+                   AND p.hamming_distance{1}0
              ORDER BY p.sample_id;""" .format(
         'sccmec_subtypes' if is_subtypes else 'sccmec_primers',
-        ','.join([str(i) for i in sample_id]),
-        '=' if exact_hits and not predict else '>='
+        '=' if exact_hits and not predict else '>=',
+        ','.join(columns)
     )
+    values = [IdArray(sample_id)]
 
     if predict or hamming_distance:
+        # sccmec.tools pulls in numpy and the ingest models, only load them
+        # for predictions instead of in every API worker
+        from sccmec.tools import (
+            predict_type_by_primers, predict_subtype_by_primers
+        )
         if is_subtypes:
             return predict_subtype_by_primers(
                 sample_id,
-                query_database(sql),
+                query_database(sql, values=values, user_id=user_id),
                 hamming_distance=hamming_distance
             )
         else:
             return predict_type_by_primers(
                 sample_id,
-                query_database(sql),
+                query_database(sql, values=values, user_id=user_id),
                 hamming_distance=hamming_distance
             )
     else:
-        cols = ['sample_id', 'contig', 'title', 'hamming_distance', 'bitscore',
-                'evalue', 'length', 'identity', 'mismatch', 'gaps',
-                'query_from', 'query_to', 'hit_from', 'hit_to', 'align_len',
-                'qseq', 'hseq']
         results = []
-        for row in query_database(sql):
+        for row in query_database(sql, values=values, user_id=user_id):
             result = OrderedDict()
             for col in cols:
                 if col == 'title':
@@ -62,28 +79,20 @@ def get_sccmec_primers_by_sample(sample_id, user_id, is_subtypes=False,
         return results
 
 
-def get_sccmec_proteins_by_sample(sample_id, user_id):
+@cached_query('sample_id')
+def get_sccmec_proteins_by_sample(sample_id, user_id, fields=None):
     """Return SCCmec protein hits asscociated with a sample_id."""
-    sql = """SELECT p.sample_id, p.contig, b.title, p.hamming_distance,
-                    p.bitscore, p.evalue, b.length, p.identity,
-                    p.mismatch, p.gaps, p.query_from, p.query_to,
-                    p.hit_from, p.hit_to, p.align_len, p.qseq, p.hseq
+    columns, cols = get_hit_columns(fields)
+    sql = """SELECT {0}
              FROM sccmec_proteins AS p
              LEFT JOIN staphopia_blastquery AS b
              ON p.query_id=b.id
-             LEFT JOIN sample_basic AS s
-             ON p.sample_id=s.sample_id
-             WHERE p.sample_id IN ({0}) USER_PERMISSION
-             ORDER BY p.sample_id;""" .format(
-        ','.join([str(i) for i in sample_id]),
-        user_id,
-    )
+             WHERE p.sample_id IN %s VISIBLE(p.sample_id)
+             ORDER BY p.sample_id;""".format(','.join(columns))
 
-    cols = ['sample_id', 'contig', 'title', 'hamming_distance', 'bitscore',
-            'evalue', 'length', 'identity', 'mismatch', 'gaps', 'query_from',
-            'query_to', 'hit_from', 'hit_to', 'align_len', 'qseq', 'hseq']
     results = []
-    for row in query_database(sql):
+    for row in query_database(sql, values=[IdArray(sample_id)],
+                              user_id=user_id):
         result = OrderedDict()
         for col in cols:
             if col == 'title':
@@ -96,25 +105,28 @@ def get_sccmec_proteins_by_sample(sample_id, user_id):
     return results
 
 
-def get_sccmec_coverage_by_sample(sample_id, user_id):
+@cached_query('sample_id')
+def get_sccmec_coverage_by_sample(sample_id, user_id, fields=None):
     """Return SCCmec coverages asscociated with a sample_id."""
-    sql = """SELECT cov.sample_id, cas.name as cassette, cov.total,
-                    cov.minimum, cov.mean, cov.median, cov.maximum,
-                    cov.meca_total, cov.meca_minimum, cov.meca_mean,
-                    cov.meca_median, cov.meca_maximum
+    cols = [
+        'cov.sample_id', 'cas.name AS cassette', 'cov.total', 'cov.minimum',
+        'cov.mean', 'cov.median', 'cov.maximum', 'cov.meca_total',
+        'cov.meca_minimum', 'cov.meca_mean', 'cov.meca_median',
+        'cov.meca_maximum'
+    ]
+    sql = """SELECT {0}
              FROM sccmec_coverage AS cov
              LEFT JOIN sccmec_cassette AS cas
              ON cov.cassette_id=cas.id
-             LEFT JOIN sample_basic AS s
-             ON cov.sample_id=s.sample_id
-             WHERE cov.sample_id IN ({0}) USER_PERMISSION
-             ORDER BY cov.sample_id ASC, cassette ASC;""".format(
-        ','.join([str(i) for i in sample_id]),
-        user_id
+             WHERE cov.sample_id IN %s VISIBLE(cov.sample_id)
+             ORDER BY cov.sample_id ASC, cas.name ASC;""".format(
+        ','.join(select_columns(cols, fields,
+                                required=['sample_id', 'cassette']))
     )
 
     results = []
-    for row in query_database(sql):
+    for row in query_database(sql, values=[IdArray(sample_id)],
+                              user_id=user_id):
         if row['cassette'] not in ['IIb', 'IVd']:
             results.append(row)
 
@@ -1,7 +1,8 @@
 """API utilities for MLST related viewsets."""
 from collections import OrderedDict
 import json
-from api.utils import query_database
+from api.cache import cached_query
+from api.utils import IdArray, query_database
 
 
 def get_unique_st_samples():
@@ -9,33 +10,28 @@ def get_unique_st_samples():
     return query_database('SELECT * FROM unique_mlst_samples;')
 
 
+@cached_query('sample_id')
 def get_sequence_type(sample_id, user):
     """Return MLST loci results associated with a sample."""
     sql = """SELECT sample_id, st, ariba, mentalist, blast
              FROM mlst_mlst AS m
-             LEFT JOIN sample_sample AS s
-             ON m.sample_id=s.id
-             WHERE m.sample_id IN ({0}) USER_PERMISSION
-             ORDER BY m.sample_id ASC;""".format(
-        ','.join([str(i) for i in sample_id])
-    )
+             WHERE m.sample_id IN %s VISIBLE(m.sample_id)
+             ORDER BY m.sample_id ASC;"""
 
-    return query_database(sql)
+    return query_database(sql, values=[IdArray(sample_id)], user_id=user)
 
 
+@cached_query('sample_id')
 def get_mlst_blast_results(sample_id, user):
     """Return MLST loci results associated with a sample."""
     sql = """SELECT sample_id, blast
              FROM mlst_report AS m
-             LEFT JOIN sample_sample AS s
-             ON m.sample_id=s.id
-             WHERE m.sample_id IN ({0}) USER_PERMISSION
-             ORDER BY m.sample_id ASC;""".format(
-        ','.join([str(i) for i in sample_id])
-    )
+             WHERE m.sample_id IN %s VISIBLE(m.sample_id)
+             ORDER BY m.sample_id ASC;"""
 
     results = []
-    for row in query_database(sql):
+    for row in query_database(sql, values=[IdArray(sample_id)],
+                              user_id=user):
         result = OrderedDict()
         result['sample_id'] = row['sample_id']
         unassigned = 0
@@ -49,21 +45,19 @@ def get_mlst_blast_results(sample_id, user):
     return results
 
 
+@cached_query('sample_id')
 def get_mlst_allele_matches(sample_id, user):
     """Return MLST loci results associated with a sample."""
     sql = """SELECT sample_id, st, d.blast, d.ariba, d.mentalist
              FROM mlst_mlst AS m
-             LEFT JOIN sample_sample AS s
-             ON m.sample_id=s.id
              LEFT JOIN mlst_support AS d
              ON m.support_id=d.id
-             WHERE m.sample_id IN ({0}) USER_PERMISSION
-             ORDER BY m.sample_id ASC;""".format(
-        ','.join([str(i) for i in sample_id])
-    )
+             WHERE m.sample_id IN %s VISIBLE(m.sample_id)
+             ORDER BY m.sample_id ASC;"""
 
     results = []
-    for row in query_database(sql):
+    for row in query_database(sql, values=[IdArray(sample_id)],
+                              user_id=user):
         results.append({
             'sample_id': row['sample_id'],
             'st': row['st'],
@@ -72,6 +66,7 @@ def get_mlst_allele_matches(sample_id, user):
     return results
 
 
+@cached_query('sample_id')
 def get_cgmlst(sample_id, user):
     """Return cgMLST loci results associated with a sample."""
     sql = "SELECT id, name FROM cgmlst_loci;"
@@ -81,14 +76,11 @@ def get_cgmlst(sample_id, user):
 
     sql = """SELECT sample_id, mentalist
              FROM cgmlst_cgmlst AS m
-             LEFT JOIN sample_sample AS s
-             ON m.sample_id=s.id
-             WHERE m.sample_id IN ({0}) USER_PERMISSION
-             ORDER BY m.sample_id ASC;""".format(
-        ','.join([str(i) for i in sample_id])
-    )
+             WHERE m.sample_id IN %s VISIBLE(m.sample_id)
+             ORDER BY m.sample_id ASC;"""
     results = []
-    for row in query_database(sql):
+    for row in query_database(sql, values=[IdArray(sample_id)],
+                              user_id=user):
         cgmlst = OrderedDict()
         cgmlst['sample_id'] = row['sample_id']
         for k in sorted(row['mentalist'], key=lambda x: int(x)):
@@ -1,9 +1,12 @@
 """API utilities for Sequencing related viewsets."""
-from api.utils import query_database
+from api.cache import cached_query
+from api.utils import IdArray, query_database, select_columns
 
 
+@cached_query('sample_id')
 def get_sequencing_stats(sample_id, user_id, stage=None,
-                         qual_per_base=False, read_lengths=False):
+                         qual_per_base=False, read_lengths=False,
+                         fields=None):
     """Return sequencing stats for a list of sampel ids."""
     cols = ['sample_id', 'p.name', 'rank', 'total_bp', 'coverage',
             'read_total', 'read_min', 'read_mean', 'read_std', 'read_median',
@@ -16,19 +19,18 @@ def get_sequencing_stats(sample_id, user_id, stage=None,
         cols.append('read_lengths')
 
     stage_sql = ''
+    values = [IdArray(sample_id)]
     if stage:
-        stage_sql = f"AND p.name='{stage}'"
+        stage_sql = 'AND p.name=%s'
+        values.append(stage)
 
     sql = """SELECT {0}
              FROM sequence_summary AS a
-             LEFT JOIN sample_sample AS s
-             ON a.sample_id=s.id
              LEFT JOIN sequence_stage as p
              ON a.stage_id=p.id
-             WHERE sample_id IN ({1}) {2} USER_PERMISSION
+             WHERE sample_id IN %s {1} VISIBLE(a.sample_id)
              ORDER BY sample_id;""".format(
-        ','.join(cols),
-        ','.join([str(i) for i in sample_id]),
+        ','.join(select_columns(cols, fields)),
         stage_sql
     )
-    return query_database(sql)
+    return query_database(sql, values=values, user_id=user_id)
@@ -1,5 +1,5 @@
 """API utilities for sample related viewsets."""
-from api.utils import query_database
+from api.utils import IdArray, query_database
 
 
 def get_tag(tag_id):
@@ -33,16 +33,13 @@ def get_samples_by_tag(tag, is_id=True):
 
 def get_tags_by_sample(sample_id, user_id):
     """Return tags associated with a sample."""
-    sql = """SELECT s.sample_id, a.tag_id, t.tag, t.comment
+    sql = """SELECT a.sample_id, a.tag_id, t.tag, t.comment
              FROM tag_tosample AS a
              LEFT JOIN tag_tag AS t
              ON a.tag_id=t.id
-             LEFT JOIN sample_basic AS s
-             ON s.sample_id=a.sample_id
-             WHERE s.sample_id={0} USER_PERMISSION;""".format(
-        sample_id
-    )
-    return query_database(sql, ambiguous=True)
+             WHERE a.sample_id IN %s VISIBLE(a.sample_id)
+             ORDER BY a.sample_id;"""
+    return query_database(sql, values=[IdArray(sample_id)], user_id=user_id)
 
 
 def get_all_tags(tag=None):
@@ -1,249 +1,350 @@
 """API utilities for variant related viewsets."""
 from collections import Counter, OrderedDict
-
-from api.utils import query_database
+from itertools import groupby
+from operator import itemgetter
+
+from api.bitmaps import SampleBitmap, intersection, union
+from api.cache import cached_query
+from api.utils import (
+    IdArray,
+    Row,
+    column_index,
+    keyset_sql,
+    query_database,
+    select_columns,
+    stream_query
+)
 from api.queries.samples import get_samples
+from api.variant_catalog import get_catalog
 
 from staphopia.utils import reverse_complement, complement
 
 from variant.models import Reference, ReferenceGenome
 
+VCF_COLUMNS = ['AC', 'GT', 'AD', 'GQ', 'AF', 'MQ', 'PL', 'DP', 'QD']
+# Types of the result columns, see api.utils.ColumnIndex
+RESULT_TYPES = {
+    'sample_id': 'int', 'snp_id': 'int', 'indel_id': 'int',
+    'annotation_id': 'int', 'reference_position': 'int',
+    'reference_base': 'text', 'alternate_base': 'text',
+    'reference_codon': 'text', 'alternate_codon': 'text',
+    'reference_amino_acid': 'text', 'alternate_amino_acid': 'text',
+    'amino_acid_change': 'text', 'is_synonymous': 'int',
+    'is_transition': 'int', 'is_genic': 'int', 'is_deletion': 'bool',
+    'feature_id': 'int', 'reference_id': 'int', 'AC': 'int', 'GT': 'text',
+    'AD': 'text', 'GQ': 'text', 'AF': 'float', 'MQ': 'text', 'PL': 'text',
+    'DP': 'int', 'QD': 'text', 'quality': 'text', 'filter_id': 'int'
+}
+INDEL_COLUMNS = column_index(
+    ['sample_id', 'indel_id', 'annotation_id', 'reference_position',
+     'reference_base', 'alternate_base', 'is_deletion', 'feature_id',
+     'reference_id'] + VCF_COLUMNS + ['quality', 'filter_id'],
+    types=RESULT_TYPES
+)
+SNP_COLUMNS = column_index(
+    ['sample_id', 'snp_id', 'annotation_id', 'reference_position',
+     'reference_base', 'alternate_base', 'reference_codon', 'alternate_codon',
+     'reference_amino_acid', 'alternate_amino_acid', 'amino_acid_change',
+     'is_synonymous', 'is_transition', 'is_genic', 'feature_id',
+     'reference_id'] + VCF_COLUMNS + ['quality', 'filter_id'],
+    types=RESULT_TYPES
+)
+# Columns of variant_indel and variant_snp in the results above
+INDEL_INFO_COLUMNS = [
+    'id', 'reference_position', 'reference_base', 'alternate_base',
+    'is_deletion', 'feature_id', 'reference_id'
+]
+SNP_INFO_COLUMNS = [
+    'id', 'reference_position', 'reference_base', 'alternate_base',
+    'reference_codon', 'alternate_codon', 'reference_amino_acid',
+    'alternate_amino_acid', 'amino_acid_change', 'is_synonymous',
+    'is_transition', 'is_genic', 'feature_id', 'reference_id'
+]
+# Columns of variant_snpcall and variant_indelcall, formatted as the VCF
+# fields they were parsed from
+CALL_COLUMNS = [
+    'c.sample_id', 'c.annotation_id', 'c.ac AS "AC"', 'c.gt::text AS "GT"',
+    "c.ad_ref || ',' || c.ad_alt AS \"AD\"", 'c.gq::text AS "GQ"',
+    'c.af AS "AF"', 'c.mq::text AS "MQ"',
+    "c.pl_homref || ', ' || c.pl_het AS \"PL\"", 'c.dp AS "DP"',
+    "COALESCE(c.qd::text, '.') AS \"QD\"", 'c.quality::text AS quality',
+    'c.filter_id'
+]
+
+
+def get_projection(columns, fields=None):
+    """
+    Return the index and positions of the requested result columns.
+
+    `columns` is the index of every result column (e.g. SNP_COLUMNS).
+    """
+    if fields is None:
+        return [columns, None]
+    index = column_index(select_columns(columns, fields),
+                         types=columns.types)
+    return [index, [columns[col] for col in index]]
+
+
+def get_calls_sql(table, variant_column, sample_id, fields=None,
+                  annotation_id=None, start=None, end=None):
+    """
+    Return the SQL and values selecting the calls of samples.
+
+    Calls are filtered by annotation, or else by the reference positions
+    between `start` and `end`, in the query. They are ordered by sample and
+    position, as they were read from the VCF.
+    """
+    columns = ','.join(select_columns(
+        CALL_COLUMNS, fields, required=['sample_id', variant_column]
+    ))
+    where = ''
+    values = [IdArray(sample_id)]
+    if annotation_id:
+        where = 'AND c.annotation_id IN %s'
+        values.append(IdArray(annotation_id))
+    elif start and end:
+        where = 'AND c.reference_position BETWEEN %s AND %s'
+        values.extend([int(start), int(end)])
+
+    sql = f"""SELECT c.{variant_column},{columns}
+              FROM {table} AS c
+              WHERE c.sample_id IN %s VISIBLE(c.sample_id) {where}
+              ORDER BY c.sample_id, c.reference_position;"""
+    return [sql, values]
+
+
 def get_variant_count_by_position(ids, is_annotation=False):
     sql = """SELECT id, position, reference_id, annotation_id,
                     is_mlst_set, nongenic_indel, nongenic_snp, indel,
                     synonymous, nonsynonymous, total
              FROM variant_counts
-             WHERE {0} IN ({1})
+             WHERE {0} IN %s
              ORDER BY position;""".format(
-        'annotation_id' if is_annotation else 'position',
-        ','.join([str(i) for i in ids])
+        'annotation_id' if is_annotation else 'position'
     )
 
+    return query_database(sql, values=[IdArray(ids)])
+
+
+def get_variant_counts_page(after=None, limit=None):
+    """Return a keyset page of variant counts ordered by position."""
+    after_sql, order_sql = keyset_sql(['position', 'id'], after=after,
+                                      limit=limit)
+    sql = """SELECT id, reference_id AS reference,
+                    annotation_id AS annotation, position, is_mlst_set,
+                    nongenic_indel, nongenic_snp, indel, synonymous,
+                    nonsynonymous, total
+             FROM variant_counts
+             WHERE id > 0 {0}
+             {1};""".format(after_sql, order_sql)
+
     return query_database(sql)
 
 
+@cached_query('sample_id')
 def get_variant_counts(sample_id, user_id):
     sql = """SELECT v.sample_id, snp_count, indel_count,
                     (snp_count + indel_count) AS total
              FROM variant_variant AS v
-             LEFT JOIN sample_sample AS s
-             ON v.sample_id=s.id
-             WHERE v.sample_id IN ({0}) USER_PERMISSION;""".format(
-        ','.join([str(i) for i in sample_id])
-    )
+             WHERE v.sample_id IN %s VISIBLE(v.sample_id);"""
 
-    return query_database(sql)
+    return query_database(sql, values=[IdArray(sample_id)], user_id=user_id)
 
 
-def get_samples_by_indel(indel_id, user_id, bulk=False):
-    sql = """SELECT indel_id, members, count
-             FROM variant_indelmember
-             WHERE indel_id IN ({0});""".format(
-        ','.join([str(i) for i in indel_id])
+def get_member_bitmaps(table, variant_id):
+    """Return the bitmap of public samples of each SNP (or InDel) id."""
+    sql = f"""SELECT {table}_id AS id, bitmap
+              FROM variant_{table}member
+              WHERE {table}_id IN %s;"""
+    return OrderedDict(
+        (row['id'], SampleBitmap.from_bytes(row['bitmap']))
+        for row in query_database(sql, values=[IdArray(variant_id)])
     )
 
+
+def get_samples_by_variants(user_id, snp_id=None, indel_id=None,
+                            exclude_snp_id=None, exclude_indel_id=None,
+                            match_any=False, count=False):
+    """
+    Return the public samples carrying all (or any) of the given variants.
+
+    Samples carrying any of the excluded SNPs or InDels are removed, e.g.
+    samples with SNP X but not SNP Y. With `count` only the number of samples
+    is returned.
+    """
+    include = []
+    exclude = []
+    for table, ids, bitmaps in [('snp', snp_id, include),
+                                ('indel', indel_id, include),
+                                ('snp', exclude_snp_id, exclude),
+                                ('indel', exclude_indel_id, exclude)]:
+        if ids:
+            ids = [ids] if isinstance(ids, (int, str)) else ids
+            found = get_member_bitmaps(table, ids)
+            # Variants without a member row are in no public sample
+            bitmaps.extend(found.get(int(i), SampleBitmap()) for i in ids)
+
+    samples = union(include) if match_any else intersection(include)
+    samples = samples - union(exclude)
+    if count:
+        return [{'count': len(samples)}]
+    return get_samples(user_id, sample_ids=list(samples)) if samples else []
+
+
+def get_samples_by_indel(indel_id, user_id, bulk=False):
     results = []
-    for row in query_database(sql):
+    for variant_id, bitmap in get_member_bitmaps('indel', indel_id).items():
         if bulk:
-            for sample_id in row['members']:
+            for sample_id in bitmap:
                 results.append({
-                    "indel_id": row['indel_id'],
+                    "indel_id": variant_id,
                     "sample_id": sample_id
                 })
         else:
-            if len(row['members']):
-                results = get_samples(user_id, sample_ids=row['members'])
+            if bitmap:
+                results = get_samples(user_id, sample_ids=list(bitmap))
             break
     return results
 
 
-def get_indels_by_sample(sample_id, user_id, annotation_id=None):
+def get_indels_by_sample(sample_id, user_id, annotation_id=None,
+                         fields=None):
     """Return indels associated with a sample."""
-    sql = None
-    if annotation_id:
-        sql = """SELECT v.sample_id, v.indel
-                 FROM variant_variant AS v
-                 LEFT JOIN sample_sample AS s
-                 ON v.sample_id=s.id
-                 WHERE v.sample_id IN ({0}) USER_PERMISSION;""".format(
-            ','.join([str(i) for i in sample_id])
-        )
-    else:
-        sql = """SELECT v.sample_id, v.indel
-                 FROM variant_variant AS v
-                 LEFT JOIN sample_sample AS s
-                 ON v.sample_id=s.id
-                 WHERE v.sample_id IN ({0}) USER_PERMISSION;""".format(
-            ','.join([str(i) for i in sample_id])
-        )
-
-    rows = {}
-    indel_id = []
-    for row in query_database(sql):
-        rows[row['sample_id']] = row['indel']
-        indels = []
-        for indel in row['indel']:
-            indels.append(indel['indel_id'])
-        indel_id = list(set(indel_id + list(indels)))
+    return list(iter_indels_by_sample(sample_id, user_id,
+                                      annotation_id=annotation_id,
+                                      fields=fields))
 
-    results = []
-    if indel_id:
-        indel_info = {}
-        if annotation_id:
-            if isinstance(annotation_id, str):
-                annotation_id = [annotation_id]
-            sql = """SELECT *
-                     FROM variant_indel
-                     WHERE id IN ({0}) AND annotation_id IN ({1})""".format(
-                ','.join([str(i) for i in indel_id]),
-                ','.join([str(i) for i in annotation_id])
-            )
-        else:
-            sql = "SELECT * FROM variant_indel WHERE id IN ({0})".format(
-                ','.join([str(i) for i in indel_id])
-            )
-        for row in query_database(sql):
-            indel_info[row['id']] = row
-
-        for sample, indels in rows.items():
-            for indel in indels:
-                indel_id = int(indel['indel_id'])
-                if indel_id in indel_info:
-                    results.append(OrderedDict([
-                        ('sample_id', sample),
-                        ('indel_id', indel_id),
-                        ('annotation_id', indel['annotation_id']),
-                        ('reference_position',
-                         indel_info[indel_id]['reference_position']),
-                        ('reference_base', indel_info[indel_id]['reference_base']),
-                        ('alternate_base', indel_info[indel_id]['alternate_base']),
-                        ('is_deletion', indel_info[indel_id]['is_deletion']),
-                        ('feature_id', indel_info[indel_id]['feature_id']),
-                        ('reference_id', indel_info[indel_id]['reference_id']),
-                        ('AC', indel['AC'][0]),
-                        ('GT', indel['GT'][0]),
-                        ('AD', indel['AD'][0]),
-                        ('GQ', indel['GQ'][0]),
-                        ('AF', indel['AF'][0]),
-                        ('MQ', indel['MQ'][0]),
-                        ('PL', indel['PL'][0]),
-                        ('DP', indel['DP'][0]),
-                        ('QD', indel['QD'][0]),
-                        ('quality', indel['quality']),
-                        ('filter_id', indel['filter_id']),
-                    ]))
-    return results
 
+def iter_indels_by_sample(sample_id, user_id, annotation_id=None,
+                          fields=None):
+    """
+    Yield indels associated with a sample, one sample at a time.
+
+    With `fields` only those columns are read from variant_indel and
+    returned.
+    """
+    info_sql = ','.join(select_columns(INDEL_INFO_COLUMNS, fields,
+                                       required=['id']))
+    index, positions = get_projection(INDEL_COLUMNS, fields=fields)
+    sql_calls, values = get_calls_sql('variant_indelcall', 'indel_id',
+                                      sample_id, fields=fields,
+                                      annotation_id=annotation_id)
+
+    # Only look up indels not already seen in a previous sample, from the
+    # catalog if there is one, indels newer than it are queried
+    catalog = get_catalog('indel')
+    seen = set()
+    indel_info = {}
+    calls = stream_query(sql_calls, values=values, user_id=user_id)
+    for sample, rows in groupby(calls, key=itemgetter('sample_id')):
+        rows = list(rows)
+        indel_id = set(row['indel_id'] for row in rows) - seen
+        seen.update(indel_id)
+        if indel_id and catalog is not None:
+            found, indel_id = catalog.lookup(indel_id)
+            indel_info.update(found)
+        if indel_id:
+            sql = f"SELECT {info_sql} FROM variant_indel WHERE id IN %s"
+            for info in query_database(sql, values=[IdArray(indel_id)]):
+                indel_info[info['id']] = info
+
+        for row in rows:
+            indel_id = row['indel_id']
+            if indel_id in indel_info:
+                info = indel_info[indel_id]
+                values = (
+                    sample, indel_id, row.get('annotation_id'),
+                    info.get('reference_position'),
+                    info.get('reference_base'), info.get('alternate_base'),
+                    info.get('is_deletion'), info.get('feature_id'),
+                    info.get('reference_id'),
+                    *[row.get(col) for col in VCF_COLUMNS],
+                    row.get('quality'), row.get('filter_id')
+                )
+                if positions is not None:
+                    values = tuple(values[i] for i in positions)
+                yield Row(index, values)
 
-def get_samples_by_snp(snp_id, user_id, bulk=False):
-    sql = """SELECT snp_id, members
-             FROM variant_snpmember
-             WHERE snp_id IN ({0});""".format(
-        ','.join([str(i) for i in snp_id])
-    )
 
+def get_samples_by_snp(snp_id, user_id, bulk=False):
     results = []
-    for row in query_database(sql):
+    for variant_id, bitmap in get_member_bitmaps('snp', snp_id).items():
         if bulk:
-            for sample_id in row['members']:
+            for sample_id in bitmap:
                 results.append({
-                    "snp_id": row['snp_id'],
+                    "snp_id": variant_id,
                     "sample_id": sample_id
                 })
         else:
-            if len(row['members']):
-                results = get_samples(user_id, sample_ids=row['members'])
+            if bitmap:
+                results = get_samples(user_id, sample_ids=list(bitmap))
             break
     return results
 
 
 def get_snps_by_sample(sample_id, user_id, annotation_id=None, start=None,
-                       end=None):
+                       end=None, fields=None):
     """Return snps associated with a sample."""
-    sql = """SELECT v.sample_id, v.snp
-             FROM variant_variant AS v
-             LEFT JOIN sample_sample AS s
-             ON v.sample_id=s.id
-             WHERE v.sample_id IN ({0}) USER_PERMISSION;""".format(
-        ','.join([str(i) for i in sample_id])
-    )
+    return list(iter_snps_by_sample(sample_id, user_id,
+                                    annotation_id=annotation_id,
+                                    start=start, end=end, fields=fields))
 
-    rows = {}
-    snp_id = []
-    for row in query_database(sql):
-        rows[row['sample_id']] = row['snp']
-        snps = []
-        for snp in row['snp']:
-            snps.append(snp['snp_id'])
-        snp_id = list(set(snp_id + list(snps)))
 
-    results = []
-    if snp_id:
-        snp_info = {}
-        if annotation_id:
-            if isinstance(annotation_id, str):
-                annotation_id = [annotation_id]
-
-            sql = """SELECT *
-                     FROM variant_snp
-                     WHERE id IN ({0}) AND annotation_id IN ({1})""".format(
-                ','.join([str(i) for i in snp_id]),
-                ','.join([str(i) for i in annotation_id])
-            )
-        elif start and end:
-            sql = """SELECT *
-                     FROM variant_snp
-                     WHERE reference_position >= {0} AND
-                           reference_position <= {1};""".format(
-                start, end
-            )
-        else:
-            sql = "SELECT * FROM variant_snp WHERE id IN ({0})".format(
-                ','.join([str(i) for i in snp_id])
-            )
-
-        for row in query_database(sql):
-            snp_info[row['id']] = row
-
-        for sample, snps in rows.items():
-            for snp in snps:
-                snp_id = int(snp['snp_id'])
-                if snp_id in snp_info:
-                    results.append(OrderedDict([
-                        ('sample_id', sample),
-                        ('snp_id', snp_id),
-                        ('annotation_id', snp['annotation_id']),
-                        ('reference_position',
-                         snp_info[snp_id]['reference_position']),
-                        ('reference_base', snp_info[snp_id]['reference_base']),
-                        ('alternate_base', snp_info[snp_id]['alternate_base']),
-                        ('reference_codon', snp_info[snp_id]['reference_codon']),
-                        ('alternate_codon', snp_info[snp_id]['alternate_codon']),
-                        ('reference_amino_acid',
-                         snp_info[snp_id]['reference_amino_acid']),
-                        ('alternate_amino_acid',
-                         snp_info[snp_id]['alternate_amino_acid']),
-                        ('amino_acid_change',
-                         snp_info[snp_id]['amino_acid_change']),
-                        ('is_synonymous', snp_info[snp_id]['is_synonymous']),
-                        ('is_transition', snp_info[snp_id]['is_transition']),
-                        ('is_genic', snp_info[snp_id]['is_genic']),
-                        ('feature_id', snp_info[snp_id]['feature_id']),
-                        ('reference_id', snp_info[snp_id]['reference_id']),
-                        ('AC', snp['AC'][0]),
-                        ('GT', snp['GT'][0]),
-                        ('AD', snp['AD'][0]),
-                        ('GQ', snp['GQ'][0]),
-                        ('AF', snp['AF'][0]),
-                        ('MQ', snp['MQ'][0]),
-                        ('PL', snp['PL'][0]),
-                        ('DP', snp['DP'][0]),
-                        ('QD', snp['QD'][0]),
-                        ('quality', snp['quality']),
-                        ('filter_id', snp['filter_id']),
-                    ]))
+def iter_snps_by_sample(sample_id, user_id, annotation_id=None, start=None,
+                        end=None, fields=None):
+    """
+    Yield snps associated with a sample, one sample at a time.
 
-    return results
+    With `fields` only those columns are read from variant_snp and returned.
+    """
+    info_sql = ','.join(select_columns(SNP_INFO_COLUMNS, fields,
+                                       required=['id']))
+    index, positions = get_projection(SNP_COLUMNS, fields=fields)
+    sql_calls, values = get_calls_sql('variant_snpcall', 'snp_id', sample_id,
+                                      fields=fields,
+                                      annotation_id=annotation_id,
+                                      start=start, end=end)
+
+    # Only look up snps not already seen in a previous sample, from the
+    # catalog if there is one, snps newer than it are queried
+    catalog = get_catalog('snp')
+    seen = set()
+    snp_info = {}
+    calls = stream_query(sql_calls, values=values, user_id=user_id)
+    for sample, rows in groupby(calls, key=itemgetter('sample_id')):
+        rows = list(rows)
+        snp_id = set(row['snp_id'] for row in rows) - seen
+        seen.update(snp_id)
+        if snp_id and catalog is not None:
+            found, snp_id = catalog.lookup(snp_id)
+            snp_info.update(found)
+        if snp_id:
+            sql = f"SELECT {info_sql} FROM variant_snp WHERE id IN %s"
+            for info in query_database(sql, values=[IdArray(snp_id)]):
+                snp_info[info['id']] = info
+
+        for row in rows:
+            snp_id = row['snp_id']
+            if snp_id in snp_info:
+                info = snp_info[snp_id]
+                values = (
+                    sample, snp_id, row.get('annotation_id'),
+                    info.get('reference_position'),
+                    info.get('reference_base'), info.get('alternate_base'),
+                    info.get('reference_codon'),
+                    info.get('alternate_codon'),
+                    info.get('reference_amino_acid'),
+                    info.get('alternate_amino_acid'),
+                    info.get('amino_acid_change'),
+                    info.get('is_synonymous'), info.get('is_transition'),
+                    info.get('is_genic'), info.get('feature_id'),
+                    info.get('reference_id'),
+                    *[row.get(col) for col in VCF_COLUMNS],
+                    row.get('quality'), row.get('filter_id')
+                )
+                if positions is not None:
+                    values = tuple(values[i] for i in positions)
+                yield Row(index, values)
 
 
 def get_reference_genome_sequence(reference_id):
@@ -261,11 +362,9 @@ def get_variant_counts_by_samples(sample_ids):
     """Return snps associated with a sample."""
     sql = """SELECT sample_id, snp, indel, (snp + indel) as total
              FROM variant_counts
-             WHERE sample_id IN ({0});""".format(
-        ','.join([str(i) for i in sample_ids])
-    )
+             WHERE sample_id IN %s;"""
 
-    return query_database(sql)
+    return query_database(sql, values=[IdArray(sample_ids)])
 
 
 def clean_annotation(string):
@@ -282,26 +381,26 @@ def get_variant_annotation(annotation_ids, locus_tag=None):
     """Get variant annotation information for a set of annotation ids."""
     locus_sql = ""
     if locus_tag:
-        locus_sql = f"AND locus_tag='{locus_tag}'"
+        locus_sql = "AND locus_tag=%s"
 
     sql = None
+    values = None
     if annotation_ids:
         sql = """SELECT * FROM variant_annotation
-                 WHERE id IN ({0}) {1}
-                 ORDER BY id;""".format(
-            ','.join([str(i) for i in annotation_ids]),
-            locus_sql
-        )
+                 WHERE id IN %s {0}
+                 ORDER BY id;""".format(locus_sql)
+        values = [IdArray(annotation_ids)] + ([locus_tag] if locus_tag else [])
     else:
         if locus_tag:
             sql = """SELECT * FROM variant_annotation
-                     WHERE locus_tag='{0}'
-                     ORDER BY id;""".format(locus_tag)
+                     WHERE locus_tag=%s
+                     ORDER BY id;"""
+            values = [locus_tag]
         else:
             sql = "SELECT * FROM variant_annotation ORDER BY id;"
 
     results = []
-    for row in query_database(sql):
+    for row in query_database(sql, values=values):
         row['note'] = clean_annotation(row['note'])
         row['gene'] = clean_annotation(row['gene'])
         row['locus_tag'] = clean_annotation(row['locus_tag'])
@@ -317,22 +416,18 @@ def get_snps_by_annotation(annotation_ids):
     sql = """SELECT id, reference_position, reference_base, alternate_base,
                     annotation_id
              FROM variant_snp
-             WHERE annotation_id IN ({0})
-             ORDER BY reference_position ASC""".format(
-        ','.join([str(i) for i in annotation_ids])
-    )
+             WHERE annotation_id IN %s
+             ORDER BY reference_position ASC"""
 
-    return query_database(sql)
+    return query_database(sql, values=[IdArray(annotation_ids)])
 
 
 def get_annotation_strand(annotation_ids):
     """Get the strand info for a set of annotation ids."""
     sql = """SELECT id, reference_id, strand FROM variant_annotation
-             WHERE id IN ({0});""".format(
-        ','.join([str(i) for i in annotation_ids])
-    )
+             WHERE id IN %s;"""
 
-    return query_database(sql)
+    return query_database(sql, values=[IdArray(annotation_ids)])
 
 
 def get_representative_sequence(sample_ids, user_id, annotation_ids):
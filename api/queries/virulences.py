@@ -1,7 +1,9 @@
 """API utilities for virulence related viewsets."""
-from api.utils import query_database
+from api.cache import cached_query
+from api.utils import IdArray, query_database
 
 
+@cached_query('sample_id')
 def get_ariba_virulence(sample_id, user_id):
     """Return virulence results associated with a sample."""
     cluster = {}
@@ -11,15 +13,12 @@ def get_ariba_virulence(sample_id, user_id):
 
     sql = """SELECT sample_id, results
              FROM virulence_ariba AS r
-             LEFT JOIN sample_sample AS s
-             ON r.sample_id=s.id
-             WHERE r.sample_id IN ({0}) USER_PERMISSION
-             ORDER BY r.sample_id ASC;""".format(
-        ','.join([str(i) for i in sample_id])
-    )
+             WHERE r.sample_id IN %s VISIBLE(r.sample_id)
+             ORDER BY r.sample_id ASC;"""
 
     results = []
-    for row in query_database(sql):
+    for row in query_database(sql, values=[IdArray(sample_id)],
+                              user_id=user_id):
         for r in row['results']:
             result = {}
             result['sample_id'] = row['sample_id']
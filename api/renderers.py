@@ -0,0 +1,283 @@
+"""
+Response renderers for the API.
+
+Besides JSON, query results can be returned as TSV, Arrow IPC or Parquet,
+selected with the Accept header or ?format=tsv|arrow|parquet. The columns
+are those of the query's Rows, Arrow and Parquet use the column types the
+query declared (see api.utils.ColumnIndex). Arrow and Parquet require
+pyarrow>=7.
+"""
+from collections.abc import Mapping
+from decimal import Decimal
+from importlib.util import find_spec
+from itertools import chain, islice
+import csv
+import io
+import json
+import time
+
+from django.conf import settings
+
+from rest_framework import renderers
+from rest_framework.negotiation import DefaultContentNegotiation
+
+from api.profiling import get_profile
+from api.utils import JSONEncoder, Row
+
+# Batches read ahead for the Arrow types of undeclared columns
+SCHEMA_BATCHES = 5
+
+
+class JSONRenderer(renderers.JSONRenderer):
+    """JSONRenderer aware of query result Rows."""
+    encoder_class = JSONEncoder
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        start_time = time.time()
+        content = super().render(data, accepted_media_type, renderer_context)
+        profile = get_profile()
+        if profile:
+            profile.add_timing('render', (time.time() - start_time) * 1000)
+        return content
+
+
+class ContentNegotiation(DefaultContentNegotiation):
+    """Only select renderers whose dependencies are installed."""
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        renderers = [r for r in renderers if getattr(r, 'available', True)]
+        return super().select_renderer(request, renderers,
+                                       format_suffix=format_suffix)
+
+
+def get_results(data):
+    """Return the rows of a response (see format_results)."""
+    if isinstance(data, Mapping):
+        return data['results'] if 'results' in data else [data]
+    return data or []
+
+
+def get_columns(rows):
+    """Return the columns of each row, in the order they first appear."""
+    columns = {}
+    for row in rows:
+        for column in row.keys():
+            columns.setdefault(column, None)
+    return list(columns)
+
+
+def get_batches(rows, size):
+    """Yield lists of at most `size` rows."""
+    rows = iter(rows)
+    batch = list(islice(rows, size))
+    while batch:
+        yield batch
+        batch = list(islice(rows, size))
+
+
+def flatten(value):
+    """Nested values (e.g. JSONB columns) are written as JSON strings."""
+    if isinstance(value, (Mapping, list)):
+        return json.dumps(value, cls=JSONEncoder, separators=(',', ':'))
+    return value
+
+
+def get_arrow_type(column_type):
+    """Return the Arrow type of a declared column type (see ColumnIndex)."""
+    import pyarrow as pa
+    return {
+        'bool': pa.bool_(),
+        'int': pa.int64(),
+        # numeric columns are read as Decimal, whatever their precision
+        'float': pa.float64(),
+        'text': pa.string(),
+        'json': pa.string(),
+        'date': pa.date32(),
+        'timestamp': pa.timestamp('us'),
+        'timestamptz': pa.timestamp('us', tz='UTC')
+    }.get(column_type)
+
+
+def get_declared_types(row, columns):
+    """Return the Arrow type of the columns a row's query declared."""
+    types = row.column_types() if isinstance(row, Row) else {}
+    declared = {}
+    for column in columns:
+        arrow_type = get_arrow_type(types.get(column))
+        if arrow_type is not None:
+            declared[column] = arrow_type
+    return declared
+
+
+def to_array(values, arrow_type=None):
+    """Return values as an Arrow array, inferring its type if not given."""
+    import pyarrow as pa
+    if arrow_type is None or pa.types.is_floating(arrow_type):
+        values = [float(v) if isinstance(v, Decimal) else v for v in values]
+    if arrow_type is not None and pa.types.is_string(arrow_type):
+        values = [v if v is None or isinstance(v, str) else str(v)
+                  for v in values]
+    return pa.array(values, type=arrow_type)
+
+
+def get_type(types):
+    """Return an Arrow type holding the values of each of `types`."""
+    import pyarrow as pa
+    types = set(t for t in types if not pa.types.is_null(t))
+    if not types:
+        # Only nulls so far, assumed to be text
+        return pa.string()
+    elif len(types) == 1:
+        return types.pop()
+    elif all(pa.types.is_integer(t) or pa.types.is_floating(t)
+             for t in types):
+        return pa.float64()
+    return pa.string()
+
+
+def infer_types(batches, columns):
+    """Return an Arrow type holding the values of each column of batches."""
+    return {
+        col: get_type(
+            to_array([flatten(row.get(col)) for row in batch]).type
+            for batch in batches
+        )
+        for col in columns
+    }
+
+
+def to_record_batch(rows, schema):
+    """Return rows as a RecordBatch of `schema`."""
+    import pyarrow as pa
+    return pa.RecordBatch.from_arrays([
+        to_array([flatten(row.get(field.name)) for row in rows], field.type)
+        for field in schema
+    ], schema=schema)
+
+
+class Sink(io.BytesIO):
+    """A buffer writers can be closed over, emptied as chunks are yielded."""
+
+    def close(self):
+        pass
+
+    def pop(self):
+        value = self.getvalue()
+        self.seek(0)
+        self.truncate()
+        return value
+
+
+class ColumnarRenderer(renderers.BaseRenderer):
+    """
+    Base renderer for column-oriented output.
+
+    `stream` yields the output for an iterable of rows in chunks, so results
+    from stream_query can be written without holding them in memory (see
+    CustomReadOnlyModelViewSet.streaming_response).
+    """
+    available = True
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        start_time = time.time()
+        content = self.join(self.stream(get_results(data)))
+        profile = get_profile()
+        if profile:
+            profile.add_timing('render', (time.time() - start_time) * 1000)
+        return content
+
+    def join(self, chunks):
+        return b''.join(chunks)
+
+    def stream(self, rows):
+        raise NotImplementedError('ColumnarRenderer.stream() must be '
+                                  'implemented.')
+
+
+class TSVRenderer(ColumnarRenderer):
+    """Tab-separated values, with a header of column names."""
+    media_type = 'text/tab-separated-values'
+    format = 'tsv'
+    charset = 'utf-8'
+
+    def join(self, chunks):
+        return ''.join(chunks)
+
+    def stream(self, rows):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, delimiter='\t', lineterminator='\n')
+        columns = None
+        for batch in get_batches(rows, settings.STREAM_BATCH_SIZE):
+            if columns is None:
+                columns = get_columns(batch)
+                writer.writerow(columns)
+            for row in batch:
+                writer.writerow([flatten(row.get(col)) for col in columns])
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+
+class ArrowRenderer(ColumnarRenderer):
+    """Arrow IPC stream, a record batch per STREAM_BATCH_SIZE rows."""
+    media_type = 'application/vnd.apache.arrow.stream'
+    format = 'arrow'
+    charset = None
+    render_style = 'binary'
+    available = find_spec('pyarrow') is not None
+
+    def open_writer(self, sink, schema):
+        import pyarrow as pa
+        return pa.ipc.new_stream(sink, schema)
+
+    def write(self, writer, batch):
+        writer.write_batch(batch)
+
+    def stream(self, rows):
+        import pyarrow as pa
+        sink = Sink()
+        batches = get_batches(rows, settings.STREAM_BATCH_SIZE)
+        first = next(batches, None)
+        if first is None:
+            # No rows, write an empty schema
+            writer = self.open_writer(sink, pa.schema([]))
+            writer.close()
+            yield sink.pop()
+            return
+
+        # The schema can not change once written. Columns have the type
+        # their query declared, others hold the values of the first batches
+        # (e.g. float for integers and floats)
+        columns = get_columns(first)
+        declared = get_declared_types(first[0], columns)
+        read_ahead = [first]
+        undeclared = [col for col in columns if col not in declared]
+        if undeclared:
+            # Lists are read in full, iterators (e.g. stream_query results)
+            # up to SCHEMA_BATCHES
+            read_ahead.extend(islice(batches, None if isinstance(
+                rows, (list, tuple)
+            ) else SCHEMA_BATCHES - 1))
+        declared.update(infer_types(read_ahead, undeclared))
+
+        schema = pa.schema([(col, declared[col]) for col in columns])
+        writer = self.open_writer(sink, schema)
+        for batch in chain(read_ahead, batches):
+            self.write(writer, to_record_batch(batch, schema))
+            yield sink.pop()
+        writer.close()
+        yield sink.pop()
+
+
+class ParquetRenderer(ArrowRenderer):
+    """Parquet file, a row group per STREAM_BATCH_SIZE rows."""
+    media_type = 'application/vnd.apache.parquet'
+    format = 'parquet'
+
+    def open_writer(self, sink, schema):
+        import pyarrow.parquet as pq
+        return pq.ParquetWriter(sink, schema)
+
+    def write(self, writer, batch):
+        import pyarrow as pa
+        writer.write_table(pa.Table.from_batches([batch]))
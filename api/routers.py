@@ -14,6 +14,7 @@ from api.viewsets.annotations import (
     AnnotationInferenceViewSet,
 )
 
+from api.viewsets.jobs import JobViewSet
 from api.viewsets.kmers import KmerViewSet
 
 from api.viewsets.samples import SampleViewSet, MetadataViewSet
@@ -85,6 +86,9 @@ router.register(r'annotation/inference', AnnotationInferenceViewSet)
 router.register(r'info', InfoViewSet, base_name='info')
 router.register(r'top', TopViewSet, base_name='top')
 
+# Background jobs of bulk requests
+router.register(r'job', JobViewSet)
+
 # Kmer related tables
 router.register(r'kmer', KmerViewSet)
 
@@ -0,0 +1,10 @@
+""" . """
+from rest_framework import serializers
+from job.models import Job
+
+
+class JobSerializer(serializers.ModelSerializer):
+    class Meta:
+        fields = ('id', 'query', 'arguments', 'status', 'count', 'error',
+                  'created', 'started', 'finished')
+        model = Job
@@ -0,0 +1,62 @@
+from itertools import combinations
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from api.cache import cached_query, normalize
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'api': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'test-api-cache'
+    }
+}
+
+
+def get_unordered_sets():
+    """Return two frozensets of the same fields, iterated in other orders."""
+    fields = [f'field_{i}' for i in range(100)]
+    for a, b in combinations(fields, 2):
+        first, second = frozenset([a, b]), frozenset([b, a])
+        if list(first) != list(second):
+            return first, second
+    raise AssertionError('No fields with colliding hashes')
+
+
+@override_settings(CACHES=CACHES, API_CACHE_ALIAS='api',
+                   VIEW_ALL_SAMPLES=False)
+class CachedQueryTests(SimpleTestCase):
+
+    def test_normalize_frozenset(self):
+        first, second = get_unordered_sets()
+        self.assertEqual(normalize(first), tuple(sorted(first)))
+        self.assertEqual(repr(normalize(first)), repr(normalize(second)))
+
+    def test_frozenset_fields_share_key(self):
+        query = mock.Mock(return_value=[{'sample_id': 1}])
+
+        @cached_query('sample_id')
+        def get_results(sample_id, user_id, fields=None):
+            return query(sample_id, user_id, fields)
+
+        first, second = get_unordered_sets()
+        self.assertEqual(get_results([1], 1, fields=first),
+                         get_results([1], 1, fields=second))
+        self.assertEqual(query.call_count, 1)
+
+    @mock.patch('api.cache.has_replayed', return_value=False)
+    @mock.patch('api.cache.get_read_database', return_value='replica')
+    def test_replica_behind_stamps_not_cached(self, get_read_database,
+                                              has_replayed):
+        query = mock.Mock(return_value=[{'sample_id': 1}])
+
+        @cached_query('sample_id')
+        def get_results(sample_id, user_id):
+            return query(sample_id, user_id)
+
+        get_results([1], 1)
+        get_results([1], 1)
+        self.assertEqual(query.call_count, 2)
@@ -0,0 +1,23 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from api.dossier import get_dossiers
+
+
+class DossierTests(SimpleTestCase):
+
+    @mock.patch('api.queries.samples.query_database')
+    @mock.patch('api.dossier.get_samples')
+    def test_sample_without_metadata(self, get_samples, query_database):
+        get_samples.return_value = [{'sample_id': 1, 'name': 'sample_1'}]
+        query_database.side_effect = [
+            [{'field': 'country'}],
+            [{'sample_id': 1, 'metadata': None}]
+        ]
+
+        dossiers = get_dossiers([1], ['metadata'], 1)
+
+        self.assertEqual(len(dossiers), 1)
+        self.assertEqual(dossiers[0]['sample_id'], 1)
+        self.assertEqual(dossiers[0]['metadata'], [])
@@ -0,0 +1,34 @@
+from unittest import mock
+
+from django.db import InterfaceError, OperationalError
+from django.test import SimpleTestCase, override_settings
+
+from job.models import Job
+from job.tools import work_on_jobs
+
+
+def failing_query(user_id):
+    raise OperationalError('server closed the connection unexpectedly')
+
+
+@override_settings(API_JOB_DIR='/tmp/staphopia-test-jobs')
+class WorkOnJobsTests(SimpleTestCase):
+
+    @mock.patch('job.tools.close_old_connections')
+    @mock.patch('job.tools.claim_job')
+    @mock.patch.dict('job.tools.JOBS', {'failing': failing_query})
+    def test_failed_save_moves_on(self, claim_job, close_old_connections):
+        jobs = [mock.Mock(spec=Job, pk=i, query='failing', user_id=1,
+                          arguments={}, count=None) for i in (1, 2)]
+        jobs[0].save.side_effect = InterfaceError('connection already closed')
+        claim_job.side_effect = jobs + [None]
+
+        with mock.patch('builtins.print'), \
+                mock.patch('traceback.print_exc'):
+            work_on_jobs(once=True)
+
+        self.assertEqual(claim_job.call_count, 3)
+        jobs[1].save.assert_called_once_with()
+        self.assertEqual(jobs[1].status, Job.FAILED)
+        # Before each claim and after each failed job
+        self.assertEqual(close_old_connections.call_count, 5)
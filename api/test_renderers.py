@@ -0,0 +1,57 @@
+from decimal import Decimal
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+import pyarrow as pa
+
+from api.renderers import ArrowRenderer
+from api.utils import Row, column_index
+
+
+def read_arrow(chunks):
+    return pa.ipc.open_stream(b''.join(chunks)).read_all()
+
+
+def get_rows(values, column_type):
+    """Return rows of a query declaring 'value' as `column_type`."""
+    index = column_index(['sample_id', 'value'],
+                         types={'sample_id': 'int', 'value': column_type})
+    return (Row(index, (i, value)) for i, value in enumerate(values))
+
+
+@override_settings(STREAM_BATCH_SIZE=2)
+class ArrowRendererTests(SimpleTestCase):
+
+    def test_declared_null_then_numeric(self):
+        values = [None] * 12 + [1.5, 2]
+        table = read_arrow(ArrowRenderer().stream(get_rows(values, 'float')))
+        self.assertEqual(table.schema.field('value').type, pa.float64())
+        self.assertEqual(table.schema.field('sample_id').type, pa.int64())
+        self.assertEqual(table.column('value').to_pylist(), values)
+
+    def test_declared_decimal(self):
+        values = [Decimal('1.5'), Decimal('2.25')] * 6 + [Decimal('1234.5')]
+        table = read_arrow(ArrowRenderer().stream(get_rows(values, 'float')))
+        self.assertEqual(table.schema.field('value').type, pa.float64())
+        self.assertEqual(table.column('value').to_pylist(),
+                         [float(value) for value in values])
+
+    def test_undeclared_int_then_float(self):
+        rows = [{'value': 1}, {'value': 2}, {'value': 2.5}]
+        table = read_arrow(ArrowRenderer().stream(iter(rows)))
+        self.assertEqual(table.schema.field('value').type, pa.float64())
+        self.assertEqual(table.column('value').to_pylist(), [1.0, 2.0, 2.5])
+
+    @mock.patch('api.renderers.SCHEMA_BATCHES', 1)
+    def test_undeclared_list_read_in_full(self):
+        rows = [{'value': None}, {'value': None}, {'value': 1},
+                {'value': 1.5}]
+        table = read_arrow(ArrowRenderer().stream(rows))
+        self.assertEqual(table.schema.field('value').type, pa.float64())
+        self.assertEqual(table.column('value').to_pylist(),
+                         [None, None, 1.0, 1.5])
+
+    def test_no_rows(self):
+        table = read_arrow(ArrowRenderer().stream([]))
+        self.assertEqual(table.num_rows, 0)
@@ -0,0 +1,31 @@
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from api.utils import IdArray, temporary_ids
+
+IDS = IdArray(range(1, 10002))
+
+
+def get_cursor(alias):
+    cursor = mock.Mock()
+    cursor.db.alias = alias
+    return cursor
+
+
+@override_settings(API_READ_REPLICAS=['replica'], ID_TEMP_TABLE_SIZE=10000)
+class TemporaryIdsTests(SimpleTestCase):
+
+    def test_replica_binds_array(self):
+        cursor = get_cursor('replica')
+        with temporary_ids(cursor, [IDS]):
+            self.assertTrue(IDS.getquoted().startswith(b"(SELECT unnest("))
+        cursor.execute.assert_not_called()
+        cursor.copy_from.assert_not_called()
+
+    def test_primary_uses_temporary_table(self):
+        cursor = get_cursor('default')
+        with temporary_ids(cursor, [IDS]):
+            self.assertTrue(IDS.getquoted().startswith(b'(SELECT id FROM ids_'))
+            cursor.copy_from.assert_called_once()
+        self.assertIsNone(IDS.table)
@@ -2,6 +2,7 @@ from collections import OrderedDict
 import json
 
 from django.contrib.auth.models import User
+from django.utils.functional import cached_property
 
 from rest_framework.decorators import list_route
 from rest_framework.response import Response
@@ -18,15 +19,10 @@ class TestsViewSet(CustomReadOnlyModelViewSet):
     authentication_classes = ()
     permission_classes = ()
     throttle_classes = ()
-    client = APIClient()
-    user = User.objects.get(username='ena')
     queryset = ''
 
     def __init__(self, *args, **kwargs):
         super(TestsViewSet, self).__init__(*args, **kwargs)
-        self.client.force_authenticate(user=self.user)
-        self.samples = [s['sample_id']
-                        for s in get_samples_by_tag(TEST_TAG, is_id=False)]
         self.endpoints = [
             'Connection Related',
             'test_status',
@@ -58,6 +54,18 @@ class TestsViewSet(CustomReadOnlyModelViewSet):
             'test_sccmec_subtypes_predict',
         ]
 
+    # Queried on first use, not when the router imports the viewset
+    @cached_property
+    def client(self):
+        client = APIClient()
+        client.force_authenticate(user=User.objects.get(username='ena'))
+        return client
+
+    @cached_property
+    def samples(self):
+        return [s['sample_id']
+                for s in get_samples_by_tag(TEST_TAG, is_id=False)]
+
     def __get(self, url):
         response = self.client.get(url)
         return [json.loads(response.content), response.status_code]
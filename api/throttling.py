@@ -0,0 +1,73 @@
+"""
+Throttle API requests by their estimated cost.
+
+A request costs the weight of its endpoint (API_COST_WEIGHTS, by URL name,
+default 1) for each id it asks for, so a 5000 sample SNP bulk request costs
+far more than a tag lookup. Costs are drawn from a per-user budget, the
+'cost' rate of DEFAULT_THROTTLE_RATES (e.g. '10000000/day'), which refills
+continuously.
+
+To use:
+'DEFAULT_THROTTLE_CLASSES': ('api.throttling.CostRateThrottle', ...)
+"""
+from django.conf import settings
+
+from rest_framework.throttling import SimpleRateThrottle
+
+from api.cache import get_cache
+
+
+def get_cost(request):
+    """Return the weight of an endpoint times the ids requested."""
+    url_name = getattr(request.resolver_match, 'url_name', None)
+    weight = settings.API_COST_WEIGHTS.get(url_name, 1)
+
+    ids = 1
+    if request.method == 'POST' and isinstance(request.data, dict):
+        if isinstance(request.data.get('ids'), list):
+            ids = max(len(request.data['ids']), 1)
+    return weight * ids
+
+
+class CostRateThrottle(SimpleRateThrottle):
+    """Token bucket of each user, each request takes its cost."""
+
+    scope = 'cost'
+
+    def __init__(self):
+        super().__init__()
+        # Shared by every worker, unlike the default (local memory) cache
+        self.cache = get_cache() or self.cache
+
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            ident = request.user.pk
+        else:
+            ident = self.get_ident(request)
+        return self.cache_format % {'scope': self.scope, 'ident': ident}
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        self.now = self.timer()
+        tokens, updated = self.cache.get(self.key, (self.num_requests,
+                                                    self.now))
+        self.tokens = min(
+            self.num_requests,
+            tokens + (self.now - updated) * self.num_requests / self.duration
+        )
+
+        # A request costing more than the whole budget waits for all of it
+        self.cost = min(get_cost(request), self.num_requests)
+        if self.tokens < self.cost:
+            return False
+
+        self.cache.set(self.key, (self.tokens - self.cost, self.now),
+                       self.duration)
+        return True
+
+    def wait(self):
+        """Return the seconds until the budget covers the request."""
+        return (self.cost - self.tokens) * self.duration / self.num_requests
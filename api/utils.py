@@ -1,9 +1,33 @@
 """API utilities shared across viewsets."""
+import io
+import re
 import time
+import uuid
 from collections import OrderedDict
+from collections.abc import Mapping
+from contextlib import contextmanager
 
 from django.conf import settings
-from django.db import connection
+from django.db import connections, transaction
+
+from psycopg2.extensions import ISQLQuote
+from rest_framework.utils import encoders
+
+from api.profiling import record_rows
+from staphopia.db.routers import get_read_database, is_replica
+
+# VISIBLE(column), see get_sample_permisions
+VISIBLE_PATTERN = re.compile(r'VISIBLE\(([\w.]+)\)')
+
+# Column types of PostgreSQL type oids, see ColumnIndex
+COLUMN_TYPES = {
+    16: 'bool',
+    20: 'int', 21: 'int', 23: 'int', 26: 'int',
+    700: 'float', 701: 'float', 1700: 'float',
+    19: 'text', 25: 'text', 1042: 'text', 1043: 'text',
+    114: 'json', 3802: 'json',
+    1082: 'date', 1114: 'timestamp', 1184: 'timestamptz'
+}
 
 
 def timeit(fun, *args, **kw):
@@ -36,41 +60,355 @@ def format_results(results, query_time=None, limit=None):
         ))
 
 
-def get_sample_permisions(sql, ambiguous=False):
-    """Determine which samples to show."""
+class Row(Mapping):
+    """
+    A read-mostly result row backed by a tuple of values.
+
+    Every row of a result set shares a single `{column: position}` index
+    (see `column_index`), so a row only costs a reference to the index plus
+    the tuple returned by the cursor. Rows behave like an ordered dict for
+    lookups, iteration and serialization.
+    """
+    __slots__ = ('_index', '_values')
+
+    def __init__(self, index, values):
+        self._index = index
+        self._values = values
+
+    def __getitem__(self, key):
+        return self._values[self._index[key]]
+
+    def __setitem__(self, key, value):
+        """Replace a value, new columns are added to this row only."""
+        if isinstance(self._values, tuple):
+            self._values = list(self._values)
+
+        if key in self._index:
+            self._values[self._index[key]] = value
+        else:
+            self._index = self._index.copy()
+            self._index[key] = len(self._values)
+            self._values.append(value)
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __repr__(self):
+        return f'Row({self.as_dict()!r})'
+
+    def column_types(self):
+        """Return the declared type of the columns (see ColumnIndex)."""
+        return getattr(self._index, 'types', {})
+
+    def as_dict(self):
+        """Return the row as a plain dict."""
+        values = self._values
+        return {col: values[i] for col, i in self._index.items()}
+
+
+class JSONEncoder(encoders.JSONEncoder):
+    """DRF JSONEncoder that converts Rows without the generic Mapping path."""
+
+    def default(self, obj):
+        if isinstance(obj, Row):
+            return obj.as_dict()
+        return super().default(obj)
+
+
+class ColumnIndex(dict):
+    """
+    A `{column: position}` index, with the declared type of its columns.
+
+    Types are names of COLUMN_TYPES values (e.g. 'int', 'text'), used to
+    build the schema of columnar output (see api.renderers).
+    """
+    __slots__ = ('types',)
+
+    def __init__(self, positions, types=None):
+        super().__init__(positions)
+        self.types = types or {}
+
+    def copy(self):
+        return ColumnIndex(self, self.types)
+
+
+def column_index(cols, types=None):
+    """Return the column index shared by Rows of a result set."""
+    # Duplicate column names keep their first position and last value, the
+    # same as building an OrderedDict from zip(cols, row)
+    return ColumnIndex({col: i for i, col in enumerate(cols)}, types=types)
+
+
+def cursor_index(cursor):
+    """Return the column index of a cursor's rows, with their types."""
+    return column_index(
+        [d[0] for d in cursor.description],
+        types={d[0]: COLUMN_TYPES[d[1]] for d in cursor.description
+               if d[1] in COLUMN_TYPES}
+    )
+
+
+def get_rows(cursor):
+    """Return all remaining rows of an executed cursor as Rows."""
+    index = cursor_index(cursor)
+    rows = [Row(index, row) for row in cursor.fetchall()]
+    record_rows(rows)
+    return rows
+
+
+class IdArray(list):
+    """
+    A list of integer ids bound to a query as a single int[] parameter.
+
+    Use it as the parameter of an IN clause, e.g. `WHERE sample_id IN %s`.
+    It is rendered as one array literal, `(SELECT unnest('{1,2}'::int[]))`,
+    instead of an expression per id. Arrays larger than ID_TEMP_TABLE_SIZE are
+    copied into a temporary table (see temporary_ids) and read from there,
+    except on replicas.
+    """
+
+    def __init__(self, ids=()):
+        if isinstance(ids, (int, str)):
+            ids = [ids]
+        super().__init__(int(i) for i in ids)
+        self.table = None
+
+    def __conform__(self, protocol):
+        if protocol is ISQLQuote:
+            return self
+
+    def getquoted(self):
+        if self.table:
+            return f'(SELECT id FROM {self.table})'.encode()
+        ids = ','.join([str(i) for i in self])
+        return f"(SELECT unnest('{{{ids}}}'::int[]))".encode()
+
+
+@contextmanager
+def temporary_ids(cursor, values, size=None):
+    """
+    COPY each IdArray in the query values with more than `size` (default
+    ID_TEMP_TABLE_SIZE) ids into a temporary table.
+
+    Replicas are read-only (hot standbys reject CREATE TABLE and COPY), their
+    queries always bind the array.
+    """
+    if size is None:
+        size = settings.ID_TEMP_TABLE_SIZE
+    if is_replica(cursor.db.alias):
+        values = None
+    elif isinstance(values, dict):
+        values = values.values()
+
+    arrays = [
+        value for value in values or []
+        if isinstance(value, IdArray) and len(value) > size
+    ]
+    try:
+        for value in arrays:
+            value.table = f'ids_{uuid.uuid4().hex}'
+            cursor.execute(f"""CREATE TEMPORARY TABLE {value.table}
+                               (id integer PRIMARY KEY);""")
+            cursor.copy_from(
+                io.StringIO('\n'.join([str(i) for i in set(value)])),
+                value.table, columns=['id']
+            )
+            cursor.execute(f'ANALYZE {value.table};')
+        yield
+    finally:
+        for value in arrays:
+            if value.table:
+                cursor.execute(f'DROP TABLE IF EXISTS {value.table};')
+                value.table = None
+
+
+def get_sample_permisions(sql, ambiguous=False, user_id=None):
+    """
+    Determine which samples to show.
+
+    `VISIBLE(column)` is replaced by a filter of `column` against the
+    sample_visibility table (kept by a trigger on sample_sample, see
+    sample/migrations), public samples and those owned by `user_id`.
+    USER_PERMISSION filters the user_id column of the queried table instead
+    (`s.user_id` if ambiguous).
+    """
     if settings.VIEW_ALL_SAMPLES:
         # On Dev site, all samples viewable
         sql = sql.replace('USER_PERMISSION', '')
-    else:
-        # Only ENA data available
-        if ambiguous:
-            sql = sql.replace('USER_PERMISSION', 'AND s.user_id=2')
-        else:
-            sql = sql.replace('USER_PERMISSION', 'AND user_id=2')
-    return sql
+        return VISIBLE_PATTERN.sub('', sql)
 
+    # ENA data and the user's own samples
+    user_sql = f' OR user_id={int(user_id)}' if user_id else ''
+    sql = VISIBLE_PATTERN.sub(
+        lambda match: (f'AND {match.group(1)} IN (SELECT sample_id '
+                       f'FROM sample_visibility WHERE is_public{user_sql})'),
+        sql
+    )
 
-def query_database(sql, ambiguous=False):
-    """Submit SQL query to the database."""
-    cursor = connection.cursor()
-    cursor.execute(get_sample_permisions(sql, ambiguous=ambiguous))
-    cols = [d[0] for d in cursor.description]
-    return [OrderedDict(zip(cols, row)) for row in cursor.fetchall()]
+    column = 's.user_id' if ambiguous else 'user_id'
+    if user_id:
+        return sql.replace(
+            'USER_PERMISSION', f'AND ({column}=2 OR {column}={int(user_id)})'
+        )
+    return sql.replace('USER_PERMISSION', f'AND {column}=2')
+
+
+def keyset_sql(columns, after=None, limit=None):
+    """
+    Return the condition and ORDER BY/LIMIT clause for a keyset page.
+
+    `after` holds the values of `columns` for the last row of the previous
+    page, rows are returned in ascending order of `columns`.
+    """
+    columns = ', '.join(columns)
+    condition = ''
+    if after:
+        values = ', '.join([str(int(i)) for i in after])
+        condition = f'AND ({columns}) > ({values})'
+
+    order = f'ORDER BY {columns}'
+    if limit:
+        order = f'{order} LIMIT {int(limit)}'
+    return [condition, order]
+
+
+def column_name(column):
+    """Return the name a SELECT expression is returned as."""
+    name = column.split(' AS ')[-1] if ' AS ' in column else column
+    return name.split('.')[-1].strip('"')
+
+
+def wants_field(field, fields):
+    """Return True if `field` was requested, all are without `fields`."""
+    return fields is None or field in fields
 
 
-def sanitized_query(sql, values):
+def select_columns(columns, fields=None, required=('sample_id',)):
+    """
+    Return the SELECT expressions in `columns` whose names were requested.
+
+    `fields` are the names requested by ?fields=, all columns are returned
+    without it. Columns named in `required` (e.g. keys the results are
+    grouped by) are always returned.
+    """
+    if fields is None:
+        return list(columns)
+    return [
+        col for col in columns
+        if column_name(col) in fields or column_name(col) in required
+    ]
+
+
+def project(results, fields):
+    """Yield only the requested fields of each result."""
+    # Rows sharing an index share the projected index, and keep its types
+    projected = {}
+    for result in results:
+        if not isinstance(result, Row):
+            yield OrderedDict((f, result[f]) for f in result if f in fields)
+            continue
+
+        index = result._index
+        if id(index) not in projected or projected[id(index)][0] is not index:
+            cols = [col for col in index if col in fields]
+            projected[id(index)] = (
+                index, column_index(cols, types=result.column_types()),
+                [index[col] for col in cols]
+            )
+        __, projected_index, positions = projected[id(index)]
+        values = result._values
+        yield Row(projected_index, tuple(values[i] for i in positions))
+
+
+def query_database(sql, ambiguous=False, values=None, using=None,
+                   user_id=None):
+    """
+    Submit SQL query to the database.
+
+    The query is sent to `using`, by default a read replica during API
+    requests and the primary otherwise (see get_read_database). Samples are
+    limited to those `user_id` may see (see get_sample_permisions).
+    """
+    cursor = connections[using or get_read_database()].cursor()
+    with temporary_ids(cursor, values):
+        cursor.execute(get_sample_permisions(
+            sql, ambiguous=ambiguous, user_id=user_id
+        ), values)
+        return get_rows(cursor)
+
+
+def stream_query(sql, ambiguous=False, values=None,
+                 batch_size=settings.STREAM_BATCH_SIZE, using=None,
+                 user_id=None):
+    """
+    Submit SQL query to the database, yielding rows as they are fetched.
+
+    A named (server-side) cursor is used so PostgreSQL holds the result set
+    and only `batch_size` rows are in memory at any time. The cursor lives in
+    a transaction, opened on the first row and closed with the generator, so
+    the connection can not be used for other queries until the stream is
+    exhausted or closed.
+    """
+    # Rows are read after the request has been handled, so pick the
+    # database now
+    connection = connections[using or get_read_database()]
+    return _stream_query(connection, get_sample_permisions(
+        sql, ambiguous=ambiguous, user_id=user_id
+    ), values, batch_size)
+
+
+def _stream_query(connection, sql, values, batch_size):
+    # Outside a transaction the cursor would be declared WITH HOLD, and
+    # PostgreSQL would run the whole query before the first fetch
+    with temporary_ids(connection.cursor(), values), \
+            transaction.atomic(using=connection.alias), \
+            connection.chunked_cursor() as cursor:
+        cursor.execute(sql, values)
+        rows = cursor.fetchmany(batch_size)
+        index = cursor_index(cursor)
+        while rows:
+            for row in rows:
+                yield Row(index, row)
+            rows = cursor.fetchmany(batch_size)
+
+
+def stream_results(results, chunk_size=65536):
+    """Yield query results as a JSON document similar to format_results."""
+    start_time = time.time()
+    encoder = JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+    count = 0
+    chunk = ['{"message":"success","results":[']
+    chunk_length = 0
+    for result in results:
+        row = encoder.encode(result)
+        chunk.append(f',{row}' if count else row)
+        chunk_length += len(row)
+        count += 1
+        if chunk_length >= chunk_size:
+            yield ''.join(chunk)
+            chunk = []
+            chunk_length = 0
+
+    took = (time.time() - start_time) * 1000
+    chunk.append(f'],"took":"{took:.2f} ms","count":{count}}}')
+    yield ''.join(chunk)
+
+
+def sanitized_query(sql, values, using=None, user_id=None):
     """Submit SQL query to the database."""
-    cursor = connection.cursor()
-    cursor.execute(get_sample_permisions(sql), values)
-    cols = [d[0] for d in cursor.description]
-    return [OrderedDict(zip(cols, row)) for row in cursor.fetchall()]
+    cursor = connections[using or get_read_database()].cursor()
+    with temporary_ids(cursor, values):
+        cursor.execute(get_sample_permisions(sql, user_id=user_id), values)
+        return get_rows(cursor)
 
 
 def get_ids_in_bulk(table, ids, id_col="id"):
     """Return information from a given table for a list of ids."""
-    sql = "SELECT * FROM {0} WHERE {1} IN ({2});".format(
-        table,
-        id_col,
-        ','.join([str(i) for i in ids])
-    )
-    return query_database(sql)
+    sql = "SELECT * FROM {0} WHERE {1} IN %s;".format(table, id_col)
+    return query_database(sql, values=[IdArray(ids)])
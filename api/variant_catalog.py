@@ -0,0 +1,263 @@
+"""
+Columnar SNP and InDel catalogs shared by the API workers.
+
+Rows of variant_snp and variant_indel never change once inserted, so the
+variant endpoints read their columns from a catalog file, built by
+`manage.py build_variant_catalog`, instead of querying them per request.
+Workers map the newest file in API_VARIANT_CATALOG_DIR read-only, so its pages
+are shared, and look for a newer version at most every
+API_VARIANT_CATALOG_CHECK seconds. Ids inserted after a file was built are
+not in it, callers query those from the database.
+
+A file is a JSON header line, then each column as an array indexed by id:
+numbers as int32/int8, text with few distinct values (bases, codons) as codes
+into the values in the header and other text as offsets into a blob. Ids
+without a row have a reference_id of 0.
+
+To use:
+from api.variant_catalog import get_catalog
+"""
+from array import array
+from collections import OrderedDict
+import json
+import mmap
+import os
+import threading
+import time
+
+from django.conf import settings
+
+from api.utils import query_database, stream_query
+
+# Columns of each catalog and how they are stored
+CATALOGS = {
+    'snp': ('variant_snp', OrderedDict((
+        ('reference_position', 'int'), ('reference_base', 'str'),
+        ('alternate_base', 'str'), ('reference_codon', 'str'),
+        ('alternate_codon', 'str'), ('reference_amino_acid', 'str'),
+        ('alternate_amino_acid', 'str'), ('amino_acid_change', 'str'),
+        ('is_synonymous', 'small'), ('is_transition', 'small'),
+        ('is_genic', 'small'), ('feature_id', 'int'),
+        ('reference_id', 'int'), ('annotation_id', 'int')
+    ))),
+    'indel': ('variant_indel', OrderedDict((
+        ('reference_position', 'int'), ('reference_base', 'str'),
+        ('alternate_base', 'str'), ('is_deletion', 'bool'),
+        ('feature_id', 'int'), ('reference_id', 'int'),
+        ('annotation_id', 'int')
+    )))
+}
+TYPECODES = {'int': 'i', 'small': 'b', 'bool': 'b', 'enum': 'H', 'text': 'Q'}
+# Text with up to this many distinct values (e.g. codons) is stored as codes
+# into the values, other text as offsets into a blob
+MAX_ENUM_VALUES = 2 ** 16
+ALIGNMENT = 8
+
+_catalogs = {}
+_lock = threading.Lock()
+
+
+def align(offset):
+    """Return the next offset aligned for any column type."""
+    return offset + (-offset % ALIGNMENT)
+
+
+def get_path(kind, version, directory=None):
+    directory = directory or settings.API_VARIANT_CATALOG_DIR
+    return os.path.join(directory, f'{kind}.{version}.catalog')
+
+
+def get_versions(kind, directory=None):
+    """Return the versions of a catalog on disk, oldest first."""
+    directory = directory or settings.API_VARIANT_CATALOG_DIR
+    if not os.path.isdir(directory):
+        return []
+
+    versions = []
+    for name in os.listdir(directory):
+        parts = name.split('.')
+        if (len(parts) == 3 and parts[0] == kind and parts[2] == 'catalog'
+                and parts[1].isdigit()):
+            versions.append(int(parts[1]))
+    return sorted(versions)
+
+
+class VariantCatalog(object):
+    """A catalog file mapped read-only, columns are looked up by id."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as fh:
+            self.mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        header = json.loads(self.mmap.readline())
+        base = align(self.mmap.tell())
+        view = memoryview(self.mmap)
+
+        def cast(offset, typecode, length):
+            start = base + offset
+            return view[
+                start:start + array(typecode).itemsize * length
+            ].cast(typecode)
+
+        self.size = header['size']
+        self.columns = OrderedDict()
+        for name, column in header['columns'].items():
+            if column['type'] == 'enum':
+                data = [column['values'], cast(
+                    column['offset'], TYPECODES['enum'], self.size
+                )]
+            elif column['type'] == 'text':
+                data = [
+                    cast(column['offset'], TYPECODES['text'], self.size + 1),
+                    cast(column['blob'], 'B', column['blob_size'])
+                ]
+            else:
+                data = cast(column['offset'], TYPECODES[column['type']],
+                            self.size)
+            self.columns[name] = [column['type'], data]
+        self.reference = self.columns['reference_id'][1]
+        self.annotation = self.columns['annotation_id'][1]
+
+    def get_column(self, name, variant_ids):
+        """Return the values of a column for cataloged variant ids."""
+        column_type, data = self.columns[name]
+        if column_type == 'enum':
+            values, codes = data
+            return [values[codes[i]] for i in variant_ids]
+        elif column_type == 'text':
+            offsets, blob = data
+            return [bytes(blob[offsets[i]:offsets[i + 1]]).decode()
+                    for i in variant_ids]
+        elif column_type == 'bool':
+            return [bool(data[i]) for i in variant_ids]
+        return [data[i] for i in variant_ids]
+
+    def lookup(self, variant_ids, annotation_ids=None):
+        """
+        Return the columns of cataloged variants, and the ids not cataloged.
+
+        With `annotation_ids` only variants of those annotations are returned.
+        """
+        if annotation_ids:
+            annotation_ids = set(int(i) for i in annotation_ids)
+
+        found = []
+        missing = set()
+        for variant_id in variant_ids:
+            if variant_id >= self.size or not self.reference[variant_id]:
+                missing.add(variant_id)
+            elif (not annotation_ids or
+                    self.annotation[variant_id] in annotation_ids):
+                found.append(variant_id)
+
+        # Read a column at a time, then zip them into rows
+        names = ['id'] + list(self.columns)
+        columns = [found] + [self.get_column(name, found)
+                             for name in self.columns]
+        return [
+            {row[0]: dict(zip(names, row)) for row in zip(*columns)},
+            missing
+        ]
+
+
+def get_catalog(kind):
+    """Return the newest catalog of a kind ('snp', 'indel'), or None."""
+    if not settings.API_VARIANT_CATALOG_DIR:
+        return None
+
+    now = time.time()
+    catalog, checked = _catalogs.get(kind, [None, 0])
+    if now - checked < settings.API_VARIANT_CATALOG_CHECK:
+        return catalog
+
+    with _lock:
+        versions = get_versions(kind)
+        if versions:
+            path = get_path(kind, versions[-1])
+            if catalog is None or catalog.path != path:
+                catalog = VariantCatalog(path)
+        _catalogs[kind] = [catalog, now]
+    return catalog
+
+
+def build_catalog(kind, directory=None):
+    """Write a new version of a catalog, return its path and size."""
+    table, columns = CATALOGS[kind]
+    directory = directory or settings.API_VARIANT_CATALOG_DIR
+    size = query_database(
+        f'SELECT COALESCE(MAX(id), 0) + 1 AS size FROM {table};'
+    )[0]['size']
+
+    values = OrderedDict()
+    for name, column_type in columns.items():
+        if column_type == 'str':
+            values[name] = [''] * size
+        else:
+            typecode = TYPECODES[column_type]
+            values[name] = array(typecode, bytes(
+                array(typecode).itemsize * size
+            ))
+
+    sql = f'SELECT id, {",".join(columns)} FROM {table};'
+    for row in stream_query(sql):
+        variant_id = row['id']
+        for name, column_type in columns.items():
+            if column_type == 'str':
+                values[name][variant_id] = row[name]
+            else:
+                values[name][variant_id] = int(row[name])
+
+    # Lay out the columns, then write them after the header
+    header = {'kind': kind, 'size': size, 'columns': OrderedDict()}
+    chunks = []
+    offset = 0
+    for name, column_type in columns.items():
+        offset = align(offset)
+        column = {'type': column_type, 'offset': offset}
+        if column_type == 'str':
+            distinct = sorted(set(values[name]))
+            if len(distinct) <= MAX_ENUM_VALUES:
+                codes = {value: i for i, value in enumerate(distinct)}
+                column.update({'type': 'enum', 'values': distinct})
+                data = [array(TYPECODES['enum'], [
+                    codes[value] for value in values[name]
+                ]).tobytes()]
+            else:
+                encoded = [value.encode() for value in values[name]]
+                offsets = array(TYPECODES['text'], [0])
+                for value in encoded:
+                    offsets.append(offsets[-1] + len(value))
+                data = [offsets.tobytes(), b''.join(encoded)]
+                column.update({
+                    'type': 'text',
+                    'blob': align(offset + len(data[0])),
+                    'blob_size': len(data[1])
+                })
+        else:
+            data = [values[name].tobytes()]
+
+        for chunk in data:
+            offset = align(offset)
+            chunks.append([offset, chunk])
+            offset += len(chunk)
+        header['columns'][name] = column
+        # Free each column once it is laid out
+        values[name] = None
+
+    os.makedirs(directory, exist_ok=True)
+    versions = get_versions(kind, directory)
+    version = max([int(time.time())] + [v + 1 for v in versions[-1:]])
+    path = get_path(kind, version, directory=directory)
+    with open(f'{path}.tmp', 'wb') as fh:
+        fh.write(json.dumps(header).encode() + b'\n')
+        base = align(fh.tell())
+        for chunk_offset, chunk in chunks:
+            fh.seek(base + chunk_offset)
+            fh.write(chunk)
+    os.replace(f'{path}.tmp', path)
+
+    # Workers still mapping older versions keep them until they reload
+    for old_version in get_versions(kind, directory):
+        if old_version != version:
+            os.remove(get_path(kind, old_version, directory=directory))
+    return [path, size]
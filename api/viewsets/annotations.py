@@ -66,7 +66,8 @@ class AnnotationViewSet(CustomReadOnlyModelViewSet):
                     request.data['ids'],
                     request.user.pk,
                     product_id=product,
-                    exclude_sequence=exclude_sequence
+                    exclude_sequence=exclude_sequence,
+                    fields=self.get_fields()
                 )
                 return self.formatted_response(results, query_time=qt)
 
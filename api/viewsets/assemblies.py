@@ -35,7 +35,8 @@ class AssemblyViewSet(CustomReadOnlyModelViewSet):
                     get_assembly_stats,
                     request.data['ids'],
                     request.user.pk,
-                    is_plasmids=True if 'plasmids' in request.GET else False
+                    is_plasmids=True if 'plasmids' in request.GET else False,
+                    fields=self.get_fields()
                 )
                 return self.formatted_response(results, query_time=qt)
 
@@ -54,6 +55,7 @@ class ContigViewSet(CustomReadOnlyModelViewSet):
                 request.user.pk,
                 is_plasmids=True if 'plasmids' in request.GET else False,
                 exclude_sequence=True if 'exclude_sequence' in request.GET else False,
+                fields=self.get_fields()
             )
             return self.formatted_response(results, query_time=qt)
         else:
@@ -80,6 +82,7 @@ class ContigViewSet(CustomReadOnlyModelViewSet):
                     request.data['ids'],
                     request.user.pk,
                     is_plasmids=True if 'plasmids' in request.GET else False,
-                    exclude_sequence=exclude_sequence
+                    exclude_sequence=exclude_sequence,
+                    fields=self.get_fields()
                 )
                 return self.formatted_response(results, query_time=qt)
@@ -0,0 +1,73 @@
+"""Viewsets related to background API jobs."""
+from django.http import FileResponse
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.decorators import detail_route
+from rest_framework.response import Response
+
+from api.pagination import CustomReadOnlyModelViewSet
+from api.serializers.jobs import JobSerializer
+from api.validators import validate_positive_integer
+
+from job.models import Job
+
+
+class JobViewSet(CustomReadOnlyModelViewSet):
+    """
+    List, retrieve or download the results of a user's jobs.
+
+    Jobs are queued by bulk routes given ?async (see job/tools.py).
+    """
+    queryset = Job.objects.all()
+    serializer_class = JobSerializer
+
+    def get_queryset(self):
+        return Job.objects.filter(user=self.request.user.pk).order_by('-id')
+
+    def get_job(self, pk):
+        validator = validate_positive_integer(pk)
+        if validator['has_errors']:
+            return [None, Response(validator)]
+
+        job = self.get_queryset().filter(pk=pk).first()
+        if not job:
+            return [None, Response({
+                "message": "Job not found.",
+                "data": pk
+            }, status=status.HTTP_404_NOT_FOUND)]
+        return [job, None]
+
+    def list(self, request):
+        return self.paginate(self.get_queryset(), serializer=JobSerializer)
+
+    def retrieve(self, request, pk=None):
+        job, error = self.get_job(pk)
+        if error:
+            return error
+
+        result = JobSerializer(job).data
+        result['download'] = None
+        if job.status == Job.FINISHED:
+            result['download'] = request.build_absolute_uri(
+                reverse('job-download', args=[job.pk])
+            )
+        return Response(result)
+
+    @detail_route(methods=['get'])
+    def download(self, request, pk=None):
+        """Return the gzip compressed JSON results of a finished job."""
+        job, error = self.get_job(pk)
+        if error:
+            return error
+        elif job.status != Job.FINISHED:
+            return Response({
+                "message": f"Job is {job.status}, results are not available.",
+                "data": pk
+            })
+
+        return FileResponse(
+            open(job.path, 'rb'), as_attachment=True,
+            filename=f'staphopia-job-{job.pk}.json.gz',
+            content_type='application/gzip'
+        )
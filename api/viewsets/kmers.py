@@ -20,8 +20,9 @@ class KmerViewSet(CustomReadOnlyModelViewSet):
     def by_partition(self, request):
         """Given a parition, Kmers, samples IDs, return counts."""
         if request.method == 'POST':
-            validator = validate_list_of_ids(request.data,
-                                             max_query=50000)
+            validator = validate_list_of_ids(
+                request.data, max_query=self.max_query(50000)
+            )
             if validator['has_errors']:
                 return Response({
                     "message": validator['message'],
@@ -30,6 +31,15 @@ class KmerViewSet(CustomReadOnlyModelViewSet):
             else:
                 if validator['make_list']:
                     request.data['ids'] = [request.data['ids']]
+
+                if 'async' in request.GET:
+                    return self.job_response(
+                        'kmers_by_partition',
+                        partition=request.data['extra']['partition'],
+                        kmers=request.data['extra']['kmers'],
+                        samples=request.data['ids']
+                    )
+
                 return self.formatted_response(get_kmer_by_partition(
                     request.data['extra']['partition'],
                     request.data['extra']['kmers'],
@@ -50,5 +60,5 @@ class KmerViewSet(CustomReadOnlyModelViewSet):
 
     @list_route(methods=['get'])
     def partitions(self, request, pk=None):
-        from kmer.partitions import PARTITIONS
-        return Response(PARTITIONS)
+        from kmer.partitions import get_partitions
+        return Response(get_partitions())
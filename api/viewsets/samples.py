@@ -1,9 +1,15 @@
+from collections import OrderedDict
+from functools import partial
 import time
 
+from django.conf import settings
+
 from rest_framework import status
 from rest_framework.decorators import detail_route, list_route
 from rest_framework.response import Response
 
+from api.dossier import SECTIONS, get_dossiers
+from api.etags import conditional
 from api.pagination import CustomReadOnlyModelViewSet
 from api.serializers.samples import SampleSerializer, MetadataSerializer
 
@@ -56,6 +62,7 @@ class SampleViewSet(CustomReadOnlyModelViewSet):
     queryset = Sample.objects.all()
     serializer_class = SampleSerializer
 
+    @conditional()
     def retrieve(self, request, pk=None):
         validator = validate_positive_integer(pk)
         if validator['has_errors']:
@@ -74,7 +81,15 @@ class SampleViewSet(CustomReadOnlyModelViewSet):
             else:
                 st_filter = request.GET['st']
 
-        if 'user_only' in request.GET:
+        is_listing = 'user_only' in request.GET or (
+            'name' not in request.GET and 'tag' not in request.GET
+        )
+        if 'cursor' in request.GET and is_listing:
+            return self.keyset_paginate(partial(
+                get_samples, request.user.pk,
+                user_only='user_only' in request.GET, st=st_filter
+            ))
+        elif 'user_only' in request.GET:
             queryset = get_samples(request.user.pk, user_only=True,
                                    st=st_filter)
         elif 'name' in request.GET:
@@ -89,17 +104,64 @@ class SampleViewSet(CustomReadOnlyModelViewSet):
     def bulk(self, request):
         """Given a list of Sample IDs, return information for each Sample."""
         if request.method == 'POST':
-            validator = validate_list_of_ids(request.data, max_query=1000)
+            validator = validate_list_of_ids(
+                request.data, max_query=self.max_query(1000)
+            )
             if validator['has_errors']:
                 return Response({
                     "message": validator['message'],
                     "data": request.data
                 })
 
+            if 'async' in request.GET:
+                return self.job_response('samples',
+                                         sample_ids=request.data['ids'])
+
+            if 'stream' in request.GET:
+                return self.streaming_response(get_samples(
+                    request.user.pk, sample_ids=request.data['ids'],
+                    stream=True
+                ))
+
             results = get_samples(request.user.pk,
                                   sample_ids=request.data['ids'])
             return self.formatted_response(results)
 
+    @list_route(methods=['post'])
+    def dossier(self, request):
+        """
+        Given a list of Sample IDs and sections (e.g. assembly, st, tags),
+        return one document per Sample with the results of each section.
+        """
+        if request.method == 'POST':
+            validator = validate_list_of_ids(
+                request.data, max_query=settings.API_DOSSIER_MAX_IDS
+            )
+            if validator['has_errors']:
+                return Response({
+                    "message": validator['message'],
+                    "data": request.data
+                })
+
+            sections = request.data.get('sections', list(SECTIONS))
+            if (not isinstance(sections, list) or not sections or
+                    not all(section in SECTIONS for section in sections)):
+                return Response({
+                    "message": "Sections must be an array of: {0}".format(
+                        ', '.join(SECTIONS)
+                    ),
+                    "data": request.data
+                })
+
+            results, qt = timeit(
+                get_dossiers,
+                request.data['ids'],
+                list(OrderedDict.fromkeys(sections)),
+                request.user.pk,
+                request=request
+            )
+            return self.formatted_response(results, query_time=qt)
+
     @list_route(methods=['get'])
     def public(self, request):
         """Return all public ENA samples."""
@@ -112,7 +174,13 @@ class SampleViewSet(CustomReadOnlyModelViewSet):
             else:
                 limit = request.GET['limit']
 
-        if 'include_location' in request.GET:
+        if 'cursor' in request.GET:
+            # ?limit is the page size when walking pages with a cursor
+            return self.keyset_paginate(partial(
+                get_public_samples,
+                include_location='include_location' in request.GET
+            ), page_size=int(limit) if limit else 500)
+        elif 'include_location' in request.GET:
             samples = get_public_samples(include_location=True, limit=limit)
         else:
             samples = get_public_samples(limit=limit)
@@ -130,7 +198,13 @@ class SampleViewSet(CustomReadOnlyModelViewSet):
             else:
                 limit = request.GET['limit']
 
-        if 'include_location' in request.GET:
+        if 'cursor' in request.GET:
+            # ?limit is the page size when walking pages with a cursor
+            return self.keyset_paginate(partial(
+                get_public_samples, is_published=True,
+                include_location='include_location' in request.GET
+            ), page_size=int(limit) if limit else 500)
+        elif 'include_location' in request.GET:
             samples = get_public_samples(is_published=True,
                                          include_location=True, limit=limit)
         else:
@@ -150,26 +224,31 @@ class SampleViewSet(CustomReadOnlyModelViewSet):
         return self.formatted_response(results, query_time=qt)
 
     @detail_route(methods=['get'])
+    @conditional()
     def assembly(self, request, pk=None):
         results, qt = timeit(
             get_assembly_stats,
             [pk],
             request.user.pk,
-            is_plasmids=True if 'plasmids' in request.GET else False
+            is_plasmids=True if 'plasmids' in request.GET else False,
+            fields=self.get_fields()
         )
         return self.formatted_response(results, query_time=qt)
 
     @detail_route(methods=['get'])
+    @conditional()
     def plasmid(self, request, pk=None):
         results, qt = timeit(
             get_assembly_stats,
             [pk],
             request.user.pk,
-            is_plasmids=True
+            is_plasmids=True,
+            fields=self.get_fields()
         )
         return self.formatted_response(results, query_time=qt)
 
     @detail_route(methods=['get'])
+    @conditional()
     def contigs(self, request, pk=None):
         contig = None
         if 'contig' in request.GET:
@@ -185,11 +264,13 @@ class SampleViewSet(CustomReadOnlyModelViewSet):
             request.user.pk,
             is_plasmids=True if 'plasmids' in request.GET else False,
             contig=contig,
-            exclude_sequence=True if 'exclude_sequence' in request.GET else False
+            exclude_sequence=True if 'exclude_sequence' in request.GET else False,
+            fields=self.get_fields()
         )
         return self.formatted_response(results, query_time=qt)
 
     @detail_route(methods=['get'])
+    @conditional()
     def genes(self, request, pk=None):
         product = None
         if 'product_id' in request.GET:
@@ -208,12 +289,14 @@ class SampleViewSet(CustomReadOnlyModelViewSet):
             [pk],
             request.user.pk,
             product_id=product,
-            exclude_sequence=exclude_sequence
+            exclude_sequence=exclude_sequence,
+            fields=self.get_fields()
         )
         return self.paginate(results, page_size=250, is_serialized=True,
                              query_time=qt)
 
     @detail_route(methods=['get'])
+    @conditional()
     def indels(self, request, pk=None):
         annotation_id = None
         if 'annotation_id' in request.GET:
@@ -232,7 +315,8 @@ class SampleViewSet(CustomReadOnlyModelViewSet):
             if 'paginate' in request.GET:
                 return self.paginate(
                     get_indels_by_sample([pk], request.user.pk,
-                                         annotation_id=annotation_id),
+                                         annotation_id=annotation_id,
+                                         fields=self.get_fields()),
                     page_size=100,
                     is_serialized=True
                 )
@@ -241,13 +325,15 @@ class SampleViewSet(CustomReadOnlyModelViewSet):
                     get_indels_by_sample,
                     [pk],
                     request.user.pk,
-                    annotation_id=annotation_id
+                    annotation_id=annotation_id,
+                    fields=self.get_fields()
                 )
                 return self.formatted_response(results, query_time=qt)
 
     @detail_route(methods=['get'])
     def metadata(self, request, pk=None):
-        result, qt = timeit(get_sample_metadata, [pk],  request.user.pk)
+        result, qt = timeit(get_sample_metadata, [pk],  request.user.pk,
+                            fields=self.get_fields())
         return self.formatted_response(result, query_time=qt)
 
     @detail_route(methods=['get'])
@@ -256,6 +342,7 @@ class SampleViewSet(CustomReadOnlyModelViewSet):
         return self.formatted_response(result, query_time=qt)
 
     @detail_route(methods=['get'])
+    @conditional()
     def qc(self, request, pk=None):
         result, qt = timeit(
             get_sequencing_stats,
@@ -263,11 +350,13 @@ class SampleViewSet(CustomReadOnlyModelViewSet):
             request.user.pk,
             stage=request.GET['stage'] if 'stage' in request.GET else False,
             qual_per_base=True if 'bases' in request.GET else False,
-            read_lengths=True if 'lengths' in request.GET else False
+            read_lengths=True if 'lengths' in request.GET else False,
+            fields=self.get_fields()
         )
         return self.formatted_response(result, query_time=qt)
 
     @detail_route(methods=['get'])
+    @conditional()
     def resistance(self, request, pk=None):
         include_all = False
         if 'include_all' in request.GET:
@@ -311,15 +400,18 @@ class SampleViewSet(CustomReadOnlyModelViewSet):
         return self.formatted_response(result, query_time=qt)
 
     @detail_route(methods=['get'])
+    @conditional()
     def sccmec_coverages(self, request, pk=None):
         result, qt = timeit(
             get_sccmec_coverage_by_sample,
             [pk],
-            request.user.pk
+            request.user.pk,
+            fields=self.get_fields()
         )
         return self.formatted_response(result, query_time=qt)
 
     @detail_route(methods=['get'])
+    @conditional()
     def sccmec_primers(self, request, pk=None):
         hamming_distance=True if 'hamming_distance' in request.GET else False
         result, qt = timeit(
@@ -328,11 +420,13 @@ class SampleViewSet(CustomReadOnlyModelViewSet):
             request.user.pk,
             exact_hits=True if 'exact_hits' in request.GET else False,
             predict=True if 'predict' in request.GET else False,
-            hamming_distance=hamming_distance
+            hamming_distance=hamming_distance,
+            fields=self.get_fields()
         )
         return self.formatted_response(result, query_time=qt)
 
     @detail_route(methods=['get'])
+    @conditional()
     def sccmec_subtypes(self, request, pk=None):
         hamming_distance=True if 'hamming_distance' in request.GET else False
         result, qt = timeit(
@@ -342,20 +436,24 @@ class SampleViewSet(CustomReadOnlyModelViewSet):
             is_subtypes=True,
             exact_hits=True if 'exact_hits' in request.GET else False,
             predict=True if 'predict' in request.GET else False,
-            hamming_distance=hamming_distance
+            hamming_distance=hamming_distance,
+            fields=self.get_fields()
         )
         return self.formatted_response(result, query_time=qt)
 
     @detail_route(methods=['get'])
+    @conditional()
     def sccmec_proteins(self, request, pk=None):
         result, qt = timeit(
             get_sccmec_proteins_by_sample,
             [pk],
-            request.user.pk
+            request.user.pk,
+            fields=self.get_fields()
         )
         return self.formatted_response(result, query_time=qt)
 
     @detail_route(methods=['get'])
+    @conditional()
     def snps(self, request, pk=None):
         annotation_id = None
         if 'annotation_id' in request.GET:
@@ -405,7 +503,8 @@ class SampleViewSet(CustomReadOnlyModelViewSet):
                 return self.paginate(
                     get_snps_by_sample([pk], request.user.pk,
                                        annotation_id=annotation_id,
-                                       start=start, end=end),
+                                       start=start, end=end,
+                                       fields=self.get_fields()),
                     page_size=100,
                     is_serialized=True
                 )
@@ -416,11 +515,13 @@ class SampleViewSet(CustomReadOnlyModelViewSet):
                     request.user.pk,
                     annotation_id=annotation_id,
                     start=start,
-                    end=end
+                    end=end,
+                    fields=self.get_fields()
                 )
                 return self.formatted_response(result, query_time=qt)
 
     @detail_route(methods=['get'])
+    @conditional()
     def st(self, request, pk=None):
         result, qt = timeit(
             get_sequence_type,
@@ -430,6 +531,7 @@ class SampleViewSet(CustomReadOnlyModelViewSet):
         return self.formatted_response(result, query_time=qt)
 
     @detail_route(methods=['get'])
+    @conditional()
     def st_blast(self, request, pk=None):
         result, qt = timeit(
             get_mlst_blast_results,
@@ -439,6 +541,7 @@ class SampleViewSet(CustomReadOnlyModelViewSet):
         return self.formatted_response(result, query_time=qt)
 
     @detail_route(methods=['get'])
+    @conditional()
     def st_allele(self, request, pk=None):
         result, qt = timeit(
             get_mlst_allele_matches,
@@ -448,6 +551,7 @@ class SampleViewSet(CustomReadOnlyModelViewSet):
         return self.formatted_response(result, query_time=qt)
 
     @detail_route(methods=['get'])
+    @conditional()
     def cgmlst(self, request, pk=None):
         result, qt = timeit(
             get_cgmlst,
@@ -457,6 +561,7 @@ class SampleViewSet(CustomReadOnlyModelViewSet):
         return self.formatted_response(result, query_time=qt)
 
     @detail_route(methods=['get'])
+    @conditional()
     def variant_count(self, request, pk=None):
         result, qt = timeit(
             get_variant_counts,
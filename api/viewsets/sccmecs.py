@@ -2,6 +2,7 @@ from rest_framework import viewsets
 from rest_framework.response import Response
 from rest_framework.decorators import list_route
 
+from api.etags import ConditionalCatalogMixin
 from api.pagination import CustomReadOnlyModelViewSet
 from api.queries.sccmecs import (
     get_sccmec_primers_by_sample,
@@ -18,9 +19,11 @@ from api.validators import validate_list_of_ids
 from sccmec.models import Cassette, Coverage, Proteins
 
 
-class SCCmecCassetteViewSet(viewsets.ReadOnlyModelViewSet):
+class SCCmecCassetteViewSet(ConditionalCatalogMixin,
+                            viewsets.ReadOnlyModelViewSet):
     """A simple ViewSet for listing or retrieving SCCmec cassettes."""
 
+    catalog = 'sccmec'
     queryset = Cassette.objects.all()
     serializer_class = SCCmecCassetteSerializer
 
@@ -55,7 +58,8 @@ class SCCmecCoverageViewSet(CustomReadOnlyModelViewSet):
             else:
                 return self.formatted_response(get_sccmec_coverage_by_sample(
                     request.data['ids'],
-                    request.user.pk
+                    request.user.pk,
+                    fields=self.get_fields()
                 ))
 
 
@@ -91,7 +95,8 @@ class SCCmecPrimerViewSet(CustomReadOnlyModelViewSet):
                     request.user.pk,
                     exact_hits=True if 'exact_hits' in request.GET else False,
                     predict=True if 'predict' in request.GET else False,
-                    hamming_distance=hamming
+                    hamming_distance=hamming,
+                    fields=self.get_fields()
                 ))
 
 
@@ -114,7 +119,8 @@ class SCCmecProteinViewSet(CustomReadOnlyModelViewSet):
             else:
                 return self.formatted_response(get_sccmec_proteins_by_sample(
                     request.data['ids'],
-                    request.user.pk
+                    request.user.pk,
+                    fields=self.get_fields()
                 ))
 
 
@@ -151,5 +157,6 @@ class SCCmecSubtypeViewSet(CustomReadOnlyModelViewSet):
                     is_subtypes=True,
                     exact_hits=True if 'exact_hits' in request.GET else False,
                     predict=True if 'predict' in request.GET else False,
-                    hamming_distance=hamming
+                    hamming_distance=hamming,
+                    fields=self.get_fields()
                 ))
@@ -35,6 +35,7 @@ class SequenceStatViewSet(CustomReadOnlyModelViewSet):
                 request.user.pk,
                 stage=stage,
                 qual_per_base=True if 'bases' in request.GET else False,
-                read_lengths=True if 'lengths' in request.GET else False
+                read_lengths=True if 'lengths' in request.GET else False,
+                fields=self.get_fields()
             )
             return self.formatted_response(result, query_time=qt)
@@ -5,7 +5,11 @@ from rest_framework.decorators import detail_route
 from rest_framework.response import Response
 
 from api.pagination import CustomReadOnlyModelViewSet
-from api.utils import query_database
+from api.queries.info import (
+    get_top_sequence_types,
+    get_top_sequencing_centers
+)
+from api.validators import validate_positive_integer
 
 class TopViewSet(CustomReadOnlyModelViewSet):
     """
@@ -35,22 +39,19 @@ class TopViewSet(CustomReadOnlyModelViewSet):
         """
         Stored metadata information for a given sample.
         """
-        total = pk
-        sql = """SELECT sequencing_center, count
-                 FROM top_sequencing_centers({0})""".format(total)
-
-        return self.formatted_response(query_database(sql))
+        validator = validate_positive_integer(pk)
+        if validator['has_errors']:
+            return Response(validator)
+        return self.formatted_response(get_top_sequencing_centers(int(pk)))
 
     @detail_route(methods=['get'])
     def sequence_types(self, request, pk=10):
         """
         Stored metadata information for a given sample.
         """
-        sql = """SELECT sequence_type as st, count
-                 FROM top_sequence_types()"""
         results = []
         total = 0
-        for row in query_database(sql):
+        for row in get_top_sequence_types():
             results.append({
                 'st': row['st'],
                 'count': row['count']
@@ -3,15 +3,20 @@ from rest_framework import viewsets
 from rest_framework.decorators import detail_route, list_route
 from rest_framework.response import Response
 
+from api.etags import ConditionalCatalogMixin
 from api.pagination import CustomReadOnlyModelViewSet
 from api.utils import format_results, get_ids_in_bulk
 from api.queries.variants import (
     get_variant_counts,
     get_variant_count_by_position,
+    get_variant_counts_page,
     get_samples_by_snp,
     get_samples_by_indel,
+    get_samples_by_variants,
     get_indels_by_sample,
     get_snps_by_sample,
+    iter_indels_by_sample,
+    iter_snps_by_sample,
     get_variant_counts_by_samples,
     get_representative_sequence,
     get_variant_annotation
@@ -77,6 +82,9 @@ class VariantCountsViewSet(CustomReadOnlyModelViewSet):
                 is_annotation=True
             )
             return self.formatted_response(results, query_time=qt)
+        elif 'cursor' in request.GET:
+            return self.keyset_paginate(get_variant_counts_page,
+                                        keys=('position', 'id'), page_size=200)
         else:
             return self.paginate(Counts.objects.order_by('position'),
                                  serializer=VariantCountsSerializer,
@@ -118,7 +126,9 @@ class VariantViewSet(CustomReadOnlyModelViewSet):
     def snp_bulk_by_sample(self, request):
         """Given a list of SNP IDs, return table info for each SNP."""
         if request.method == 'POST':
-            validator = validate_list_of_ids(request.data, max_query=10)
+            validator = validate_list_of_ids(
+                request.data, max_query=self.max_query(10)
+            )
             if validator['has_errors']:
                 return Response({
                             "message": validator['message'],
@@ -165,12 +175,29 @@ class VariantViewSet(CustomReadOnlyModelViewSet):
                     start = None
                     end = None
 
+                if 'async' in request.GET:
+                    return self.job_response(
+                        'snps_by_sample', sample_id=request.data['ids'],
+                        annotation_id=annotation_id, start=start, end=end
+                    )
+
+                if 'stream' in request.GET:
+                    return self.streaming_response(iter_snps_by_sample(
+                        request.data['ids'],
+                        request.user.pk,
+                        annotation_id=annotation_id,
+                        start=start,
+                        end=end,
+                        fields=self.get_fields()
+                    ))
+
                 return self.formatted_response(get_snps_by_sample(
                     request.data['ids'],
                     request.user.pk,
                     annotation_id=annotation_id,
                     start=start,
-                    end=end
+                    end=end,
+                    fields=self.get_fields()
                 ))
 
         results, qt = timeit(
@@ -184,7 +211,9 @@ class VariantViewSet(CustomReadOnlyModelViewSet):
     def indel_bulk_by_sample(self, request):
         """Given a list of InDel IDs, return table info for each InDel."""
         if request.method == 'POST':
-            validator = validate_list_of_ids(request.data, max_query=500)
+            validator = validate_list_of_ids(
+                request.data, max_query=self.max_query(500)
+            )
             if validator['has_errors']:
                 return Response({
                             "message": validator['message'],
@@ -201,10 +230,25 @@ class VariantViewSet(CustomReadOnlyModelViewSet):
                     else:
                         annotation_id = request.GET['annotation_id']
 
+                if 'async' in request.GET:
+                    return self.job_response(
+                        'indels_by_sample', sample_id=request.data['ids'],
+                        annotation_id=annotation_id
+                    )
+
+                if 'stream' in request.GET:
+                    return self.streaming_response(iter_indels_by_sample(
+                        request.data['ids'],
+                        request.user.pk,
+                        annotation_id=annotation_id,
+                        fields=self.get_fields()
+                    ))
+
                 return self.formatted_response(get_indels_by_sample(
                     request.data['ids'],
                     request.user.pk,
-                    annotation_id=annotation_id
+                    annotation_id=annotation_id,
+                    fields=self.get_fields()
                 ))
 
     @list_route(methods=['post'])
@@ -223,6 +267,46 @@ class VariantViewSet(CustomReadOnlyModelViewSet):
                 request.user.pk
             ))
 
+    @list_route(methods=['post'])
+    def samples_with(self, request):
+        """
+        Return public samples carrying the given SNPs and InDels.
+
+        POST the ids as `snps` and `indels`, samples must carry all of them
+        (any of them with ?any). Samples carrying one of `exclude_snps` or
+        `exclude_indels` are left out. Use ?count for only the number of
+        samples.
+        """
+        if request.method == 'POST':
+            fields = ['snps', 'indels', 'exclude_snps', 'exclude_indels']
+            if not any(request.data.get(field) for field in fields[:2]):
+                return Response({
+                    "message": "SNP or InDel IDs must be in an array named "
+                               "snps or indels",
+                    "data": request.data
+                })
+            for field in fields:
+                if field in request.data:
+                    validator = validate_list_of_ids(request.data, field=field,
+                                                     max_query=100)
+                    if validator['has_errors']:
+                        return Response({
+                            "message": validator['message'],
+                            "data": request.data
+                        })
+
+            results, qt = timeit(
+                get_samples_by_variants,
+                request.user.pk,
+                snp_id=request.data.get('snps'),
+                indel_id=request.data.get('indels'),
+                exclude_snp_id=request.data.get('exclude_snps'),
+                exclude_indel_id=request.data.get('exclude_indels'),
+                match_any='any' in request.GET,
+                count='count' in request.GET
+            )
+            return self.formatted_response(results, query_time=qt)
+
 
 class SNPViewSet(CustomReadOnlyModelViewSet):
     """A simple ViewSet for listing or retrieving SNP."""
@@ -296,7 +380,9 @@ class SNPViewSet(CustomReadOnlyModelViewSet):
     def bulk_by_sample(self, request):
         """Given a list of SNP IDs, return table info for each SNP."""
         if request.method == 'POST':
-            validator = validate_list_of_ids(request.data, max_query=10)
+            validator = validate_list_of_ids(
+                request.data, max_query=self.max_query(10)
+            )
             if validator['has_errors']:
                 return Response({
                     "message": validator['message'],
@@ -313,10 +399,25 @@ class SNPViewSet(CustomReadOnlyModelViewSet):
                     else:
                         annotation_id = request.GET['annotation_id']
 
+                if 'async' in request.GET:
+                    return self.job_response(
+                        'snps_by_sample', sample_id=request.data['ids'],
+                        annotation_id=annotation_id
+                    )
+
+                if 'stream' in request.GET:
+                    return self.streaming_response(iter_snps_by_sample(
+                        request.data['ids'],
+                        request.user.pk,
+                        annotation_id=annotation_id,
+                        fields=self.get_fields()
+                    ))
+
                 return self.formatted_response(get_snps_by_sample(
                     request.data['ids'],
                     request.user.pk,
-                    annotation_id=annotation_id
+                    annotation_id=annotation_id,
+                    fields=self.get_fields()
                 ))
 
 
@@ -375,7 +476,9 @@ class InDelViewSet(CustomReadOnlyModelViewSet):
     def bulk_by_sample(self, request):
         """Given a list of InDel IDs, return table info for each InDel."""
         if request.method == 'POST':
-            validator = validate_list_of_ids(request.data, max_query=500)
+            validator = validate_list_of_ids(
+                request.data, max_query=self.max_query(500)
+            )
             if validator['has_errors']:
                 return Response({
                             "message": validator['message'],
@@ -392,10 +495,25 @@ class InDelViewSet(CustomReadOnlyModelViewSet):
                     else:
                         annotation_id = request.GET['annotation_id']
 
+                if 'async' in request.GET:
+                    return self.job_response(
+                        'indels_by_sample', sample_id=request.data['ids'],
+                        annotation_id=annotation_id
+                    )
+
+                if 'stream' in request.GET:
+                    return self.streaming_response(iter_indels_by_sample(
+                        request.data['ids'],
+                        request.user.pk,
+                        annotation_id=annotation_id,
+                        fields=self.get_fields()
+                    ))
+
                 return self.formatted_response(get_indels_by_sample(
                     request.data['ids'],
                     request.user.pk,
-                    annotation_id=annotation_id
+                    annotation_id=annotation_id,
+                    fields=self.get_fields()
                 ))
 
 class VariantAnnotationViewSet(CustomReadOnlyModelViewSet):
@@ -467,29 +585,37 @@ class VariantAnnotationViewSet(CustomReadOnlyModelViewSet):
             return self.formatted_response(results, query_time=time)
 
 
-class CommentViewSet(viewsets.ReadOnlyModelViewSet):
+class CommentViewSet(ConditionalCatalogMixin,
+                     viewsets.ReadOnlyModelViewSet):
     """A simple ViewSet for listing or retrieving SNP."""
 
+    catalog = 'variant'
     queryset = Comment.objects.all()
     serializer_class = CommentSerializer
 
 
-class FeatureViewSet(viewsets.ReadOnlyModelViewSet):
+class FeatureViewSet(ConditionalCatalogMixin,
+                     viewsets.ReadOnlyModelViewSet):
     """A simple ViewSet for listing or retrieving SNP."""
 
+    catalog = 'variant'
     queryset = Feature.objects.all()
     serializer_class = FeatureSerializer
 
 
-class FilterViewSet(viewsets.ReadOnlyModelViewSet):
+class FilterViewSet(ConditionalCatalogMixin,
+                    viewsets.ReadOnlyModelViewSet):
     """A simple ViewSet for listing or retrieving SNP."""
 
+    catalog = 'variant'
     queryset = Filter.objects.all()
     serializer_class = FilterSerializer
 
 
-class ReferenceViewSet(viewsets.ReadOnlyModelViewSet):
+class ReferenceViewSet(ConditionalCatalogMixin,
+                       viewsets.ReadOnlyModelViewSet):
     """A simple ViewSet for listing or retrieving SNP."""
 
+    catalog = 'variant'
     queryset = Reference.objects.all()
     serializer_class = ReferenceSerializer
@@ -11,6 +11,7 @@ from django.db import transaction
 from django.db.utils import IntegrityError
 from django.core.management.base import CommandError
 
+from api.cache import bump_generation
 from staphopia.utils import read_fasta, read_json, timeit
 from assembly.models import Contig, Sequence, Summary
 
@@ -186,6 +187,8 @@ def insert_assembly(sample, version, files, force=False):
             f'Please use --force to update stats. Error: {e}'
         ]))
 
+    bump_generation(sample.pk)
+
 
 def delete_assembly(sample, version):
     """Force update, so remove from table."""
@@ -10,6 +10,7 @@ from django.db import transaction
 from django.db.utils import IntegrityError
 from django.core.management.base import CommandError
 
+from api.cache import bump_generation
 from staphopia.utils import file_exists, read_json, timeit
 
 from cgmlst.models import CGMLST, Report, Loci
@@ -93,6 +94,8 @@ def insert_cgmlst(sample, version, files, force=False):
             f'Please use --force to update stats. Error: {e}'
         ]))
 
+    bump_generation(sample.pk)
+
 
 @transaction.atomic
 def delete_cgmlst(sample, version):
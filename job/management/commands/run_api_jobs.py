@@ -0,0 +1,48 @@
+"""Run queued API jobs with a pool of worker processes."""
+from multiprocessing import Process
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from job.tools import expire_jobs, requeue_jobs, work_on_jobs
+
+
+class Command(BaseCommand):
+    """Run queued API jobs with a pool of worker processes."""
+
+    help = 'Run queued API jobs with a pool of worker processes.'
+
+    def add_arguments(self, parser):
+        """Command line arguements."""
+        parser.add_argument('--workers', metavar='INT', type=int,
+                            default=settings.API_JOB_WORKERS,
+                            help=('Number of worker processes. (Default: '
+                                  f'{settings.API_JOB_WORKERS})'))
+        parser.add_argument('--poll', metavar='FLOAT', type=float,
+                            default=settings.API_JOB_POLL_SECONDS,
+                            help=('Seconds to wait between checks for new '
+                                  'jobs. (Default: '
+                                  f'{settings.API_JOB_POLL_SECONDS})'))
+        parser.add_argument('--once', action='store_true',
+                            help='Exit once there are no queued jobs.')
+        parser.add_argument('--requeue', action='store_true',
+                            help=('Queue jobs left running by a previous '
+                                  'run that did not exit cleanly.'))
+
+    def handle(self, *args, **opts):
+        """Start the workers and wait for them to exit."""
+        if opts['requeue']:
+            print(f'Requeued {requeue_jobs()} job(s)')
+        print(f'Expired {expire_jobs()} job(s)')
+
+        # Each worker must open its own database connection
+        connections.close_all()
+        workers = [
+            Process(target=work_on_jobs, args=(opts['poll'], opts['once']))
+            for i in range(opts['workers'])
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
@@ -0,0 +1,29 @@
+from django.db import models
+from django.contrib.auth.models import User
+from django.contrib.postgres.fields import JSONField
+
+
+class Job(models.Model):
+    """A bulk API request run in the background (see job/tools.py)."""
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    FINISHED = 'finished'
+    FAILED = 'failed'
+    STATUSES = (
+        (QUEUED, 'Queued'),
+        (RUNNING, 'Running'),
+        (FINISHED, 'Finished'),
+        (FAILED, 'Failed'),
+    )
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    query = models.TextField()
+    arguments = JSONField()
+    status = models.CharField(max_length=8, choices=STATUSES, default=QUEUED,
+                              db_index=True)
+    count = models.PositiveIntegerField(null=True)
+    error = models.TextField(blank=True)
+    path = models.TextField(blank=True)
+    created = models.DateTimeField(auto_now_add=True)
+    started = models.DateTimeField(null=True)
+    finished = models.DateTimeField(null=True)
@@ -0,0 +1,159 @@
+"""
+Useful functions associated with background API jobs.
+
+Bulk API routes given ?async queue a Job instead of running their query in
+a uwsgi worker. The run_api_jobs command claims queued jobs and writes the
+results, in the same JSON format as a streamed response, to a gzip file under
+API_JOB_DIR.
+
+To use:
+from job.tools import submit_job, run_job, etc...
+"""
+from datetime import timedelta
+import gzip
+import os
+import time
+import traceback
+
+from django.conf import settings
+from django.db import Error, close_old_connections, transaction
+from django.utils import timezone
+
+from api.queries.kmers import get_kmer_by_partition
+from api.queries.samples import get_samples
+from api.queries.variants import iter_indels_by_sample, iter_snps_by_sample
+from api.utils import stream_results
+from job.models import Job
+
+
+def get_samples_by_id(user_id, sample_ids):
+    return get_samples(user_id, sample_ids=sample_ids, stream=True)
+
+
+def get_kmers_by_partition(user_id, partition, kmers, samples):
+    return get_kmer_by_partition(partition, kmers, set(samples))
+
+
+# Queries that can be run as a job, called with the job's user_id and
+# arguments
+JOBS = {
+    'samples': get_samples_by_id,
+    'snps_by_sample': iter_snps_by_sample,
+    'indels_by_sample': iter_indels_by_sample,
+    'kmers_by_partition': get_kmers_by_partition
+}
+
+
+def submit_job(query, user_id, **arguments):
+    """Queue a query (a key of JOBS) to be run by run_api_jobs."""
+    if query not in JOBS:
+        raise ValueError(f'{query} is not a valid job query')
+    return Job.objects.create(user_id=user_id, query=query,
+                              arguments=arguments)
+
+
+def get_job_path(job):
+    return os.path.join(settings.API_JOB_DIR, f'{job.pk}.json.gz')
+
+
+def claim_job():
+    """Mark the oldest queued job as running and return it, None if empty."""
+    with transaction.atomic():
+        job = Job.objects.select_for_update(skip_locked=True).filter(
+            status=Job.QUEUED
+        ).order_by('id').first()
+        if job:
+            job.status = Job.RUNNING
+            job.started = timezone.now()
+            job.save(update_fields=['status', 'started'])
+    return job
+
+
+def run_job(job):
+    """Run a job, writing its results to a gzip compressed JSON file."""
+    count = 0
+
+    def counted(results):
+        nonlocal count
+        for result in results:
+            count += 1
+            yield result
+
+    path = get_job_path(job)
+    try:
+        os.makedirs(settings.API_JOB_DIR, exist_ok=True)
+        results = JOBS[job.query](user_id=job.user_id, **job.arguments)
+        # Write to a temporary file so a partial result is never downloaded
+        with gzip.open(f'{path}.tmp', 'wt', encoding='utf-8') as fh:
+            for chunk in stream_results(counted(results)):
+                fh.write(chunk)
+        os.rename(f'{path}.tmp', path)
+        job.status = Job.FINISHED
+        job.count = count
+        job.path = path
+    except Exception as e:
+        traceback.print_exc()
+        job.status = Job.FAILED
+        job.error = f'{type(e).__name__}: {e}'
+        if os.path.exists(f'{path}.tmp'):
+            os.remove(f'{path}.tmp')
+        # Replace the connection if the query's error left it unusable
+        close_old_connections()
+
+    job.finished = timezone.now()
+    try:
+        job.save()
+    except Error:
+        # Left running, run_api_jobs --requeue queues it again
+        traceback.print_exc()
+    return job
+
+
+def work_on_jobs(poll=5, once=False):
+    """
+    Run queued jobs until interrupted, or the queue is empty if once.
+
+    Expired jobs are deleted every API_JOB_EXPIRE_SECONDS. A job that can
+    not be saved is reported and left running, the worker moves on.
+    """
+    last_expired = time.time()
+    while True:
+        # Workers are long lived, replace connections that were closed by
+        # the server or reached CONN_MAX_AGE
+        close_old_connections()
+        if time.time() - last_expired >= settings.API_JOB_EXPIRE_SECONDS:
+            print(f'Expired {expire_jobs()} job(s)')
+            last_expired = time.time()
+
+        job = claim_job()
+        if job:
+            print(f'Running job {job.pk} ({job.query})')
+            job = run_job(job)
+            print(f'Job {job.pk} {job.status} ({job.count} results)')
+        elif once:
+            return
+        else:
+            time.sleep(poll)
+
+
+def requeue_jobs():
+    """Queue jobs left running, e.g. by a worker that was killed."""
+    return Job.objects.filter(status=Job.RUNNING).update(
+        status=Job.QUEUED, started=None
+    )
+
+
+def expire_jobs(days=None):
+    """Delete jobs (and their results) that finished more than `days` ago."""
+    days = days or settings.API_JOB_EXPIRE_DAYS
+    expired = Job.objects.filter(
+        finished__lt=timezone.now() - timedelta(days=days)
+    )
+    for job in expired:
+        if job.path:
+            try:
+                os.remove(job.path)
+            except FileNotFoundError:
+                # Removed by another worker expiring jobs
+                pass
+    return expired.delete()[0]
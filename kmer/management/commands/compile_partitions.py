@@ -0,0 +1,25 @@
+"""Precompile the kmer partition table read by kmer.partitions."""
+from django.core.management.base import BaseCommand
+
+from kmer.partitions import MEMBERS, TABLE, compile_table
+
+
+class Command(BaseCommand):
+    """Precompile the kmer partition table read by kmer.partitions."""
+
+    help = 'Precompile the kmer partition table read by kmer.partitions.'
+
+    def add_arguments(self, parser):
+        """Command line arguements."""
+        parser.add_argument('--members', metavar='FILE', default=MEMBERS,
+                            help=('Partition of each 7-mer (<child> '
+                                  '<parent>). (Default: '
+                                  'config/kmer_string-partition-members.txt)'))
+        parser.add_argument('--output', metavar='FILE', default=TABLE,
+                            help=('Table to write. '
+                                  '(Default: kmer/partitions.bin)'))
+
+    def handle(self, *args, **opts):
+        """Write the table of 7-mer partitions."""
+        total = compile_table(members=opts['members'], output=opts['output'])
+        print(f'Wrote partitions of {total} 7-mers to {opts["output"]}')
@@ -4,7 +4,7 @@ import time
 
 from django.core.management.base import BaseCommand
 
-from kmer.partitions import PARTITIONS
+from kmer.partitions import get_partitions
 
 ES_HOST = 'staphopia.emory.edu:9200'
 INDEX_MAPPING = {
@@ -33,7 +33,7 @@ class Command(BaseCommand):
     def handle(self, *args, **opts):
         """Create partitions."""
         parents = {}
-        for child, parent in PARTITIONS.items():
+        for child, parent in get_partitions().items():
             parents[parent] = True
 
         current = 1
@@ -5,7 +5,7 @@ from django.core.management.base import BaseCommand, CommandError
 from staphopia.utils import md5sum
 from sample.models import Sample
 
-from kmer.partitions import PARTITIONS
+from kmer.partitions import get_partitions
 from kmer.tools import (
     get_samples, format_sample_pk, jellyfish_dump, insert_kmer_stats
 )
@@ -32,6 +32,7 @@ class Command(BaseCommand):
         self.kmers = {}
         self.total_kmers = 0
         self.append = opts['append']
+        self.partitions = get_partitions()
         samples = get_samples(opts['project_dir'])
         total_samples = len(samples.keys())
         print('Found {0} samples, validating database existence...'.format(
@@ -67,7 +68,7 @@ class Command(BaseCommand):
     def open_file_handles(self, outdir):
         """Open filehandles."""
         self.fh = {}
-        for child, parent in PARTITIONS.items():
+        for child, parent in self.partitions.items():
             output = '{0}/{1}.txt'.format(outdir, parent)
             if self.append:
                 self.fh[parent] = open(output, 'a')
@@ -76,7 +77,7 @@ class Command(BaseCommand):
 
     def close_file_handles(self):
         """Close all open file handles."""
-        for child, parent in PARTITIONS.items():
+        for child, parent in self.partitions.items():
             self.fh[parent].close()
 
     def process_jellyfish(self, jf_file, sample_id):
@@ -91,7 +92,7 @@ class Command(BaseCommand):
 
             # Write kmers
             child = kmer[-7:]
-            parent = PARTITIONS[child]
+            parent = self.partitions[child]
             self.fh[parent].write('{0}\t{1}\n'.format(kmer, sample_name))
 
             total += 1
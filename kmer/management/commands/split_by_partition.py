@@ -4,7 +4,7 @@ import time
 
 from django.core.management.base import BaseCommand
 
-from kmer.partitions import PARTITIONS
+from kmer.partitions import get_partitions
 
 
 class Command(BaseCommand):
@@ -20,7 +20,8 @@ class Command(BaseCommand):
 
     def handle(self, *args, **opts):
         fh = {}
-        for child, parent in PARTITIONS.items():
+        partitions = get_partitions()
+        for child, parent in partitions.items():
             fh[parent] = open(
                 '{0}/{1}.txt'.format(opts['outdir'], parent), 'w'
             )
@@ -34,7 +35,7 @@ class Command(BaseCommand):
                 # Lets skip singletons for now!
                 if int(count) > 1:
                     child = kmer[-7:]
-                    parent = PARTITIONS[child]
+                    parent = partitions[child]
                     fh[parent].write('{0}\n'.format(kmer))
                     total += 1
                     # Process every 100k kmers
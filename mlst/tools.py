@@ -10,6 +10,7 @@ from django.db import transaction
 from django.db.utils import IntegrityError
 from django.core.management.base import CommandError
 
+from api.cache import bump_generation
 from staphopia.utils import file_exists, read_json, timeit
 
 from mlst.models import SequenceTypes, MLST, Report, Support
@@ -204,6 +205,8 @@ def insert_mlst(sample, version, files, force=False):
     insert_mlst_results(sample, version, st, novel)
     insert_report(sample, version, report)
 
+    bump_generation(sample.pk)
+
 
 @transaction.atomic
 def delete_mlst(sample, version):
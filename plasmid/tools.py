@@ -10,6 +10,7 @@ from django.db import transaction
 from django.db.utils import IntegrityError
 from django.core.management.base import CommandError
 
+from api.cache import bump_generation
 from assembly.tools import generate_assembly_stats
 from staphopia.utils import read_fasta, read_json, timeit
 
@@ -76,6 +77,8 @@ def insert_plasmid(sample, version, files, force=False):
     else:
         print(f'{sample.name} does not have a plasmid assembly, skipping.')
 
+    bump_generation(sample.pk)
+
 
 def delete_contigs(sample, version):
     """Force update, so remove from table."""
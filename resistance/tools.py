@@ -12,6 +12,7 @@ from django.db import transaction
 from django.db.utils import IntegrityError
 from django.core.management.base import CommandError
 
+from api.cache import bump_generation
 from staphopia.utils import read_fasta, timeit
 from resistance.models import Ariba, AribaSequence, Cluster, ResistanceClass
 
@@ -47,6 +48,8 @@ def insert_resistance(sample, version, files, force=False):
             f'Please use --force to update stats. Error: {e}'
         ]))
 
+    bump_generation(sample.pk)
+
 
 def get_clusters():
     """Get clusters."""
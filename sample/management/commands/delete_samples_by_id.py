@@ -2,6 +2,7 @@
 from django.db import transaction
 from django.core.management.base import BaseCommand, CommandError
 
+from api.cache import bump_generation
 from sample.models import (
     Sample, Metadata
 )
@@ -57,6 +58,7 @@ class Command(BaseCommand):
         self.delete_rows(sample_models, sample)
         print('\tDeleting Sample {0}'.format(sample.name))
         sample.delete()
+        bump_generation(opts['sample'])
 
     @transaction.atomic
     def delete_rows(self, models, sample):
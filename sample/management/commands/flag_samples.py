@@ -4,6 +4,7 @@ from django.db import connection
 from django.core.management.base import BaseCommand
 from django.contrib.auth.models import User
 
+from api.cache import invalidate_all
 from api.utils import query_database
 from api.queries.assemblies import get_assembly_stats
 from api.queries.samples import get_public_samples
@@ -221,3 +222,5 @@ class Command(BaseCommand):
                 unique[sample_id] = True
 
         print(f'\nTotal Samples Flagged: {len(unique)}')
+        if not opts['debug']:
+            invalidate_all()
@@ -0,0 +1,27 @@
+# Samples each user may see through the API, see api.utils.get_sample_permisions
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sample', '0008_auto_20180408_2314'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=[
+                """CREATE MATERIALIZED VIEW sample_visibility AS
+                   SELECT id AS sample_id, user_id, user_id=2 AS is_public
+                   FROM sample_sample;""",
+                """CREATE UNIQUE INDEX sample_visibility_sample_id
+                   ON sample_visibility (sample_id);""",
+                """CREATE INDEX sample_visibility_public
+                   ON sample_visibility (sample_id) WHERE is_public;""",
+                """CREATE INDEX sample_visibility_user
+                   ON sample_visibility (user_id, sample_id);""",
+            ],
+            reverse_sql=['DROP MATERIALIZED VIEW sample_visibility;']
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Keep sample_visibility as a table, updated with each sample by a trigger,
+# instead of a materialized view refreshed after every ingest
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sample', '0009_sample_visibility'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=[
+                'DROP MATERIALIZED VIEW sample_visibility;',
+                """CREATE TABLE sample_visibility (
+                       sample_id integer PRIMARY KEY,
+                       user_id integer NOT NULL,
+                       is_public boolean NOT NULL
+                   );""",
+                """INSERT INTO sample_visibility
+                   SELECT id, user_id, user_id=2
+                   FROM sample_sample;""",
+                """CREATE INDEX sample_visibility_public
+                   ON sample_visibility (sample_id) WHERE is_public;""",
+                """CREATE INDEX sample_visibility_user
+                   ON sample_visibility (user_id, sample_id);""",
+                """CREATE FUNCTION update_sample_visibility() RETURNS trigger
+                   AS $$
+                   BEGIN
+                       IF TG_OP <> 'INSERT' THEN
+                           DELETE FROM sample_visibility
+                           WHERE sample_id=OLD.id;
+                       END IF;
+                       IF TG_OP = 'DELETE' THEN
+                           RETURN OLD;
+                       END IF;
+                       INSERT INTO sample_visibility
+                       VALUES (NEW.id, NEW.user_id, NEW.user_id=2);
+                       RETURN NEW;
+                   END;
+                   $$ LANGUAGE plpgsql;""",
+                """CREATE TRIGGER sample_visibility
+                   AFTER INSERT OR DELETE OR UPDATE OF id, user_id
+                   ON sample_sample
+                   FOR EACH ROW
+                   EXECUTE PROCEDURE update_sample_visibility();""",
+            ],
+            reverse_sql=[
+                'DROP TRIGGER sample_visibility ON sample_sample;',
+                'DROP FUNCTION update_sample_visibility();',
+                'DROP TABLE sample_visibility;',
+                """CREATE MATERIALIZED VIEW sample_visibility AS
+                   SELECT id AS sample_id, user_id, user_id=2 AS is_public
+                   FROM sample_sample;""",
+                """CREATE UNIQUE INDEX sample_visibility_sample_id
+                   ON sample_visibility (sample_id);""",
+                """CREATE INDEX sample_visibility_public
+                   ON sample_visibility (sample_id) WHERE is_public;""",
+                """CREATE INDEX sample_visibility_user
+                   ON sample_visibility (user_id, sample_id);""",
+            ]
+        ),
+    ]
@@ -10,6 +10,7 @@ from django.db import connection, transaction
 from django.db.utils import IntegrityError
 from django.core.management.base import CommandError
 
+from api.cache import bump_generation
 from sample.models import Sample, MD5
 from tag.models import Tag, ToSample
 
@@ -260,11 +261,11 @@ def handle_sample(sample_info, username, skip_existing=False, force=False,
         else:
             print("Updated sample: {0} {1}".format(sample.id,
                                                    sample.name))
-            Sample.objects.filter(user=user, name=sample_info['name']).update(
-                name=sample_info['name'],
-                is_public=sample_info['is_public'],
-                is_published=sample_info['is_published']
-            )
+            # Saved, not updated, so variant members follow is_public (see
+            # variant.models)
+            sample.is_public = sample_info['is_public']
+            sample.is_published = sample_info['is_published']
+            sample.save()
     except Sample.DoesNotExist:
         # Create new sample
         try:
@@ -294,6 +295,7 @@ def handle_sample(sample_info, username, skip_existing=False, force=False,
                 'Error, unable to link Sample to Tag. {0}'.format(e)
             )
 
+    bump_generation(sample.pk)
     return sample
 
 
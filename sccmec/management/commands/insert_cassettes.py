@@ -4,6 +4,7 @@ import os.path
 from django.db import transaction
 from django.core.management.base import BaseCommand, CommandError
 
+from api.cache import bump_generation, catalog_stamp
 from sccmec.models import Cassette
 from staphopia.utils import read_fasta
 
@@ -53,3 +54,5 @@ class Command(BaseCommand):
             )
 
             print('{0}\t{1}'.format(header, created))
+
+        bump_generation(catalog_stamp('sccmec'))
@@ -12,6 +12,7 @@ from django.core.management.base import CommandError
 from django.db import transaction
 from django.db.utils import IntegrityError
 
+from api.cache import bump_generation
 from assembly.tools import get_contigs
 from sccmec.models import Cassette, Coverage, Proteins, Primers, Subtypes
 from staphopia.utils import gziplines, get_blast_query, read_json, timeit
@@ -33,6 +34,8 @@ def insert_sccmec(sample, version, files, force=False):
     insert_blast(sample, version, files['sccmec_proteins'], Proteins, contigs)
     insert_blast(sample, version, files['sccmec_subtypes'], Subtypes, contigs)
 
+    bump_generation(sample.pk)
+
 
 def delete_sccmec(sample, version):
     """Force update, so remove from table."""
@@ -10,6 +10,7 @@ from django.db import transaction
 from django.db.utils import IntegrityError
 from django.core.management.base import CommandError
 
+from api.cache import bump_generation
 from staphopia.utils import read_json, timeit
 from sample.models import Flag
 from sequence.models import Stage, Summary
@@ -89,6 +90,8 @@ def insert_sequence_stats(sample, version, files, force=False):
             f'Please use --force to update stats. Error: {e}'
         ]))
 
+    bump_generation(sample.pk)
+
 
 @transaction.atomic
 def delete_stats(sample, version):
@@ -0,0 +1,204 @@
+"""
+PostgreSQL backend keeping a pool of open connections in each process.
+
+Django opens a connection for each request and closes it at the end (with
+CONN_MAX_AGE = 0). With this backend closing returns the connection to a
+pool, and the next request reuses it instead of paying for a new connection
+(TCP, authentication and a new PostgreSQL backend).
+
+Enable it with ENGINE 'staphopia.db.backends.postgresql_pool'. The pool is
+configured by the optional POOL key of the database settings:
+
+    'POOL': {
+        'MAX_SIZE': 2,          # Open connections per process
+        'TIMEOUT': 30,          # Seconds to wait for a free connection
+        'HEALTH_CHECK_AGE': 60, # Check connections idle longer than this
+        'MAX_LIFETIME': 3600    # Reconnect connections older than this
+    }
+
+Pools are per process, so at most MAX_SIZE times the number of uwsgi
+processes connections are open.
+"""
+from collections import deque
+from functools import partial
+import os
+import threading
+import time
+
+from django.db.backends.postgresql.base import (
+    DatabaseWrapper as PostgresDatabaseWrapper
+)
+from django.db.utils import OperationalError
+
+from psycopg2 import extensions
+
+POOL_DEFAULTS = {
+    'MAX_SIZE': 2,
+    'TIMEOUT': 30,
+    'HEALTH_CHECK_AGE': 60,
+    'MAX_LIFETIME': 3600
+}
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+class PooledConnection(object):
+    """A psycopg2 connection with when it was opened and last returned."""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.created = time.time()
+        self.returned = self.created
+
+
+class ConnectionPool(object):
+    """Open connections for a database, shared by threads of a process."""
+
+    def __init__(self, max_size=2, timeout=30, health_check_age=60,
+                 max_lifetime=3600):
+        self.max_size = max_size
+        self.timeout = timeout
+        self.health_check_age = health_check_age
+        self.max_lifetime = max_lifetime
+        self.idle = deque()
+        self.in_use = {}
+        self.connecting = 0
+        self.available = threading.Condition()
+
+    @property
+    def size(self):
+        return len(self.idle) + len(self.in_use) + self.connecting
+
+    def get(self, connect):
+        """Return an idle (healthy) connection, or a new one from connect."""
+        deadline = time.time() + self.timeout
+        with self.available:
+            while True:
+                while self.idle:
+                    pooled = self.idle.pop()
+                    if self.is_healthy(pooled):
+                        self.in_use[id(pooled.connection)] = pooled
+                        return pooled.connection
+                    self.discard(pooled.connection)
+
+                if self.size < self.max_size:
+                    # Reserve the slot while connecting
+                    self.connecting += 1
+                    break
+
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise OperationalError(
+                        f'No database connection available after '
+                        f'{self.timeout}s, all {self.max_size} are in use.'
+                    )
+                self.available.wait(remaining)
+
+        try:
+            connection = connect()
+        except Exception:
+            with self.available:
+                self.connecting -= 1
+                self.available.notify()
+            raise
+
+        with self.available:
+            self.connecting -= 1
+            self.in_use[id(connection)] = PooledConnection(connection)
+        return connection
+
+    def put(self, connection):
+        """Reset a connection and make it available to the next request."""
+        pooled = self.in_use.get(id(connection))
+        if pooled is None:
+            connection.close()
+            return
+
+        try:
+            status = connection.get_transaction_status()
+            if status != extensions.TRANSACTION_STATUS_IDLE:
+                connection.rollback()
+            connection.autocommit = True
+            with connection.cursor() as cursor:
+                # Drop temporary tables, held cursors and session settings
+                cursor.execute('DISCARD ALL')
+        except Exception:
+            self.discard(connection)
+            return
+
+        with self.available:
+            del self.in_use[id(connection)]
+            if time.time() - pooled.created < self.max_lifetime:
+                pooled.returned = time.time()
+                self.idle.append(pooled)
+            else:
+                connection.close()
+            self.available.notify()
+
+    def discard(self, connection):
+        """Close a connection and free its slot."""
+        with self.available:
+            self.in_use.pop(id(connection), None)
+            self.available.notify()
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def is_healthy(self, pooled):
+        """Return False if a connection was closed or is too old."""
+        if pooled.connection.closed:
+            return False
+        elif time.time() - pooled.created >= self.max_lifetime:
+            return False
+        elif time.time() - pooled.returned >= self.health_check_age:
+            try:
+                with pooled.connection.cursor() as cursor:
+                    cursor.execute('SELECT 1')
+            except Exception:
+                return False
+        return True
+
+
+def get_pool(alias, settings_dict):
+    """Return this process's pool for a database."""
+    # Connections must not be shared with a forked (e.g. uwsgi) worker
+    key = (alias, os.getpid())
+    with _pools_lock:
+        if key not in _pools:
+            options = dict(POOL_DEFAULTS, **settings_dict.get('POOL', {}))
+            _pools[key] = ConnectionPool(
+                max_size=options['MAX_SIZE'],
+                timeout=options['TIMEOUT'],
+                health_check_age=options['HEALTH_CHECK_AGE'],
+                max_lifetime=options['MAX_LIFETIME']
+            )
+        return _pools[key]
+
+
+class DatabaseWrapper(PostgresDatabaseWrapper):
+    """PostgreSQL DatabaseWrapper returning closed connections to a pool."""
+
+    @property
+    def pool(self):
+        return get_pool(self.alias, self.settings_dict)
+
+    def get_new_connection(self, conn_params):
+        connection = self.pool.get(
+            partial(super().get_new_connection, conn_params)
+        )
+        self.isolation_level = self.settings_dict['OPTIONS'].get(
+            'isolation_level', connection.isolation_level
+        )
+        return connection
+
+    def _close(self):
+        if self.connection is None:
+            return
+        with self.wrap_database_errors:
+            if self.in_atomic_block:
+                # Django holds on to it until the transaction is rolled back
+                self.pool.discard(self.connection)
+            else:
+                self.pool.put(self.connection)
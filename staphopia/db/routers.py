@@ -0,0 +1,153 @@
+"""
+Route API reads to read replicas.
+
+Reads made while serving an API request (see ReadReplicaMiddleware in
+api/middleware.py) go to one of the API_READ_REPLICAS, everything else,
+including management commands, uses the primary ('default'). A replica is
+skipped while it lags more than API_REPLICA_MAX_LAG seconds behind the
+primary or can not be reached.
+
+To use:
+from staphopia.db.routers import get_read_database
+"""
+from contextlib import contextmanager
+import random
+import threading
+import time
+
+from django.conf import settings
+from django.db import connections
+
+PRIMARY = 'default'
+LAG_SQL = """SELECT CASE
+                 WHEN NOT pg_is_in_recovery() THEN 0
+                 WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn()
+                     THEN 0
+                 ELSE EXTRACT(EPOCH FROM
+                              now() - pg_last_xact_replay_timestamp())
+             END"""
+
+_local = threading.local()
+_lags = {}
+
+
+@contextmanager
+def use_replicas():
+    """Send reads within the block to a replica."""
+    previous = getattr(_local, 'enabled', False)
+    _local.enabled = True
+    try:
+        yield
+    finally:
+        _local.enabled = previous
+
+
+@contextmanager
+def read_from(alias):
+    """Send reads within the block to a given database."""
+    previous = getattr(_local, 'database', None)
+    _local.database = alias
+    try:
+        yield
+    finally:
+        _local.database = previous
+
+
+def check_lag(alias):
+    """Return seconds a replica is behind the primary, None if unreachable."""
+    connection = connections[alias]
+    if connection.vendor != 'postgresql':
+        return 0
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(LAG_SQL)
+            return float(cursor.fetchone()[0] or 0)
+    except Exception:
+        connection.close()
+        return None
+
+
+def get_lag(alias):
+    """Return the lag of a replica, checked at most every few seconds."""
+    checked, lag = _lags.get(alias, (0, None))
+    if time.time() - checked >= settings.API_REPLICA_CHECK_SECONDS:
+        lag = check_lag(alias)
+        _lags[alias] = (time.time(), lag)
+    return lag
+
+
+def is_replica(alias):
+    """Return True if a database is a read-only replica."""
+    return alias in settings.API_READ_REPLICAS
+
+
+def get_wal_position():
+    """Return the primary's WAL position in bytes, None if unknown."""
+    connection = connections[PRIMARY]
+    if connection.vendor != 'postgresql':
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_current_wal_lsn() - '0/0'::pg_lsn;")
+        return int(cursor.fetchone()[0])
+
+
+def has_replayed(alias, position):
+    """
+    Return True if reads from a database see the primary's writes up to a
+    WAL position (see get_wal_position).
+
+    The lag check of is_current is not enough: a replica that has not yet
+    received a commit has nothing left to replay, and looks current.
+    """
+    connection = connections[alias]
+    if alias == PRIMARY or connection.vendor != 'postgresql':
+        return True
+    elif position is None:
+        return is_current(alias)
+    try:
+        with connection.cursor() as cursor:
+            # NULL if the database is not in recovery, i.e. not a standby
+            cursor.execute("""SELECT pg_last_wal_replay_lsn() - '0/0'::pg_lsn
+                              >= %s;""", [position])
+            return cursor.fetchone()[0] is not False
+    except Exception:
+        connection.close()
+        return False
+
+
+def is_current(alias):
+    """Return True if reads from a database see the latest writes."""
+    return alias == PRIMARY or get_lag(alias) == 0
+
+
+def get_read_database():
+    """Return the database to read from, a healthy replica if enabled."""
+    if getattr(_local, 'database', None):
+        return _local.database
+    elif not getattr(_local, 'enabled', False):
+        return PRIMARY
+
+    replicas = [
+        alias for alias in settings.API_READ_REPLICAS
+        if get_lag(alias) is not None and
+        get_lag(alias) <= settings.API_REPLICA_MAX_LAG
+    ]
+    return random.choice(replicas) if replicas else PRIMARY
+
+
+class ReadReplicaRouter(object):
+    """Send reads to a replica during API requests, writes to the primary."""
+
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label in settings.API_REPLICA_EXCLUDE_APPS:
+            return PRIMARY
+        return get_read_database()
+
+    def db_for_write(self, model, **hints):
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == PRIMARY
@@ -0,0 +1,83 @@
+"""Compare response size and CPU cost of gzip and zstd per API endpoint."""
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.compression import COMPRESSORS, compress, compress_chunks
+from api.queries.assemblies import get_assembly_contigs, get_assembly_stats
+from api.queries.genes import get_genes_by_sample
+from api.queries.variants import get_snps_by_sample
+from api.renderers import JSONRenderer
+from api.utils import format_results, stream_results
+
+ENDPOINTS = {
+    'assembly': get_assembly_stats,
+    'contigs': get_assembly_contigs,
+    'genes': get_genes_by_sample,
+    'snps': get_snps_by_sample
+}
+
+
+def cpu_time(fun, *args, **kwargs):
+    """Return the results and CPU time in ms of a function."""
+    start_time = time.process_time()
+    results = fun(*args, **kwargs)
+    return [results, (time.process_time() - start_time) * 1000]
+
+
+class Command(BaseCommand):
+    """Compare response size and CPU cost of gzip and zstd per endpoint."""
+
+    help = 'Compare response size and CPU cost of gzip and zstd per endpoint.'
+
+    def add_arguments(self, parser):
+        """Command line arguements."""
+        parser.add_argument('samples', metavar='SAMPLES', type=str,
+                            help='Comma separated sample ids to query.')
+        parser.add_argument('--endpoints', metavar='STR', type=str,
+                            default=','.join(ENDPOINTS),
+                            help=('Comma separated endpoints to test. '
+                                  f'(Default: {",".join(ENDPOINTS)})'))
+        parser.add_argument('--levels', metavar='STR', type=str,
+                            default='gzip:1,gzip:6,gzip:9,zstd:1,zstd:3,'
+                                    'zstd:10',
+                            help='Comma separated encoding:level to test.')
+        parser.add_argument('--user_id', metavar='INT', type=int, default=2,
+                            help='User to query samples as. (Default: 2)')
+
+    def handle(self, *args, **opts):
+        """Print bytes on the wire and CPU ms to compress each response."""
+        sample_ids = [int(i) for i in opts['samples'].split(',')]
+        levels = []
+        for level in opts['levels'].split(','):
+            encoding, level = level.split(':')
+            if encoding not in COMPRESSORS:
+                print(f'Skipping {encoding}, it is not available')
+                continue
+            levels.append([encoding, int(level)])
+
+        print('\t'.join(['endpoint', 'encoding', 'level', 'bytes', 'ratio',
+                         'cpu ms', 'MB/s', 'streamed bytes',
+                         'streamed cpu ms']))
+        for endpoint in opts['endpoints'].split(','):
+            if endpoint not in ENDPOINTS:
+                raise CommandError(f'{endpoint} is not a valid endpoint, '
+                                   f'choose from {", ".join(ENDPOINTS)}')
+            results = ENDPOINTS[endpoint](sample_ids, opts['user_id'])
+            content, render = cpu_time(JSONRenderer().render,
+                                       format_results(results))
+            chunks = [c.encode() for c in stream_results(results)]
+            print(f'{endpoint}\tidentity\t-\t{len(content)}\t1.00\t'
+                  f'{render:.2f}\t-\t{sum(len(c) for c in chunks)}\t-')
+
+            for encoding, level in levels:
+                compressed, cpu = cpu_time(compress, content, encoding,
+                                           level=level)
+                streamed, stream_cpu = cpu_time(
+                    lambda: list(compress_chunks(chunks, encoding, level))
+                )
+                mb_per_sec = len(content) / 1024 / 1024 / (cpu / 1000 or 1e-9)
+                print(f'{endpoint}\t{encoding}\t{level}\t{len(compressed)}\t'
+                      f'{len(content) / len(compressed):.2f}\t{cpu:.2f}\t'
+                      f'{mb_per_sec:.1f}\t{sum(len(c) for c in streamed)}\t'
+                      f'{stream_cpu:.2f}')
@@ -0,0 +1,71 @@
+"""Compare per-request time with and without the connection pool."""
+import time
+
+from django.core.management.base import BaseCommand
+from django.core.signals import request_finished, request_started
+from django.db import connections
+from django.db.utils import load_backend
+
+from api.queries.tags import get_tags_by_sample
+
+ENGINES = [
+    ['direct', 'django.db.backends.postgresql'],
+    ['pooled', 'staphopia.db.backends.postgresql_pool']
+]
+
+
+def use_engine(engine):
+    """Replace this thread's default connection with one using engine."""
+    connections['default'].close()
+    settings_dict = dict(connections['default'].settings_dict, ENGINE=engine,
+                         CONN_MAX_AGE=0)
+    wrapper = load_backend(engine).DatabaseWrapper(settings_dict, 'default')
+    setattr(connections._connections, 'default', wrapper)
+    return wrapper
+
+
+def request(sample_id, user_id):
+    """Run the query of /api/sample/<id>/tags/ inside a request cycle."""
+    request_started.send(sender=__name__)
+    start_time = time.time()
+    get_tags_by_sample(sample_id, user_id)
+    query = (time.time() - start_time) * 1000
+    request_finished.send(sender=__name__)
+    return [query, (time.time() - start_time) * 1000]
+
+
+class Command(BaseCommand):
+    """Compare per-request time with and without the connection pool."""
+
+    help = 'Compare per-request time with and without the connection pool.'
+
+    def add_arguments(self, parser):
+        """Command line arguements."""
+        parser.add_argument('--sample_id', metavar='INT', type=int,
+                            default=1, help='Sample to query. (Default: 1)')
+        parser.add_argument('--user_id', metavar='INT', type=int, default=2,
+                            help='User to query as. (Default: 2)')
+        parser.add_argument('--requests', metavar='INT', type=int,
+                            default=200,
+                            help='Requests to time. (Default: 200)')
+
+    def handle(self, *args, **opts):
+        """Print median and 95th percentile request times of each engine."""
+        original = connections['default']
+        print('\t'.join(['engine', 'median ms', 'p95 ms',
+                         'median connect+query ms']))
+        for name, engine in ENGINES:
+            wrapper = use_engine(engine)
+            request(opts['sample_id'], opts['user_id'])
+            timings = sorted(
+                [request(opts['sample_id'], opts['user_id'])
+                 for i in range(opts['requests'])],
+                key=lambda timing: timing[1]
+            )
+            queries = sorted([timing[0] for timing in timings])
+            median = timings[len(timings) // 2][1]
+            p95 = timings[int(len(timings) * 0.95)][1]
+            print(f'{name}\t{median:.2f}\t{p95:.2f}\t'
+                  f'{queries[len(queries) // 2]:.2f}')
+            wrapper.close()
+        setattr(connections._connections, 'default', original)
@@ -0,0 +1,73 @@
+"""Compare query times of IN lists, int[] parameters and temp tables."""
+import json
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from api.utils import IdArray, temporary_ids
+
+
+def explain(sql, values=None, size=None):
+    """Return planning, execution and total (client side) time in ms."""
+    cursor = connection.cursor()
+    start_time = time.time()
+    with temporary_ids(cursor, values, size=size):
+        cursor.execute(f'EXPLAIN (ANALYZE, FORMAT JSON) {sql}', values)
+        plan = cursor.fetchone()[0]
+    total = (time.time() - start_time) * 1000
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return [plan[0]['Planning Time'], plan[0]['Execution Time'], total]
+
+
+class Command(BaseCommand):
+    """Compare plan and execution time of the ways to query a set of ids."""
+
+    help = 'Compare plan and execution time of the ways to query a set of ids.'
+
+    def add_arguments(self, parser):
+        """Command line arguements."""
+        parser.add_argument('--table', metavar='STR', type=str,
+                            default='assembly_summary',
+                            help='Table to query. (Default: assembly_summary)')
+        parser.add_argument('--column', metavar='STR', type=str,
+                            default='sample_id',
+                            help='Column to match ids. (Default: sample_id)')
+        parser.add_argument('--sizes', metavar='STR', type=str,
+                            default='1000,10000,100000',
+                            help='Comma separated number of ids to query.')
+        parser.add_argument('--repeat', metavar='INT', type=int, default=3,
+                            help='Times to repeat each query. (Default: 3)')
+
+    def handle(self, *args, **opts):
+        """Print the median timings of each method at each size."""
+        cursor = connection.cursor()
+        print('\t'.join(['ids', 'method', 'plan ms', 'execution ms',
+                         'total ms']))
+        for size in [int(i) for i in opts['sizes'].split(',')]:
+            cursor.execute(
+                f'SELECT {opts["column"]} FROM {opts["table"]} LIMIT %s',
+                [size]
+            )
+            ids = [row[0] for row in cursor.fetchall()]
+            # Pad with ids that do not exist to reach the requested size
+            ids += range(-1, -1 - (size - len(ids)), -1)
+
+            sql = f'SELECT * FROM {opts["table"]} WHERE {opts["column"]} IN'
+            methods = [
+                ('in-list', [f'{sql} ({",".join([str(i) for i in ids])})',
+                             None, None]),
+                ('int[]', [f'{sql} %s', [IdArray(ids)], size]),
+                ('temp-table', [f'{sql} %s', [IdArray(ids)], 0])
+            ]
+            for method, (query, values, temp_size) in methods:
+                timings = sorted(
+                    [explain(query, values, size=temp_size)
+                     for i in range(opts['repeat'])],
+                    key=lambda timing: timing[2]
+                )
+                plan, execution, total = timings[len(timings) // 2]
+                print(f'{size}\t{method}\t{plan:.2f}\t{execution:.2f}\t'
+                      f'{total:.2f}')
@@ -0,0 +1,95 @@
+"""Compare memory and speed of per-row OrderedDicts against shared Rows."""
+from collections import OrderedDict
+import gc
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from api.queries.variants import SNP_COLUMNS
+from api.utils import JSONEncoder, Row, column_index, get_sample_permisions
+
+
+def synthetic_rows(total):
+    """Return tuples shaped like a bulk SNP result."""
+    cols = list(SNP_COLUMNS)
+    rows = []
+    for i in range(total):
+        rows.append(tuple(
+            i if n % 3 else f'{col}_{i % 1000}' for n, col in enumerate(cols)
+        ))
+    return cols, rows
+
+
+def fetch_rows(sql):
+    """Return the columns and raw tuples of a query."""
+    cursor = connection.cursor()
+    cursor.execute(get_sample_permisions(sql))
+    return [d[0] for d in cursor.description], cursor.fetchall()
+
+
+def as_ordered_dicts(cols, rows):
+    return [OrderedDict(zip(cols, row)) for row in rows]
+
+
+def as_rows(cols, rows):
+    index = column_index(cols)
+    return [Row(index, row) for row in rows]
+
+
+def measure(build, cols, rows):
+    """Return bytes per row, rows/sec to build and rows/sec to encode."""
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    results = build(cols, rows)
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del results
+
+    gc.collect()
+    start_time = time.time()
+    results = build(cols, rows)
+    build_time = time.time() - start_time
+
+    encoder = JSONEncoder(separators=(',', ':'))
+    start_time = time.time()
+    for result in results:
+        encoder.encode(result)
+    encode_time = time.time() - start_time
+
+    total = len(rows) or 1
+    return [
+        used / total,
+        total / build_time if build_time else 0,
+        total / encode_time if encode_time else 0
+    ]
+
+
+class Command(BaseCommand):
+    """Compare memory and speed of per-row OrderedDicts against Rows."""
+
+    help = 'Compare memory and speed of per-row OrderedDicts against Rows.'
+
+    def add_arguments(self, parser):
+        """Command line arguements."""
+        parser.add_argument('--rows', metavar='INT', type=int, default=100000,
+                            help='Number of synthetic rows. (Default: 100000)')
+        parser.add_argument('--sql', metavar='STR', type=str,
+                            help='Benchmark the results of a query instead.')
+
+    def handle(self, *args, **opts):
+        """Print bytes per row and rows/sec for each row type."""
+        if opts['sql']:
+            cols, rows = fetch_rows(opts['sql'])
+        else:
+            cols, rows = synthetic_rows(opts['rows'])
+
+        print(f'{len(rows)} rows, {len(cols)} columns')
+        print('\t'.join(['type', 'bytes/row', 'build rows/sec',
+                         'encode rows/sec']))
+        for name, build in [('OrderedDict', as_ordered_dicts),
+                            ('Row', as_rows)]:
+            per_row, build_rate, encode_rate = measure(build, cols, rows)
+            print(f'{name}\t{per_row:.1f}\t{build_rate:.0f}\t{encode_rate:.0f}')
@@ -0,0 +1,110 @@
+"""
+Time how long a fresh API worker takes to answer its first request.
+
+Each worker is a new interpreter, like a respawned uWSGI worker, that loads
+staphopia.wsgi and sends two requests through the WSGI application. The
+first request also imports the URLconf, and with it every viewset.
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+# Run by each worker, prints the absolute time of each step as JSON
+WORKER = """
+import json, resource, sys, time
+from io import BytesIO
+start = time.time()
+path, host, token = sys.argv[1:4]
+
+import django
+django.setup()
+setup = time.time()
+
+from staphopia.wsgi import application
+wsgi = time.time()
+
+def request():
+    environ = {
+        'REQUEST_METHOD': 'GET', 'PATH_INFO': path.split('?')[0],
+        'QUERY_STRING': path.partition('?')[2], 'SERVER_NAME': host,
+        'SERVER_PORT': '80', 'HTTP_HOST': host, 'wsgi.url_scheme': 'http',
+        'wsgi.input': BytesIO(), 'wsgi.errors': sys.stderr
+    }
+    if token:
+        environ['HTTP_AUTHORIZATION'] = f'Token {token}'
+    status = []
+    response = application(environ, lambda s, h, e=None: status.append(s))
+    b''.join(response)
+    response.close()
+    return int(status[0].split()[0])
+
+status = request()
+first = time.time()
+request()
+second = time.time()
+print(json.dumps({
+    'start': start, 'setup': setup, 'wsgi': wsgi, 'first': first,
+    'second': second, 'status': status,
+    'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+}))
+"""
+STEPS = [
+    ('interpreter', 'spawn', 'start'),
+    ('django.setup', 'start', 'setup'),
+    ('load wsgi', 'setup', 'wsgi'),
+    ('first request', 'wsgi', 'first'),
+    ('second request', 'first', 'second'),
+    ('time to first request', 'spawn', 'first')
+]
+
+
+class Command(BaseCommand):
+    """Time how long a fresh API worker takes to answer its first request."""
+
+    help = 'Time the startup and first request of fresh API workers.'
+
+    def add_arguments(self, parser):
+        """Command line arguements."""
+        parser.add_argument('--path', metavar='PATH', default='/api/',
+                            help='Path of the requests. (Default: /api/)')
+        parser.add_argument('--host', metavar='STR', default='localhost',
+                            help=('Host header, must be in ALLOWED_HOSTS. '
+                                  '(Default: localhost)'))
+        parser.add_argument('--token', metavar='STR', default='',
+                            help='API token to send the requests with.')
+        parser.add_argument('--workers', metavar='INT', type=int, default=8,
+                            help=('Workers to start, one at a time. '
+                                  '(Default: 8)'))
+
+    def handle(self, *args, **opts):
+        """Print the median time of each startup step in milliseconds."""
+        timings = {name: [] for name, begin, end in STEPS}
+        rss = []
+        for i in range(opts['workers']):
+            spawn = time.time()
+            worker = subprocess.run(
+                [sys.executable, '-c', WORKER, opts['path'], opts['host'],
+                 opts['token']],
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                env=dict(os.environ), universal_newlines=True
+            )
+            if worker.returncode:
+                raise CommandError(f'Worker failed:\n{worker.stderr}')
+
+            steps = json.loads(worker.stdout.strip().split('\n')[-1])
+            steps['spawn'] = spawn
+            for name, begin, end in STEPS:
+                timings[name].append((steps[end] - steps[begin]) * 1000)
+            rss.append(steps['peak_rss_mb'])
+            print(f'Worker {i + 1}: HTTP {steps["status"]}, first request '
+                  f'after {timings[STEPS[-1][0]][-1]:.0f}ms')
+
+        print(f'\nMedian of {opts["workers"]} workers (ms)')
+        for name, begin, end in STEPS:
+            print(f'{name}\t{statistics.median(timings[name]):.1f}')
+        print(f'peak RSS (MB)\t{statistics.median(rss):.1f}')
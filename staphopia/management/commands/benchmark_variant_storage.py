@@ -0,0 +1,161 @@
+"""
+Compare reading SNP calls from the call tables against the per-sample JSON.
+
+The JSON Variant.snp used to hold is rebuilt from variant_snpcall, for the
+samples benchmarked, into a temporary table. Each way of reading a sample's
+calls (all, by annotation, by region) is then timed both ways: parsing the
+JSON and filtering it in Python, and filtering variant_snpcall in the query.
+Use samples created by create_synthetic_data.
+"""
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from api.queries.variants import get_calls_sql
+from api.utils import IdArray, query_database, stream_query, temporary_ids
+from sample.models import Sample
+from sample.tools import get_user
+from variant.models import SNP
+
+# Rebuilds the JSON stored by insert_variants before the call tables
+JSON_SQL = """
+CREATE TEMPORARY TABLE benchmark_variant_json AS
+SELECT c.sample_id, jsonb_agg(jsonb_build_object(
+    'snp_id', c.snp_id, 'annotation_id', c.annotation_id,
+    'comment', c.comment_id, 'filter_id', c.filter_id,
+    'AC', jsonb_build_array(c.ac),
+    'AD', jsonb_build_array(c.ad_ref || ',' || c.ad_alt),
+    'AF', jsonb_build_array(c.af), 'DP', jsonb_build_array(c.dp),
+    'GQ', jsonb_build_array(c.gq::text), 'GT', jsonb_build_array(c.gt::text),
+    'MQ', jsonb_build_array(c.mq::text),
+    'PL', jsonb_build_array(c.pl_homref || ', ' || c.pl_het),
+    'QD', jsonb_build_array(COALESCE(c.qd::text, '.')),
+    'quality', c.quality::text
+) ORDER BY c.reference_position) AS snp
+FROM variant_snpcall AS c
+WHERE c.sample_id IN %s
+GROUP BY c.sample_id;
+"""
+
+
+def read_json(sample_ids, annotation_ids=None, start=None, end=None):
+    """Return the calls of samples, filtered from their JSON."""
+    if annotation_ids:
+        annotation_ids = set(annotation_ids)
+        keep = lambda snp: snp['annotation_id'] in annotation_ids
+    elif start and end:
+        snp_ids = set(row['id'] for row in query_database(
+            """SELECT id FROM variant_snp
+               WHERE reference_position BETWEEN %s AND %s;""",
+            values=[start, end], using=DEFAULT_DB_ALIAS
+        ))
+        keep = lambda snp: snp['snp_id'] in snp_ids
+    else:
+        keep = lambda snp: True
+
+    sql = """SELECT sample_id, snp
+             FROM benchmark_variant_json
+             WHERE sample_id IN %s;"""
+    return [
+        snp
+        for row in stream_query(sql, values=[IdArray(sample_ids)],
+                                batch_size=10, using=DEFAULT_DB_ALIAS)
+        for snp in row['snp'] if keep(snp)
+    ]
+
+
+def read_table(sample_ids, user_id, annotation_ids=None, start=None,
+               end=None):
+    """Return the calls of samples, filtered in variant_snpcall."""
+    sql, values = get_calls_sql('variant_snpcall', 'snp_id', sample_ids,
+                                annotation_id=annotation_ids, start=start,
+                                end=end)
+    return list(stream_query(sql, values=values, using=DEFAULT_DB_ALIAS,
+                             user_id=user_id))
+
+
+class Command(BaseCommand):
+    """Compare reading SNP calls from the call tables against the JSON."""
+
+    help = 'Compare reading SNP calls from the call tables against the JSON.'
+
+    def add_arguments(self, parser):
+        """Command line arguements."""
+        parser.add_argument('--user', metavar='USERNAME', default='ena',
+                            help='Owner of the samples. (Default: ena)')
+        parser.add_argument('--prefix', metavar='STR', default='synthetic',
+                            help=('Name prefix of the synthetic samples. '
+                                  '(Default: synthetic)'))
+        parser.add_argument('--ids', metavar='INT', type=int, default=100,
+                            help='Samples per query. (Default: 100)')
+        parser.add_argument('--repeat', metavar='INT', type=int, default=3,
+                            help='Times to run each query. (Default: 3)')
+        parser.add_argument('--start', metavar='INT', type=int,
+                            default=100000,
+                            help='Start of the region. (Default: 100000)')
+        parser.add_argument('--end', metavar='INT', type=int, default=150000,
+                            help='End of the region. (Default: 150000)')
+
+    def handle(self, *args, **opts):
+        """Print the median time of each read, both ways."""
+        user = get_user(opts['user'])
+        sample_ids = list(Sample.objects.filter(
+            user=user, name__startswith=f'{opts["prefix"]}_'
+        ).order_by('id').values_list('id', flat=True)[:opts['ids']])
+        if not sample_ids:
+            raise CommandError(f'No samples named {opts["prefix"]}_*, run '
+                               'create_synthetic_data')
+        annotation_ids = list(SNP.objects.order_by('id').values_list(
+            'annotation_id', flat=True
+        ).distinct()[:10])
+
+        cursor = connections[DEFAULT_DB_ALIAS].cursor()
+        values = [IdArray(sample_ids)]
+        with temporary_ids(cursor, values):
+            cursor.execute(JSON_SQL, values)
+        try:
+            sizes = query_database(
+                """SELECT
+                    (SELECT SUM(pg_column_size(snp))
+                     FROM benchmark_variant_json) AS json,
+                    (SELECT SUM(pg_column_size(c.*))
+                     FROM variant_snpcall AS c
+                     WHERE c.sample_id IN %s) AS calls;""",
+                values=[IdArray(sample_ids)], using=DEFAULT_DB_ALIAS
+            )[0]
+            print(f'{len(sample_ids)} samples, JSON '
+                  f'{(sizes["json"] or 0) / 1024 ** 2:.1f}MB, call rows '
+                  f'{(sizes["calls"] or 0) / 1024 ** 2:.1f}MB\n')
+
+            print('\t'.join(['read', 'calls', 'json (ms)', 'table (ms)',
+                             'speedup']))
+            for name, filters in [
+                ('sample', {}),
+                ('annotation', {'annotation_ids': annotation_ids}),
+                ('region', {'start': opts['start'], 'end': opts['end']})
+            ]:
+                json_ms, total = self.time_read(
+                    lambda: read_json(sample_ids, **filters), opts['repeat']
+                )
+                table_ms, table_total = self.time_read(
+                    lambda: read_table(sample_ids, user.pk, **filters),
+                    opts['repeat']
+                )
+                if total != table_total:
+                    raise CommandError(f'{name}: {total} calls in the JSON, '
+                                       f'{table_total} in the table')
+                print(f'{name}\t{total}\t{json_ms:.1f}\t{table_ms:.1f}\t'
+                      f'{json_ms / max(table_ms, 0.001):.1f}x')
+        finally:
+            cursor.execute('DROP TABLE IF EXISTS benchmark_variant_json;')
+
+    def time_read(self, read, repeat):
+        """Return the median time in milliseconds and the calls read."""
+        timings = []
+        for i in range(repeat):
+            start_time = time.time()
+            total = len(read())
+            timings.append((time.time() - start_time) * 1000)
+        return [statistics.median(timings), total]
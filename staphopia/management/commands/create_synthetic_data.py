@@ -0,0 +1,806 @@
+"""
+Populate the database with synthetic samples for benchmarking.
+
+Results are shaped like those of the ingest tools (e.g. the variant, annotation
+and SCCmec coverage JSONB), sized like a typical S. aureus genome. Contigs and
+genes are slices of a single random reference, so only the reference has to be
+generated. Run update_variant_members afterwards (it is run at the end unless
+--skip_members is given) to build the SNP/InDel member tables.
+"""
+from bisect import bisect
+from collections import Counter
+import hashlib
+import json
+import random
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from api.cache import invalidate_all
+from assembly.models import (
+    Contig, Sequence as AssemblySequence, Summary as AssemblySummary
+)
+from annotation.models import (
+    Annotation, Feature as AnnotationFeature, Inference, Repeat
+)
+from cgmlst.models import CGMLST, Loci, Report as CGMLSTReport
+from mlst.models import MLST, Report as MLSTReport, SequenceTypes, Support
+from plasmid.models import (
+    Contig as PlasmidContig, Sequence as PlasmidSequence,
+    Summary as PlasmidSummary
+)
+from publication.models import Publication, ToSample as PublicationToSample
+from resistance.models import (
+    Ariba as ResistanceAriba, AribaSequence as ResistanceSequence,
+    Cluster as ResistanceCluster, ResistanceClass
+)
+from sample.models import MD5, Metadata, MetadataFields, Sample
+from sample.tools import get_user
+from sccmec.models import Cassette, Coverage, Primers, Proteins, Subtypes
+from sccmec.tools import (
+    max_primer_hamming_distance, max_subtype_hamming_distance
+)
+from sequence.models import Stage, Summary as SequenceSummary
+from staphopia.utils import get_blast_query
+from tag.models import Tag, ToSample as TagToSample
+from variant.models import (
+    Annotation as VariantAnnotation, Comment, Counts, Feature, Filter, Indel,
+    IndelCall, Reference, SNP, SNPCall, Variant
+)
+from version.models import Version
+from virulence.models import (
+    Ariba as VirulenceAriba, AribaSequence as VirulenceSequence,
+    Cluster as VirulenceCluster
+)
+
+BASES = 'ACGT'
+AMINO_ACIDS = 'ACDEFGHIKLMNPQRSTVWY'
+CODONS = {
+    f'{a}{b}{c}': AMINO_ACIDS[(i * 7) % len(AMINO_ACIDS)]
+    for i, (a, b, c) in enumerate(
+        (a, b, c) for a in BASES for b in BASES for c in BASES
+    )
+}
+MLST_LOCI = ['arcC', 'aroE', 'glpF', 'gmk', 'pta', 'tpi', 'yqiL']
+RESISTANCE_CLASSES = [
+    'aminoglycosides', 'betalactams', 'fosfomycin', 'fusidicacid',
+    'glycopeptides', 'MLS', 'mupirocin', 'phenicols', 'quinolones',
+    'rifampicin', 'sulfonamides', 'tetracyclines', 'trimethoprim'
+]
+METADATA_FIELDS = [
+    'collection_date', 'country', 'host', 'isolation_source',
+    'sequencing_center', 'strain', 'study_accession', 'year'
+]
+VARIANT_FEATURES = ['CDS', 'inter_genic', 'rRNA', 'tRNA']
+STAGES = ['adapter', 'cleanup', 'ecc', 'original']
+
+
+def random_sequence(rng, length, alphabet=BASES):
+    return ''.join(rng.choices(alphabet, k=length))
+
+
+def skewed(rng, items, alpha=1.2):
+    """Pick an item, the first items far more often (like STs or SNPs)."""
+    index = int(len(items) * (rng.random() ** (alpha * 3)))
+    return items[min(index, len(items) - 1)]
+
+
+def percent(val):
+    return '{0:.2f}'.format(val * 100)
+
+
+def assembly_stats(lengths, base_percents):
+    """Return the fields of an assembly Summary for contigs of `lengths`."""
+    lengths = sorted(lengths, reverse=True)
+    total_bp = sum(lengths)
+    total_contig = len(lengths)
+    n50 = l50 = 0
+    running = 0
+    for i, length in enumerate(lengths):
+        running += length
+        if running >= total_bp / 2:
+            n50, l50 = length, i + 1
+            break
+
+    greater = {
+        key: sum(i > size for i in lengths)
+        for key, size in [('1k', 1000), ('10k', 10000), ('100k', 100000),
+                          ('1m', 1000000)]
+    }
+    return {
+        'total_contig': total_contig,
+        'total_contig_length': total_bp,
+        'min_contig_length': lengths[-1],
+        'median_contig_length': lengths[total_contig // 2],
+        'mean_contig_length': int(total_bp / total_contig),
+        'max_contig_length': lengths[0],
+        'n50_contig_length': n50,
+        'l50_contig_count': l50,
+        'ng50_contig_length': n50,
+        'lg50_contig_count': l50,
+        'contigs_greater_1k': greater['1k'],
+        'contigs_greater_10k': greater['10k'],
+        'contigs_greater_100k': greater['100k'],
+        'contigs_greater_1m': greater['1m'],
+        'percent_contigs_greater_1k': percent(greater['1k'] / total_contig),
+        'percent_contigs_greater_10k': percent(greater['10k'] / total_contig),
+        'percent_contigs_greater_100k': percent(
+            greater['100k'] / total_contig
+        ),
+        'percent_contigs_greater_1m': percent(greater['1m'] / total_contig),
+        'contig_percent_a': base_percents['A'],
+        'contig_percent_t': base_percents['T'],
+        'contig_percent_g': base_percents['G'],
+        'contig_percent_c': base_percents['C'],
+        'contig_percent_n': '0.00',
+        'contig_non_acgtn': '0.00',
+        'num_contig_non_acgtn': 0
+    }
+
+
+class Command(BaseCommand):
+    """Populate the database with synthetic samples for benchmarking."""
+
+    help = 'Populate the database with synthetic samples for benchmarking.'
+
+    def add_arguments(self, parser):
+        """Command line arguements."""
+        parser.add_argument('--samples', metavar='INT', type=int,
+                            default=1000,
+                            help='Samples to create. (Default: 1000)')
+        parser.add_argument('--user', metavar='USERNAME', default='ena',
+                            help=('Owner of the samples, ena samples are '
+                                  'public. (Default: ena)'))
+        parser.add_argument('--prefix', metavar='STR', default='synthetic',
+                            help=('Prefix of sample names, runs with the '
+                                  'same prefix add more samples. '
+                                  '(Default: synthetic)'))
+        parser.add_argument('--reference', metavar='REFERENCE',
+                            default='synthetic|NC_000000|',
+                            help=('Reference genome of the variants. '
+                                  '(Default: synthetic|NC_000000|)'))
+        parser.add_argument('--genome_size', metavar='INT', type=int,
+                            default=2800000,
+                            help='Reference genome size. (Default: 2800000)')
+        parser.add_argument('--genes', metavar='INT', type=int, default=2600,
+                            help='Genes per sample. (Default: 2600)')
+        parser.add_argument('--contigs', metavar='INT', type=int, default=60,
+                            help='Contigs per sample. (Default: 60)')
+        parser.add_argument('--snps', metavar='INT', type=int, default=10000,
+                            help='SNPs per sample. (Default: 10000)')
+        parser.add_argument('--indels', metavar='INT', type=int, default=250,
+                            help='InDels per sample. (Default: 250)')
+        parser.add_argument('--snp_catalog', metavar='INT', type=int,
+                            default=200000,
+                            help='Distinct SNPs. (Default: 200000)')
+        parser.add_argument('--indel_catalog', metavar='INT', type=int,
+                            default=20000,
+                            help='Distinct InDels. (Default: 20000)')
+        parser.add_argument('--batch_size', metavar='INT', type=int,
+                            default=50,
+                            help='Samples per transaction. (Default: 50)')
+        parser.add_argument('--seed', metavar='INT', type=int, default=42,
+                            help='Random seed. (Default: 42)')
+        parser.add_argument('--skip_members', action='store_true',
+                            help='Do not run update_variant_members.')
+
+    def handle(self, *args, **opts):
+        """Create the shared catalogs, then the samples in batches."""
+        self.opts = opts
+        self.rng = random.Random(opts['seed'])
+        self.user = get_user(opts['user'])
+
+        with transaction.atomic():
+            self.create_catalogs()
+
+        start = Sample.objects.filter(
+            user=self.user, name__startswith=f'{opts["prefix"]}_'
+        ).count()
+        self.positions = {}
+        for first in range(start, start + opts['samples'],
+                           opts['batch_size']):
+            last = min(first + opts['batch_size'], start + opts['samples'])
+            with transaction.atomic():
+                self.create_samples(range(first, last))
+            print(f'Created samples {first + 1}-{last}')
+
+        with transaction.atomic():
+            self.update_counts()
+            invalidate_all()
+
+        if not opts['skip_members']:
+            call_command('update_variant_members',
+                         reference=opts['reference'])
+
+    def create_catalogs(self):
+        """Create the reference and the tables shared by every sample."""
+        rng = self.rng
+        opts = self.opts
+        self.version, created = Version.objects.get_or_create(
+            repo='staphopia/synthetic', tag=f'{opts["prefix"]}-v1',
+            sha256=hashlib.sha256(opts['prefix'].encode()).hexdigest()
+        )
+
+        # Reference genome and its genes, contigs and genes are slices of it
+        self.genome = random_sequence(rng, opts['genome_size'])
+        counts = Counter(self.genome)
+        self.base_percents = {
+            base: percent(counts[base] / len(self.genome)) for base in BASES
+        }
+        self.reference, created = Reference.objects.get_or_create(
+            name=opts['reference'],
+            defaults={'length': len(self.genome), 'sequence': ''}
+        )
+        self.features = {
+            name: Feature.objects.get_or_create(
+                reference=self.reference, feature=name
+            )[0] for name in VARIANT_FEATURES
+        }
+        self.filter = Filter.objects.get_or_create(name='PASS')[0]
+        self.comments = [
+            Comment.objects.get_or_create(comment=comment)[0]
+            for comment in ['Synonymous', 'Nonsynonymous', 'Intergenic']
+        ]
+
+        gene_length = opts['genome_size'] // (opts['genes'] + 1)
+        self.genes = []
+        for i in range(opts['genes']):
+            start = i * gene_length + 1
+            end = start + int(gene_length * 0.85)
+            self.genes.append({
+                'locus_tag': f'SA{i + 1:04d}',
+                'start': start,
+                'end': end,
+                'strand': 1 if i % 3 else -1,
+                'type': 'RNA' if i % 100 == 99 else 'CDS',
+                'dna': self.genome[start - 1:end],
+            })
+        for gene in self.genes:
+            dna = gene['dna']
+            gene['protein'] = ''.join(
+                CODONS[dna[i:i + 3]] for i in range(0, len(dna) - 2, 3)
+            )
+
+        if not VariantAnnotation.objects.filter(
+                reference=self.reference).exists():
+            VariantAnnotation.objects.bulk_create([
+                VariantAnnotation(
+                    reference=self.reference, locus_tag=gene['locus_tag'],
+                    protein_id=f'NP_{i + 370000}.1',
+                    gene=f'gen{i % 1000}', product=f'protein {i % 700}',
+                    note='none', is_pseudo=0, start=gene['start'],
+                    end=gene['end'], strand=gene['strand']
+                ) for i, gene in enumerate(self.genes)
+            ], batch_size=5000)
+        annotations = {
+            a.locus_tag: a.pk for a in VariantAnnotation.objects.filter(
+                reference=self.reference
+            )
+        }
+        for gene in self.genes:
+            gene['annotation_id'] = annotations.get(gene['locus_tag'])
+
+        self.create_variant_catalog()
+
+        # Annotation inferences, shared by genes of every sample
+        self.annotation_features = [
+            AnnotationFeature.objects.get_or_create(feature=name)[0]
+            for name in ['CDS', 'tRNA', 'rRNA', 'repeat_region']
+        ]
+        Inference.objects.bulk_create([
+            Inference(inference=f'UniRef90_SYN{i:05d}',
+                      product=f'protein {i}', note='none', name=f'gen{i}')
+            for i in range(700)
+        ], ignore_conflicts=True)
+        self.inferences = list(Inference.objects.filter(
+            inference__startswith='UniRef90_SYN'
+        ).values_list('pk', flat=True))
+
+        # MLST and cgMLST
+        SequenceTypes.objects.bulk_create([
+            SequenceTypes(st=st, **{
+                loci.lower(): rng.randint(1, 300) for loci in MLST_LOCI
+            }) for st in range(1, 501)
+        ], ignore_conflicts=True)
+        self.support = Support.objects.get_or_create(
+            ariba=7, mentalist=0, blast=7
+        )[0]
+        Loci.objects.bulk_create([
+            Loci(name=f'SACOL{i:04d}') for i in range(1, 1862)
+        ], ignore_conflicts=True)
+        self.loci = list(Loci.objects.values_list('pk', flat=True))
+
+        # Resistance and virulence
+        classes = {
+            name: ResistanceClass.objects.get_or_create(name=name)[0]
+            for name in RESISTANCE_CLASSES
+        }
+        ResistanceCluster.objects.bulk_create([
+            ResistanceCluster(
+                name='mecA' if not i else f'res{i}',
+                resistance_class=RESISTANCE_CLASSES[
+                    i % len(RESISTANCE_CLASSES)
+                ] if i else 'betalactams',
+                mechanism='antibiotic target alteration',
+                ref_name=f'res{i}.ref', database='megares',
+                headers=f'res{i}.header'
+            ) for i in range(60)
+        ], ignore_conflicts=True)
+        self.resistance_clusters = [
+            (cluster, classes[cluster.resistance_class])
+            for cluster in ResistanceCluster.objects.filter(
+                ref_name__endswith='.ref'
+            )
+        ]
+        VirulenceCluster.objects.bulk_create([
+            VirulenceCluster(name=f'vir{i}', ref_name=f'vir{i}.ref',
+                             original_name=f'vir{i}')
+            for i in range(80)
+        ], ignore_conflicts=True)
+        self.virulence_clusters = list(VirulenceCluster.objects.filter(
+            ref_name__endswith='.ref'
+        ))
+
+        # SCCmec cassettes and BLAST queries
+        for i in range(1, 16):
+            Cassette.objects.get_or_create(
+                name=f'type{i}', header=f'synthetic_sccmec_{i}',
+                defaults={'length': rng.randint(20000, 60000),
+                          'meca_start': 1001, 'meca_stop': 3007,
+                          'meca_length': 2007}
+            )
+        self.cassettes = list(Cassette.objects.filter(
+            header__startswith='synthetic_sccmec_'
+        ))
+        self.primers = [
+            get_blast_query(title, length)
+            for title, length in max_primer_hamming_distance().items()
+        ]
+        self.subtypes = [
+            get_blast_query(title, length)
+            for title, length in max_subtype_hamming_distance().items()
+        ]
+        self.proteins = [
+            get_blast_query(f'sccmec_protein_{i}|protein {i}', 300 + i)
+            for i in range(20)
+        ]
+
+        # Sequencing stages, metadata, tags and publications
+        self.stages = [Stage.objects.get_or_create(name=name)[0]
+                       for name in STAGES]
+        for field in METADATA_FIELDS:
+            MetadataFields.objects.get_or_create(field=field)
+        self.tag = Tag.objects.get_or_create(
+            user=self.user, tag=opts['prefix'],
+            defaults={'comment': 'Synthetic samples for benchmarking.'}
+        )[0]
+        self.publications = [
+            Publication.objects.get_or_create(pmid=90000000 + i, defaults={
+                'authors': 'Synthetic A', 'title': f'Synthetic study {i}',
+                'abstract': 'Staphylococcus aureus', 'reference_ids': '',
+                'keywords': 'synthetic'
+            })[0] for i in range(20)
+        ]
+
+    def create_variant_catalog(self):
+        """Create the distinct SNPs and InDels samples are drawn from."""
+        rng = self.rng
+        opts = self.opts
+        if not SNP.objects.filter(reference=self.reference).exists():
+            positions = rng.sample(range(1, len(self.genome) - 3),
+                                   opts['snp_catalog'])
+            snps = []
+            for position in sorted(positions):
+                gene = self.gene_at(position)
+                ref = self.genome[position - 1]
+                alt = rng.choice([b for b in BASES if b != ref])
+                codon_position = 0
+                ref_codon = alt_codon = '.'
+                ref_aa = alt_aa = '.'
+                if gene:
+                    codon_position = (position - gene['start']) % 3
+                    start = position - codon_position - 1
+                    ref_codon = self.genome[start:start + 3]
+                    alt_codon = (ref_codon[:codon_position] + alt +
+                                 ref_codon[codon_position + 1:])
+                    ref_aa, alt_aa = CODONS[ref_codon], CODONS[alt_codon]
+                snps.append(SNP(
+                    reference=self.reference,
+                    annotation_id=self.annotation_near(position),
+                    feature=self.features['CDS' if gene else 'inter_genic'],
+                    reference_position=position, reference_base=ref,
+                    alternate_base=alt, reference_codon=ref_codon,
+                    alternate_codon=alt_codon,
+                    reference_amino_acid=ref_aa,
+                    alternate_amino_acid=alt_aa,
+                    codon_position=codon_position + 1 if gene else 0,
+                    snp_codon_position=codon_position + 1 if gene else 0,
+                    amino_acid_change=(f'{ref_aa}{position}{alt_aa}'
+                                       if gene else '.'),
+                    is_synonymous=int(ref_aa == alt_aa),
+                    is_transition=int({ref, alt} in [{'A', 'G'},
+                                                     {'C', 'T'}]),
+                    is_genic=int(bool(gene))
+                ))
+            SNP.objects.bulk_create(snps, batch_size=10000)
+
+        if not Indel.objects.filter(reference=self.reference).exists():
+            positions = rng.sample(range(1, len(self.genome) - 20),
+                                   opts['indel_catalog'])
+            indels = []
+            for position in sorted(positions):
+                ref = self.genome[position - 1]
+                is_deletion = rng.random() < 0.5
+                length = rng.randint(1, 12)
+                alt = ref + random_sequence(rng, length)
+                if is_deletion:
+                    ref, alt = self.genome[position - 1:position + length], ref
+                indels.append(Indel(
+                    reference=self.reference,
+                    annotation_id=self.annotation_near(position),
+                    feature=self.features[
+                        'CDS' if self.gene_at(position) else 'inter_genic'
+                    ],
+                    reference_position=position, reference_base=ref,
+                    alternate_base=alt, is_deletion=is_deletion
+                ))
+            Indel.objects.bulk_create(indels, batch_size=10000)
+
+        self.snps = list(SNP.objects.filter(reference=self.reference).values(
+            'id', 'annotation_id', 'reference_position', 'is_synonymous',
+            'is_genic'
+        ).order_by('id'))
+        self.indels = list(Indel.objects.filter(
+            reference=self.reference
+        ).values('id', 'annotation_id', 'reference_position').order_by('id'))
+
+    def gene_at(self, position):
+        gene_length = self.opts['genome_size'] // (self.opts['genes'] + 1)
+        gene = self.genes[min(position // gene_length, len(self.genes) - 1)]
+        return gene if gene['start'] <= position <= gene['end'] else None
+
+    def annotation_near(self, position):
+        gene_length = self.opts['genome_size'] // (self.opts['genes'] + 1)
+        return self.genes[
+            min(position // gene_length, len(self.genes) - 1)
+        ]['annotation_id']
+
+    def create_samples(self, indexes):
+        """Create a batch of samples and every result associated with them."""
+        rng = self.rng
+        samples = Sample.objects.bulk_create([
+            Sample(user=self.user, name=f'{self.opts["prefix"]}_{i + 1:07d}',
+                   is_public=True, is_published=rng.random() < 0.6)
+            for i in indexes
+        ])
+        if samples[0].pk is None:
+            # Only PostgreSQL returns the ids of bulk created rows
+            samples = list(Sample.objects.filter(
+                user=self.user, name__in=[s.name for s in samples]
+            ).order_by('id'))
+
+        rows = {}
+        for sample in samples:
+            for model, objects in self.sample_results(sample).items():
+                rows.setdefault(model, []).extend(objects)
+
+        for model, objects in rows.items():
+            model.objects.bulk_create(objects, batch_size=500)
+
+    def sample_results(self, sample):
+        """Return the unsaved results of a sample, by model."""
+        rng = self.rng
+        opts = self.opts
+        version = self.version
+        results = {}
+        common = {'sample': sample, 'version': version}
+
+        results[MD5] = [MD5(sample=sample, md5sum=hashlib.md5(
+            sample.name.encode()
+        ).hexdigest())]
+        results[TagToSample] = [TagToSample(sample=sample, tag=self.tag)]
+        if sample.is_published:
+            results[PublicationToSample] = [PublicationToSample(
+                sample=sample, publication=rng.choice(self.publications)
+            )]
+        year = rng.randint(2008, 2019)
+        results[Metadata] = [Metadata(sample=sample, history={}, metadata={
+            'collection_date': f'{year}-0{rng.randint(1, 9)}-15',
+            'country': rng.choice(['USA', 'UK', 'China', 'Denmark', 'Brazil']),
+            'host': 'Homo sapiens',
+            'isolation_source': rng.choice(['blood', 'nasal swab', 'wound']),
+            'sequencing_center': skewed(rng, [f'center {i}'
+                                              for i in range(100)]),
+            'strain': sample.name,
+            'study_accession': f'PRJNA{rng.randint(100000, 999999)}',
+            'year': str(year)
+        })]
+
+        # Sequencing quality, one row per cleanup stage
+        coverage = rng.uniform(20, 200)
+        results[SequenceSummary] = [SequenceSummary(
+            stage=stage, is_paired=True, rank=rng.choice([1, 2, 3]),
+            total_bp=int(coverage * opts['genome_size']),
+            coverage=f'{coverage:.2f}',
+            read_total=int(coverage * opts['genome_size'] / 150),
+            read_min=35, read_mean=145.2, read_std=12.1, read_median=150,
+            read_max=151, read_25th=150, read_75th=151,
+            read_lengths=json.dumps({str(i): rng.randint(0, 10000)
+                                     for i in range(35, 152)}),
+            qual_mean=35.1, qual_std=3.2, qual_median=37, qual_25th=34,
+            qual_75th=38,
+            qual_per_base=json.dumps({str(i): rng.randint(25, 40)
+                                      for i in range(1, 152)}),
+            **common
+        ) for stage in self.stages]
+
+        # Assembly, contigs are consecutive slices of the reference
+        cuts = sorted(rng.sample(range(1000, len(self.genome) - 1000),
+                                 opts['contigs'] - 1))
+        bounds = list(zip([0] + cuts, cuts + [len(self.genome)]))
+        fasta = {}
+        contigs = []
+        for i, (start, end) in enumerate(bounds):
+            node = str(i + 1)
+            spades = f'NODE_{node}_length_{end - start}_cov_{coverage:.6f}'
+            fasta[node] = self.genome[start:end]
+            contigs.append(Contig(
+                spades=spades, prokka=f'gnl|Staphopia|{sample.pk}_{node}',
+                staphopia=(f'{sample.pk}|{sample.name}|{node} '
+                           f'coverage={coverage:.6f} length={end - start} '
+                           f'analysis_version={version.tag}'),
+                **common
+            ))
+        results[Contig] = contigs
+        results[AssemblySequence] = [AssemblySequence(
+            fasta=fasta, graph={}, **common
+        )]
+        results[AssemblySummary] = [AssemblySummary(
+            **assembly_stats([e - s for s, e in bounds], self.base_percents),
+            **common
+        )]
+        if rng.random() < 0.3:
+            plasmid = random_sequence(rng, rng.randint(2000, 30000))
+            results[PlasmidContig] = [PlasmidContig(
+                spades=f'NODE_1_length_{len(plasmid)}_cov_{coverage:.6f}',
+                staphopia=f'{sample.pk}|{sample.name}|1', **common
+            )]
+            results[PlasmidSequence] = [PlasmidSequence(
+                fasta={'1': plasmid}, graph={}, **common
+            )]
+            results[PlasmidSummary] = [PlasmidSummary(
+                **assembly_stats([len(plasmid)], self.base_percents),
+                **common
+            )]
+
+        # Annotation, genes (less a few) of the reference
+        genes = [g for g in self.genes if rng.random() < 0.98]
+        genes = genes[:opts['genes']]
+        info = []
+        blast = []
+        for gene in genes:
+            contig = min(bisect(cuts, gene['start']) + 1, len(bounds))
+            info.append({
+                'contig': str(contig),
+                'locus_tag': gene['locus_tag'],
+                'start': gene['start'],
+                'end': gene['end'],
+                'strand': gene['strand'],
+                'phase': 0,
+                'type': gene['type'],
+                'CDS' if gene['type'] == 'CDS' else 'rRNA': True,
+                'inference': self.inferences[
+                    int(gene['locus_tag'][2:]) % len(self.inferences)
+                ]
+            })
+            blast.append({'locus_tag': gene['locus_tag'],
+                          'message': 'BLAST not applicable'})
+        results[Annotation] = [Annotation(
+            info=info,
+            gene={g['locus_tag']: g['dna'] for g in genes
+                  if g['type'] == 'CDS'},
+            protein={g['locus_tag']: g['protein'] for g in genes
+                     if g['type'] == 'CDS'},
+            rna={g['locus_tag']: g['dna'] for g in genes
+                 if g['type'] == 'RNA'},
+            blast=blast, **common
+        )]
+        results[Repeat] = [Repeat(repeat=[{
+            'contig': '1', 'source': 'minced', 'type': 'repeat_region',
+            'start': 1000, 'end': 1300, 'score': '.', 'strand': '.',
+            'phase': '.', 'note': 'CRISPR with 4 repeat units',
+            'family': 'CRISPR', 'rpt_type': 'direct'
+        }], **common)]
+
+        # MLST and cgMLST
+        st = skewed(rng, list(range(1, 501)))
+        results[MLST] = [MLST(st=st, ariba=st, mentalist=0, blast=st,
+                              support=self.support, **common)]
+        alleles = {loci: rng.randint(1, 300) for loci in MLST_LOCI}
+        results[MLSTReport] = [MLSTReport(
+            ariba={loci: str(a) for loci, a in alleles.items()},
+            mentalist={},
+            blast={loci: {'sseqid': f'{loci}.{a}', 'pident': 100.0,
+                          'length': 456, 'bitscore': 843}
+                   for loci, a in alleles.items()},
+            **common
+        )]
+        results[CGMLST] = [CGMLST(mentalist={
+            str(loci): rng.randint(1, 50) for loci in self.loci
+        }, **common)]
+        results[CGMLSTReport] = [CGMLSTReport(mentalist='', **common)]
+
+        # Resistance and virulence
+        hits = rng.sample(self.resistance_clusters, 8)
+        results[ResistanceAriba] = [ResistanceAriba(
+            results=[{
+                'id': i + 1, 'cluster_id': cluster.pk,
+                'cluster': cluster.name,
+                'resistance_class': cluster.resistance_class,
+                'resistance_class_id': r_class.pk, 'gene': '1',
+                'var_only': '0', 'flag': '27', 'reads': '120',
+                'ref_len': '1000', 'ref_base_assembled': '1000',
+                'pc_ident': '100.0', 'ctg_len': '1200', 'ctg_cov': '40.1'
+            } for i, (cluster, r_class) in enumerate(hits)],
+            summary=[{
+                'cluster_id': cluster.pk, 'cluster': cluster.name,
+                'resistance_class': cluster.resistance_class,
+                'assembled': 'yes', 'match': 'yes', 'ref_seq': cluster.name,
+                'pct_id': '100.0', 'ctg_cov': '40.1', 'known_var': 'no',
+                'novel_var': 'no'
+            } for cluster, r_class in hits],
+            **common
+        )]
+        results[ResistanceSequence] = [ResistanceSequence(sequences={
+            str(i + 1): {'id': i + 1, 'cluster_id': cluster.pk,
+                         'resistance_class_id': r_class.pk,
+                         'dna': self.genome[i * 1000:i * 1000 + 1000]}
+            for i, (cluster, r_class) in enumerate(hits)
+        }, **common)]
+        hits = rng.sample(self.virulence_clusters, 25)
+        results[VirulenceAriba] = [VirulenceAriba(
+            results=[{'id': i + 1, 'cluster': cluster.pk, 'gene': '1',
+                      'flag': '27', 'reads': '100', 'pc_ident': '99.5',
+                      'ctg_cov': '38.2'}
+                     for i, cluster in enumerate(hits)],
+            summary=[], **common
+        )]
+        results[VirulenceSequence] = [VirulenceSequence(sequences={
+            str(i + 1): {'id': i + 1, 'cluster': cluster.pk,
+                         'dna': self.genome[i * 800:i * 800 + 800]}
+            for i, cluster in enumerate(hits)
+        }, **common)]
+
+        # SCCmec, full coverage of one cassette and partial of the rest
+        mec = rng.choice(self.cassettes)
+        coverages = []
+        for cassette in self.cassettes:
+            covered = cassette.length
+            if cassette != mec:
+                covered = int(cassette.length * rng.uniform(0, 0.2))
+            depth = rng.randint(10, 80)
+            per_base = {
+                str(i): depth + (i * 7) % 23 for i in range(1, covered + 1)
+            }
+            depths = list(per_base.values()) or [0]
+            coverages.append(Coverage(
+                cassette=cassette,
+                total=f'{len(per_base) / cassette.length:.2f}',
+                minimum=min(depths) if cassette == mec else 0,
+                mean=f'{sum(depths) / cassette.length:.2f}',
+                median=sorted(depths)[len(depths) // 2],
+                maximum=max(depths),
+                meca_total='1.00' if cassette == mec else '0.00',
+                per_base_coverage=json.dumps(per_base, sort_keys=True),
+                **common
+            ))
+        results[Coverage] = coverages
+        for model, queries in [(Primers, self.primers),
+                               (Subtypes, self.subtypes),
+                               (Proteins, self.proteins)]:
+            results[model] = [self.blast_hit(model, query, common)
+                              for query in queries if rng.random() < 0.7]
+
+        # Variants, drawn from the catalogs with common ones more likely
+        snps = self.draw(self.snps, opts['snps'])
+        indels = self.draw(self.indels, opts['indels'])
+        for snp in snps:
+            key = snp['reference_position']
+            self.positions.setdefault(key, Counter())[
+                'synonymous' if snp['is_synonymous'] else
+                'nonsynonymous' if snp['is_genic'] else 'nongenic_snp'
+            ] += 1
+        for indel in indels:
+            self.positions.setdefault(
+                indel['reference_position'], Counter()
+            )['indel'] += 1
+        results[Variant] = [Variant(
+            reference=self.reference, snp_count=len(snps),
+            indel_count=len(indels), **common
+        )]
+        results[SNPCall] = [SNPCall(
+            snp_id=s['id'], annotation_id=s['annotation_id'],
+            reference_position=s['reference_position'],
+            comment=self.comments[
+                0 if s['is_synonymous'] else 1 if s['is_genic'] else 2
+            ], **self.call_fields(), **common
+        ) for s in snps]
+        results[IndelCall] = [IndelCall(
+            indel_id=i['id'], annotation_id=i['annotation_id'],
+            reference_position=i['reference_position'],
+            **self.call_fields(), **common
+        ) for i in indels]
+        return results
+
+    def draw(self, catalog, total):
+        """Return `total` distinct entries of a catalog, skewed to common."""
+        total = min(total, len(catalog))
+        common = catalog[:len(catalog) // 10]
+        chosen = {id(v): v for v in self.rng.sample(common, min(
+            len(common), total // 2
+        ))}
+        while len(chosen) < total:
+            entry = self.rng.choice(catalog)
+            chosen[id(entry)] = entry
+        return sorted(chosen.values(), key=lambda v: v['id'])
+
+    def call_fields(self):
+        """Return the VCF fields of a call, as stored by insert_variants."""
+        rng = self.rng
+        depth = rng.randint(10, 120)
+        return {
+            'filter': self.filter, 'ac': 2, 'ad_ref': 0, 'ad_alt': depth,
+            'af': 1.0, 'dp': depth, 'gq': f'{rng.uniform(50, 99):.2f}',
+            'gt': depth, 'mq': f'{rng.uniform(55, 60):.2f}',
+            'pl_homref': depth * 30, 'pl_het': 0,
+            'qd': f'{rng.uniform(20, 40):.2f}',
+            'quality': f'{rng.uniform(500, 5000):.2f}'
+        }
+
+    def blast_hit(self, model, query, common):
+        """Return a BLAST hit of a query, exact about half the time."""
+        rng = self.rng
+        distance = 0 if rng.random() < 0.5 else rng.randint(1, 5)
+        seq = random_sequence(rng, query.length)
+        return model(
+            query=query, contig=rng.randint(1, self.opts['contigs']),
+            bitscore=2 * query.length - distance, evalue='0.00',
+            identity=query.length - distance, mismatch=distance, gaps=0,
+            hamming_distance=distance, query_from=1,
+            query_to=query.length, hit_from=1000,
+            hit_to=1000 + query.length - 1, align_len=query.length,
+            qseq=seq, hseq=seq, midline='|' * query.length, **common
+        )
+
+    def update_counts(self):
+        """Add the variants of the new samples to the counts by position."""
+        # Keep the counts of samples created by previous runs
+        for count in Counts.objects.filter(reference=self.reference,
+                                           is_mlst_set=False):
+            self.positions.setdefault(count.position, Counter()).update({
+                'nongenic_snp': count.nongenic_snp, 'indel': count.indel,
+                'synonymous': count.synonymous,
+                'nonsynonymous': count.nonsynonymous
+            })
+        Counts.objects.filter(reference=self.reference,
+                              is_mlst_set=False).delete()
+
+        annotations = {}
+        for variant in self.snps + self.indels:
+            annotations[variant['reference_position']] = (
+                variant['annotation_id']
+            )
+
+        counts = []
+        for position, count in sorted(self.positions.items()):
+            counts.append(Counts(
+                reference=self.reference,
+                annotation_id=annotations[position], position=position,
+                is_mlst_set=False,
+                nongenic_indel=0, nongenic_snp=count['nongenic_snp'],
+                indel=count['indel'], synonymous=count['synonymous'],
+                nonsynonymous=count['nonsynonymous'],
+                total=sum(count.values())
+            ))
+        Counts.objects.bulk_create(counts, batch_size=10000)
@@ -0,0 +1,215 @@
+"""
+Replay logged API requests against a server and report latency per route.
+
+Requests are read from nginx access logs (combined format, as written by
+config/nginx_static.conf), uWSGI request logs or JSONL files with a 'method',
+'path' and optional 'data' (POST body) and 'time' (epoch seconds) per line.
+Access logs have no request bodies, so only their GETs and HEADs are
+replayed.
+
+Requests are grouped by the URL name they resolve to (e.g. 'sample-detail'
+from api/routers.py), and each route's p50/p95/p99 latency, error rate and
+throughput are reported. Running it at the concurrency of the uWSGI
+`processes` shows whether they keep up with the logged traffic.
+"""
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+import json
+import math
+import re
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import Resolver404, resolve
+
+# Access log formats, as (pattern, time format)
+LOG_FORMATS = [
+    # nginx (combined): 127.0.0.1 - - [10/Oct/2020:13:55:36 -0400] "GET ..."
+    (re.compile(
+        r'^\S+ \S+ \S+ \[(?P<time>[^\]]+)\] '
+        r'"(?P<method>[A-Z]+) (?P<path>\S+)[^"]*"'
+    ), '%d/%b/%Y:%H:%M:%S %z'),
+    # uWSGI: [pid: 1|app: 0|req: 1/1] ... [Sat Oct 10 13:55:36 2020] GET ...
+    (re.compile(
+        r'^\[pid: .*?\} \[(?P<time>[^\]]+)\] '
+        r'(?P<method>[A-Z]+) (?P<path>\S+) =>'
+    ), '%a %b %d %H:%M:%S %Y')
+]
+REPLAYABLE = ['GET', 'HEAD']
+
+
+def parse_line(line):
+    """Return the request of a log or JSONL line, or None if it has none."""
+    line = line.strip()
+    if line.startswith('{'):
+        request = json.loads(line)
+        return {
+            'method': request.get('method', 'GET').upper(),
+            'path': request['path'],
+            'data': request.get('data'),
+            'time': request.get('time')
+        }
+
+    for pattern, time_format in LOG_FORMATS:
+        match = pattern.match(line)
+        if match and match.group('method') in REPLAYABLE:
+            return {
+                'method': match.group('method'),
+                'path': match.group('path'),
+                'data': None,
+                'time': datetime.strptime(
+                    match.group('time'), time_format
+                ).timestamp()
+            }
+    return None
+
+
+@lru_cache(maxsize=None)
+def get_route(path):
+    """Return the URL name a path resolves to."""
+    try:
+        return resolve(urlsplit(path).path).url_name or 'unnamed'
+    except Resolver404:
+        return 'unresolved'
+
+
+def percentile(timings, percent):
+    """Return the nearest-rank percentile of sorted timings."""
+    return timings[max(math.ceil(percent / 100 * len(timings)) - 1, 0)]
+
+
+def summarize(results, seconds):
+    """Return latency (ms), error rate and throughput of each route."""
+    routes = OrderedDict()
+    for route, timing, is_error in results:
+        routes.setdefault(route, []).append([timing, is_error])
+    routes['TOTAL'] = [[timing, is_error] for r, timing, is_error in results]
+
+    summary = OrderedDict()
+    for route, calls in sorted(routes.items(), key=lambda r: -len(r[1])):
+        timings = sorted(timing for timing, is_error in calls)
+        summary[route] = OrderedDict((
+            ('requests', len(calls)),
+            ('p50', round(percentile(timings, 50) * 1000, 1)),
+            ('p95', round(percentile(timings, 95) * 1000, 1)),
+            ('p99', round(percentile(timings, 99) * 1000, 1)),
+            ('error_rate', round(
+                sum(is_error for timing, is_error in calls) / len(calls), 4
+            )),
+            ('throughput', round(len(calls) / seconds, 2))
+        ))
+    return summary
+
+
+class Command(BaseCommand):
+    """Replay logged API requests and report latency per route."""
+
+    help = 'Replay logged API requests and report latency per route.'
+
+    def add_arguments(self, parser):
+        """Command line arguements."""
+        parser.add_argument('logs', metavar='LOGS', nargs='+',
+                            help=('nginx, uWSGI or JSONL files of the '
+                                  'requests to replay.'))
+        parser.add_argument('--host', metavar='URL',
+                            default='http://localhost:8000',
+                            help=('Server to replay against. '
+                                  '(Default: http://localhost:8000)'))
+        parser.add_argument('--concurrency', metavar='INT', type=int,
+                            default=8,
+                            help='Requests in flight at once. (Default: 8)')
+        parser.add_argument('--speed', metavar='FLOAT', type=float,
+                            default=0,
+                            help=('Replay at the logged pace times FLOAT, 0 '
+                                  'replays as fast as possible. '
+                                  '(Default: 0)'))
+        parser.add_argument('--prefix', metavar='STR', default='/api/',
+                            help=('Only replay paths starting with STR. '
+                                  '(Default: /api/)'))
+        parser.add_argument('--limit', metavar='INT', type=int,
+                            help='Replay at most INT requests.')
+        parser.add_argument('--token', metavar='STR',
+                            help=('API token to replay with, its user '
+                                  'should not be throttled.'))
+        parser.add_argument('--timeout', metavar='INT', type=int,
+                            default=300,
+                            help=('Seconds to wait on a request. '
+                                  '(Default: 300)'))
+        parser.add_argument('--output', metavar='JSON',
+                            help='Write the summary to a JSON file.')
+
+    def handle(self, *args, **opts):
+        """Replay the requests and print the latency of each route."""
+        replay = []
+        for log in opts['logs']:
+            with open(log, 'r') as fh:
+                for line in fh:
+                    request = parse_line(line)
+                    if request and request['path'].startswith(opts['prefix']):
+                        request['route'] = get_route(request['path'])
+                        replay.append(request)
+        if opts['speed']:
+            # Logs of several servers interleave, replay them in time order
+            replay.sort(key=lambda request: request['time'] or 0)
+        replay = replay[:opts['limit']] if opts['limit'] else replay
+        if not replay:
+            raise CommandError(f'No requests under {opts["prefix"]} to replay')
+
+        headers = {}
+        if opts['token']:
+            headers['Authorization'] = f'Token {opts["token"]}'
+        local = threading.local()
+        results = []
+
+        def send(request):
+            if not hasattr(local, 'session'):
+                local.session = requests.Session()
+                local.session.headers.update(headers)
+            start_time = time.time()
+            try:
+                response = local.session.request(
+                    request['method'], f'{opts["host"]}{request["path"]}',
+                    json=request['data'], timeout=opts['timeout']
+                )
+                # Read streamed responses to the end
+                response.content
+                is_error = response.status_code >= 400
+            except requests.RequestException:
+                is_error = True
+            results.append([request['route'], time.time() - start_time,
+                            is_error])
+
+        # Bound queued requests, so a slow server delays the replay instead
+        slots = threading.BoundedSemaphore(opts['concurrency'] * 2)
+        logged_start = replay[0]['time']
+        start_time = time.time()
+        with ThreadPoolExecutor(max_workers=opts['concurrency']) as executor:
+            for request in replay:
+                if opts['speed'] and request['time'] and logged_start:
+                    delay = (start_time - time.time() + (
+                        request['time'] - logged_start) / opts['speed'])
+                    if delay > 0:
+                        time.sleep(delay)
+                slots.acquire()
+                executor.submit(send, request).add_done_callback(
+                    lambda future: slots.release()
+                )
+        seconds = time.time() - start_time
+
+        summary = summarize(results, seconds)
+        print(f'Replayed {len(results)} requests in {seconds:.1f}s at '
+              f'concurrency {opts["concurrency"]}')
+        print('\t'.join(['route', 'requests', 'p50 ms', 'p95 ms', 'p99 ms',
+                         'error rate', 'req/sec']))
+        for route, stats in summary.items():
+            print('\t'.join([route] + [str(v) for v in stats.values()]))
+
+        if opts['output']:
+            with open(opts['output'], 'w') as fh:
+                json.dump(summary, fh, indent=4)
@@ -0,0 +1,328 @@
+"""
+Time api.queries functions and ingest tools, and compare against a baseline.
+
+Every public function of the api.queries modules is called with arguments
+looked up by parameter name (see ARGUMENTS), using samples created by
+create_synthetic_data. Functions with a required argument not in ARGUMENTS
+are skipped. Given --sample_dir, each insert_* tool is also run on a pipeline
+output directory, in a transaction that is rolled back.
+
+Each benchmark runs in a forked process so its peak RSS is its own. Results
+are compared against --baseline, a benchmark is flagged when its median time
+or peak RSS is more than --tolerance above the baseline.
+"""
+from contextlib import ExitStack
+import importlib
+import inspect
+import json
+import multiprocessing
+import os
+import pkgutil
+import resource
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+from django.test.utils import override_settings
+
+import api.queries
+from annotation.models import Inference
+from annotation.tools import insert_annotation
+from assembly.tools import insert_assembly
+from cgmlst.tools import insert_cgmlst
+from mlst.tools import insert_mlst
+from plasmid.tools import insert_plasmid
+from publication.models import Publication
+from resistance.tools import insert_resistance
+from sample.models import Sample
+from sample.tools import get_user, prep_insert
+from sccmec.tools import insert_sccmec
+from sequence.tools import insert_sequence_stats
+from tag.models import Tag
+from variant.models import Indel, Reference, SNP
+from variant.tools import insert_variants
+from virulence.tools import insert_virulence
+
+# Arguments of api.queries functions by parameter name, built from the
+# benchmark context (see get_context)
+ARGUMENTS = {
+    'sample_id': lambda c: c['sample_ids'],
+    'sample_ids': lambda c: c['sample_ids'],
+    'ids': lambda c: c['sample_ids'],
+    'user_id': lambda c: c['user_id'],
+    'user': lambda c: c['user_id'],
+    'snp_id': lambda c: c['snp_ids'],
+    'indel_id': lambda c: c['indel_ids'],
+    'annotation_ids': lambda c: c['annotation_ids'],
+    'reference_id': lambda c: c['reference_id'],
+    'product_id': lambda c: c['product_id'],
+    'tag': lambda c: c['tag_id'],
+    'tag_id': lambda c: c['tag_id'],
+    'pmid': lambda c: c['pmid'],
+    'q': lambda c: 'aureus',
+    'total': lambda c: 10
+}
+
+# Ingest tools in the order of insert_analysis_results, and the tools whose
+# results they need
+INGEST = [
+    ('insert_variants', insert_variants, []),
+    ('insert_sequence_stats', insert_sequence_stats, []),
+    ('insert_plasmid', insert_plasmid, []),
+    ('insert_annotation', insert_annotation, []),
+    ('insert_mlst', insert_mlst, []),
+    ('insert_cgmlst', insert_cgmlst, []),
+    ('insert_resistance', insert_resistance, []),
+    ('insert_virulence', insert_virulence, []),
+    ('insert_assembly', insert_assembly, []),
+    ('insert_sccmec', insert_sccmec, [insert_assembly])
+]
+
+
+class Rollback(Exception):
+    """Discard the changes of an ingest benchmark."""
+
+
+def get_query_functions():
+    """Return (name, function) of every public api.queries function."""
+    functions = []
+    for module_info in pkgutil.iter_modules(api.queries.__path__):
+        module = importlib.import_module(f'api.queries.{module_info.name}')
+        for name, fun in inspect.getmembers(module, inspect.isfunction):
+            if fun.__module__ == module.__name__ and not name.startswith('_'):
+                functions.append([f'{module_info.name}.{name}', fun])
+    return functions
+
+
+def get_arguments(fun, context):
+    """Return the arguments of a function, or None if one is unknown."""
+    arguments = {}
+    for name, param in inspect.signature(fun).parameters.items():
+        if param.default is not inspect.Parameter.empty:
+            continue
+        elif name not in ARGUMENTS:
+            return None
+        arguments[name] = ARGUMENTS[name](context)
+    return arguments
+
+
+def get_context(opts):
+    """Return the samples and catalog ids queries are benchmarked with."""
+    user = get_user(opts['user'])
+    sample_ids = list(Sample.objects.filter(
+        user=user, name__startswith=f'{opts["prefix"]}_'
+    ).order_by('id').values_list('id', flat=True)[:opts['ids']])
+    if not sample_ids:
+        raise CommandError(
+            f'No samples named {opts["prefix"]}_*, run create_synthetic_data'
+        )
+
+    tag = Tag.objects.filter(tag=opts['prefix']).first()
+    reference = Reference.objects.order_by('id').first()
+    publication = Publication.objects.order_by('id').first()
+    inference = Inference.objects.order_by('id').first()
+    return {
+        'sample_ids': sample_ids,
+        'user_id': user.pk,
+        'snp_ids': list(SNP.objects.order_by('id').values_list(
+            'id', flat=True
+        )[:opts['ids']]),
+        'indel_ids': list(Indel.objects.order_by('id').values_list(
+            'id', flat=True
+        )[:opts['ids']]),
+        'annotation_ids': list(SNP.objects.order_by('id').values_list(
+            'annotation_id', flat=True
+        ).distinct()[:10]),
+        'reference_id': reference.pk if reference else 0,
+        'product_id': inference.pk if inference else 0,
+        'tag_id': tag.pk if tag else 0,
+        'pmid': publication.pmid if publication else 0
+    }
+
+
+def count_rows(results):
+    """Return the rows returned, reading generators to the end."""
+    if results is None:
+        return 0
+    elif isinstance(results, (str, bytes)):
+        return 1
+    elif isinstance(results, dict) or not hasattr(results, '__iter__'):
+        return 1
+    return sum(1 for row in results)
+
+
+def run_forked(target, *args):
+    """Run target in a forked process, return its result and peak RSS."""
+    # A connection must not be shared by the parent and child
+    connections.close_all()
+    context = multiprocessing.get_context('fork')
+    queue = context.Queue()
+
+    def child():
+        try:
+            result = target(*args)
+        except Exception as e:
+            result = {'error': f'{type(e).__name__}: {e}'.strip()}
+        finally:
+            connections.close_all()
+        # ru_maxrss is in kilobytes on Linux
+        result['peak_rss_mb'] = round(
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1
+        )
+        queue.put(result)
+
+    process = context.Process(target=child)
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def time_query(fun, arguments, repeat, cached):
+    """Return the median time and rows/sec of a query."""
+    timings = []
+    rows = 0
+    with ExitStack() as stack:
+        if not cached:
+            stack.enter_context(override_settings(API_CACHE_ALIAS=None))
+        for i in range(repeat):
+            start_time = time.time()
+            rows = count_rows(fun(**arguments))
+            timings.append(time.time() - start_time)
+
+    seconds = statistics.median(timings)
+    return {
+        'seconds': round(seconds, 4),
+        'rows': rows,
+        'throughput': round(rows / seconds, 1) if seconds else 0
+    }
+
+
+def time_ingest(tool, dependencies, opts):
+    """Return the time to insert a sample with a tool, then roll it back."""
+    result = {}
+    try:
+        with transaction.atomic():
+            sample, version, files = prep_insert(
+                opts['user'], opts['name'], opts['sample_dir']
+            )
+            for dependency in dependencies:
+                dependency(sample, version, files, force=True)
+
+            start_time = time.time()
+            tool(sample, version, files, force=True)
+            seconds = time.time() - start_time
+            result = {
+                'seconds': round(seconds, 4),
+                'rows': 1,
+                'throughput': round(1 / seconds, 3) if seconds else 0
+            }
+            raise Rollback()
+    except Rollback:
+        pass
+    return result
+
+
+def compare(results, baseline, tolerance):
+    """Return the benchmarks slower or larger than their baseline."""
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if not previous or 'error' in result or 'error' in previous:
+            continue
+        for key in ['seconds', 'peak_rss_mb']:
+            if previous.get(key) and result[key] > previous[key] * (
+                    1 + tolerance):
+                regressions.append(
+                    f'{name}\t{key}\t{previous[key]} -> {result[key]}'
+                )
+    return regressions
+
+
+class Command(BaseCommand):
+    """Time api.queries functions and ingest tools against a baseline."""
+
+    help = 'Time api.queries functions and ingest tools against a baseline.'
+
+    def add_arguments(self, parser):
+        """Command line arguements."""
+        parser.add_argument('--user', metavar='USERNAME', default='ena',
+                            help='Owner of the samples. (Default: ena)')
+        parser.add_argument('--prefix', metavar='STR', default='synthetic',
+                            help=('Name prefix of the synthetic samples. '
+                                  '(Default: synthetic)'))
+        parser.add_argument('--ids', metavar='INT', type=int, default=100,
+                            help='Sample ids per query. (Default: 100)')
+        parser.add_argument('--repeat', metavar='INT', type=int, default=3,
+                            help='Times to run each query. (Default: 3)')
+        parser.add_argument('--match', metavar='STR', type=str,
+                            help='Only run benchmarks containing STR.')
+        parser.add_argument('--cached', action='store_true',
+                            help='Leave the API cache enabled.')
+        parser.add_argument('--sample_dir', metavar='SAMPLE_DIRECTORY',
+                            help='Pipeline output to benchmark ingest with.')
+        parser.add_argument('--name', metavar='SAMPLE_NAME',
+                            help='Sample name in --sample_dir.')
+        parser.add_argument('--output', metavar='JSON',
+                            help='Write the results to a JSON file.')
+        parser.add_argument('--baseline', metavar='JSON',
+                            help='Results to compare against.')
+        parser.add_argument('--save_baseline', action='store_true',
+                            help='Replace --baseline with these results.')
+        parser.add_argument('--tolerance', metavar='FLOAT', type=float,
+                            default=0.25,
+                            help=('Allowed increase over the baseline. '
+                                  '(Default: 0.25)'))
+
+    def handle(self, *args, **opts):
+        """Print the results of each benchmark and any regressions."""
+        if opts['sample_dir'] and not opts['name']:
+            raise CommandError('--sample_dir requires --name')
+
+        context = get_context(opts)
+        benchmarks = []
+        for name, fun in get_query_functions():
+            arguments = get_arguments(fun, context)
+            if arguments is None:
+                print(f'{name}\tskipped, unknown arguments')
+                continue
+            benchmarks.append([name, time_query, fun, arguments,
+                               opts['repeat'], opts['cached']])
+
+        if opts['sample_dir']:
+            for name, tool, dependencies in INGEST:
+                benchmarks.append([f'ingest.{name}', time_ingest, tool,
+                                   dependencies, opts])
+
+        results = {}
+        print('\t'.join(['benchmark', 'median sec', 'rows', 'rows/sec',
+                         'peak RSS MB']))
+        for name, target, *target_args in benchmarks:
+            if opts['match'] and opts['match'] not in name:
+                continue
+            result = run_forked(target, *target_args)
+            results[name] = result
+            if 'error' in result:
+                print(f'{name}\terror\t{result["error"]}')
+            else:
+                print(f'{name}\t{result["seconds"]}\t{result["rows"]}\t'
+                      f'{result["throughput"]}\t{result["peak_rss_mb"]}')
+
+        if opts['output']:
+            with open(opts['output'], 'w') as fh:
+                json.dump(results, fh, indent=4, sort_keys=True)
+
+        if opts['baseline'] and opts['save_baseline']:
+            with open(opts['baseline'], 'w') as fh:
+                json.dump(results, fh, indent=4, sort_keys=True)
+            print(f'Saved baseline to {opts["baseline"]}')
+        elif opts['baseline'] and os.path.exists(opts['baseline']):
+            with open(opts['baseline'], 'r') as fh:
+                regressions = compare(results, json.load(fh),
+                                      opts['tolerance'])
+            if regressions:
+                raise CommandError('Regressions found:\n{0}'.format(
+                    '\n'.join(regressions)
+                ))
+            print(f'No regressions against {opts["baseline"]}')
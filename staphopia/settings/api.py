@@ -36,19 +36,31 @@ REST_FRAMEWORK = {
     ),
     'DEFAULT_THROTTLE_CLASSES': (
         'rest_framework.throttling.AnonRateThrottle',
-        'rest_framework.throttling.UserRateThrottle'
+        'rest_framework.throttling.UserRateThrottle',
+        'api.throttling.CostRateThrottle'
     ),
     'DEFAULT_THROTTLE_RATES': {
         'anon': '10/day',
-        'user': '100000000000/day'
+        'user': '100000000000/day',
+        'cost': '10000000/day'
     },
     'DEFAULT_PAGINATION_CLASS': (
         'rest_framework.pagination.PageNumberPagination'
     ),
+    'DEFAULT_RENDERER_CLASSES': (
+        'api.renderers.JSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+        'api.renderers.TSVRenderer',
+        'api.renderers.ArrowRenderer',
+        'api.renderers.ParquetRenderer'
+    ),
+    'DEFAULT_CONTENT_NEGOTIATION_CLASS': 'api.renderers.ContentNegotiation',
     'TEST_REQUEST_DEFAULT_FORMAT': 'json',
     'PAGE_SIZE': 100
 }
-MAX_IDS_PER_QUERY = 5000
+MAX_IDS_PER_QUERY = 100000
+ID_TEMP_TABLE_SIZE = 10000
+STREAM_BATCH_SIZE = 2000
 
 '''----------------------------------------------------------------------------
 Static files (CSS, JavaScript, Images)
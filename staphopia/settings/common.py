@@ -43,6 +43,7 @@ INSTALLED_APPS = (
     'assembly',
     'cgmlst',
     'ena',
+    'job',
     'gene',
     'kmer',
     'metadata',
@@ -78,25 +79,184 @@ REST_FRAMEWORK = {
     ),
     'DEFAULT_THROTTLE_CLASSES': (
         'rest_framework.throttling.AnonRateThrottle',
-        'rest_framework.throttling.UserRateThrottle'
+        'rest_framework.throttling.UserRateThrottle',
+        'api.throttling.CostRateThrottle'
     ),
     'DEFAULT_THROTTLE_RATES': {
         'anon': '10/day',
-        'user': '100000000000/day'
+        'user': '100000000000/day',
+        'cost': '10000000/day'
     },
     'DEFAULT_PAGINATION_CLASS': (
         'rest_framework.pagination.PageNumberPagination'
     ),
+    'DEFAULT_RENDERER_CLASSES': (
+        'api.renderers.JSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+        'api.renderers.TSVRenderer',
+        'api.renderers.ArrowRenderer',
+        'api.renderers.ParquetRenderer'
+    ),
+    'DEFAULT_CONTENT_NEGOTIATION_CLASS': 'api.renderers.ContentNegotiation',
     'TEST_REQUEST_DEFAULT_FORMAT': 'json',
     'PAGE_SIZE': 100
 }
-MAX_IDS_PER_QUERY = 5000
+MAX_IDS_PER_QUERY = 100000
+ID_TEMP_TABLE_SIZE = 10000
+STREAM_BATCH_SIZE = 2000
+
+'''----------------------------------------------------------------------------
+Cache
+The 'api' cache holds api.queries results (see api/cache.py). It is file based
+so ingest processes can invalidate the results cached by the API workers.
+----------------------------------------------------------------------------'''
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'api': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': '/var/tmp/staphopia/api-cache',
+        'TIMEOUT': 60 * 60 * 24 * 7,
+        'OPTIONS': {
+            'MAX_ENTRIES': 200000,
+            'CULL_FREQUENCY': 10
+        }
+    }
+}
+API_CACHE_ALIAS = 'api'
+API_CACHE_MAX_IDS = 100
+API_CACHE_GLOBAL_TIMEOUT = 60 * 60
+
+# Lock files of coalesced queries, callers wait API_COALESCE_TIMEOUT seconds
+# at most before running the query themselves
+API_COALESCE_DIR = '/var/tmp/staphopia/api-locks'
+API_COALESCE_TIMEOUT = 300
+
+'''----------------------------------------------------------------------------
+Query Limits
+A request costs API_COST_WEIGHTS (by URL name, default 1) per id it asks for,
+drawn from each user's 'cost' throttle rate (see api/throttling.py). Queries
+are cancelled after API_STATEMENT_TIMEOUTS milliseconds (by URL name, or the
+'default'), see StatementTimeoutMiddleware in api/middleware.py.
+----------------------------------------------------------------------------'''
+API_COST_WEIGHTS = {
+    'annotation-bulk-by-sample': 10,
+    'contig-bulk-by-sample': 5,
+    'indel-bulk-by-sample': 20,
+    'sample-contigs': 5,
+    'sample-dossier': 10,
+    'sample-genes': 10,
+    'sample-indels': 20,
+    'sample-snps': 20,
+    'snp-bulk-by-sample': 20,
+    'total-by-partition': 5,
+    'variant-indel-bulk-by-sample': 20,
+    'variant-snp-bulk-by-sample': 20
+}
+API_STATEMENT_TIMEOUTS = {
+    'default': 30000,
+    'indel-bulk-by-sample': 120000,
+    'info-cgmlst-patterns': 240000,
+    'info-rank-by-year': 240000,
+    'info-st-by-year': 240000,
+    'info-submission-by-year': 240000,
+    'snp-bulk-by-sample': 120000,
+    'total-by-partition': 120000,
+    'variant-indel-bulk-by-sample': 120000,
+    'variant-snp-bulk-by-sample': 120000
+}
+
+'''----------------------------------------------------------------------------
+Read Replicas
+Reads of API requests go to one of API_READ_REPLICAS (aliases in DATABASES),
+unless it is more than API_REPLICA_MAX_LAG seconds behind the primary. Lag is
+checked every API_REPLICA_CHECK_SECONDS (see staphopia/db/routers.py).
+----------------------------------------------------------------------------'''
+DATABASE_ROUTERS = ['staphopia.db.routers.ReadReplicaRouter']
+API_READ_REPLICAS = []
+API_REPLICA_MAX_LAG = 30
+API_REPLICA_CHECK_SECONDS = 5
+# Apps read right after they are written, always read from the primary
+API_REPLICA_EXCLUDE_APPS = ['job', 'sessions']
+
+'''----------------------------------------------------------------------------
+Compression
+API responses larger than API_COMPRESS_MIN_SIZE bytes are compressed with zstd
+(if zstandard is installed) or gzip (see api/compression.py).
+----------------------------------------------------------------------------'''
+API_COMPRESS_MIN_SIZE = 1024
+API_COMPRESS_LEVEL = {
+    'gzip': 6,
+    'zstd': 3
+}
+API_COMPRESS_SKIP_TYPES = [
+    'application/gzip',
+    'application/vnd.apache.parquet'
+]
+
+'''----------------------------------------------------------------------------
+Jobs
+Bulk routes given ?async queue a job, run by the run_api_jobs command, and
+write the results to API_JOB_DIR (see job/tools.py).
+----------------------------------------------------------------------------'''
+API_JOB_DIR = '/var/tmp/staphopia/api-jobs'
+API_JOB_MAX_IDS = 10000
+API_JOB_EXPIRE_DAYS = 7
+# Workers delete expired jobs every API_JOB_EXPIRE_SECONDS
+API_JOB_EXPIRE_SECONDS = 60 * 60
+API_JOB_WORKERS = 2
+API_JOB_POLL_SECONDS = 5
+
+'''----------------------------------------------------------------------------
+Dossiers
+/api/sample/dossier/ runs the queries of each section on up to
+API_DOSSIER_WORKERS threads, each with its own database connection (see
+api/dossier.py). A pooled database needs a POOL MAX_SIZE of at least
+API_DOSSIER_WORKERS + 1, the request holding a connection too.
+----------------------------------------------------------------------------'''
+API_DOSSIER_MAX_IDS = 100
+API_DOSSIER_WORKERS = 4
+
+'''----------------------------------------------------------------------------
+Variant catalogs
+SNP and InDel endpoints read variant_snp/variant_indel columns from catalog
+files in API_VARIANT_CATALOG_DIR, built by build_variant_catalog, and check
+for a newer version every API_VARIANT_CATALOG_CHECK seconds (see
+api/variant_catalog.py). Set API_VARIANT_CATALOG_DIR to None to query them.
+----------------------------------------------------------------------------'''
+API_VARIANT_CATALOG_DIR = '/var/tmp/staphopia/variant-catalogs'
+API_VARIANT_CATALOG_CHECK = 60
+
+'''----------------------------------------------------------------------------
+Logging
+API requests slower than API_SLOW_REQUEST_MS are logged to 'api.slow' as a JSON
+line with their SQL breakdown (see api/middleware.py).
+----------------------------------------------------------------------------'''
+API_SLOW_REQUEST_MS = 1000
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'api.slow': {
+            'handlers': ['console'],
+            'level': 'WARNING',
+            'propagate': False,
+        },
+    },
+}
 
 '''----------------------------------------------------------------------------
 Middleware
 ----------------------------------------------------------------------------'''
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'api.middleware.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -104,6 +264,9 @@ MIDDLEWARE = [
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     # 'staphopia.middleware.LoginRequiredMiddleware'
+    'api.middleware.QueryProfileMiddleware',
+    'api.middleware.ReadReplicaMiddleware',
+    'api.middleware.StatementTimeoutMiddleware',
 ]
 APPEND_SLASH = True
 
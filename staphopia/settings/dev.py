@@ -36,6 +36,7 @@ INSTALLED_APPS = (
     'assembly',
     'cgmlst',
     'ena',
+    'job',
     'gene',
     'kmer',
     'metadata',
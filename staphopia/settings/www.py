@@ -14,12 +14,20 @@ https://docs.djangoproject.com/en/1.6/ref/settings/#databases
 ----------------------------------------------------------------------------'''
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.postgresql_psycopg2',
+        'ENGINE': 'staphopia.db.backends.postgresql_pool',
         'NAME': 'staphopia',
         'USER': 'staphopia',
         'PASSWORD': DEV_PASS,
         'HOST': 'chlamy.genetics.emory.edu',
         'PORT': '29466',
+        # Per uwsgi process (see staphopia/db/backends/postgresql_pool). A
+        # dossier request holds one connection and each of its section
+        # threads another, so it must be at least API_DOSSIER_WORKERS + 1
+        'POOL': {
+            'MAX_SIZE': API_DOSSIER_WORKERS + 1,
+            'HEALTH_CHECK_AGE': 60,
+            'MAX_LIFETIME': 3600
+        }
     }
 }
 
@@ -69,33 +69,24 @@ class Command(BaseCommand):
                 'indels': []
             }
 
-        # Parse through variants for each sample
-        sql = """SELECT v.sample_id, v.snp, v.indel
-                 FROM variant_variant AS v
+        # Parse through the annotations called in each sample
+        sql = """SELECT DISTINCT c.sample_id, c.annotation_id
+                 FROM variant_{0}call AS c
                  LEFT JOIN sample_basic AS s
-                 ON v.sample_id=s.sample_id
-                 WHERE v.sample_id IN ({0}) AND v.reference_id={1} AND
-                       (s.is_public=TRUE OR s.user_id={2});""".format(
-            ','.join([str(i) for i in sample_id]),
-            reference.pk,
-            user.pk
-        )
-        for row in query_database(sql):
-            snps = {}
-            for snp in row['snp']:
-                snps[snp['annotation_id']] = True
-
-            for annotation_id in snps:
-                if annotation_id in summary:
-                    summary[annotation_id]['snps'].append(row['sample_id'])
-
-            indels = {}
-            for indel in row['indel']:
-                indels[indel['annotation_id']] = True
-
-            for annotation_id in indels:
-                if annotation_id in summary:
-                    summary[annotation_id]['indels'].append(row['sample_id'])
+                 ON c.sample_id=s.sample_id
+                 LEFT JOIN variant_{0} AS v
+                 ON c.{0}_id=v.id
+                 WHERE c.sample_id IN ({1}) AND v.reference_id={2} AND
+                       (s.is_public=TRUE OR s.user_id={3});"""
+        for table, key in [('snp', 'snps'), ('indel', 'indels')]:
+            for row in query_database(sql.format(
+                table, ','.join([str(i) for i in sample_id]), reference.pk,
+                user.pk
+            )):
+                if row['annotation_id'] in summary:
+                    summary[row['annotation_id']][key].append(
+                        row['sample_id']
+                    )
 
         # Process the results
         cols = ['annotation_id', 'locus_tag', 'samples', 'snps', 'indels',
@@ -0,0 +1,65 @@
+"""Copy the calls stored as JSON in Variant to the call tables."""
+import time
+
+from django.db import transaction
+from django.core.management.base import BaseCommand
+
+from api.utils import query_database
+from variant.models import Variant
+from variant.tools import insert_calls
+
+
+class Command(BaseCommand):
+    """Copy the calls stored as JSON in Variant to the call tables."""
+
+    help = 'Copy the calls stored as JSON in Variant to the call tables.'
+
+    def add_arguments(self, parser):
+        """Command line arguements."""
+        parser.add_argument('--batch_size', metavar='INT', type=int,
+                            default=100,
+                            help=('Samples to copy per transaction. '
+                                  '(Default: 100)'))
+        parser.add_argument('--clear', action='store_true',
+                            help=('Clear the JSON of each sample once its '
+                                  'calls are copied.'))
+
+    def handle(self, *args, **opts):
+        """Copy each sample's calls, a batch of samples at a time."""
+        # Samples with calls in the tables were already copied (or inserted
+        # after the tables were added), only their JSON is cleared
+        sql = """SELECT v.id, EXISTS (
+                    SELECT 1 FROM variant_snpcall AS c
+                    WHERE c.sample_id=v.sample_id AND
+                          c.version_id=v.version_id
+                 ) OR EXISTS (
+                    SELECT 1 FROM variant_indelcall AS c
+                    WHERE c.sample_id=v.sample_id AND
+                          c.version_id=v.version_id
+                 ) AS is_copied
+                 FROM variant_variant AS v
+                 WHERE v.snp IS NOT NULL OR v.indel IS NOT NULL
+                 ORDER BY v.id;"""
+        rows = query_database(sql)
+        print(f'Found {len(rows)} samples with JSON calls')
+
+        start_time = time.time()
+        total = 0
+        for i in range(0, len(rows), opts['batch_size']):
+            batch = rows[i:i + opts['batch_size']]
+            with transaction.atomic():
+                variants = Variant.objects.filter(pk__in=[
+                    row['id'] for row in batch if not row['is_copied']
+                ]).select_related('sample', 'version')
+                # A sample's JSON is large, only hold a few at a time
+                for variant in variants.iterator(chunk_size=10):
+                    insert_calls(variant.sample, variant.version,
+                                 variant.snp or [], variant.indel or [])
+                    total += len(variant.snp or []) + len(variant.indel or [])
+
+                if opts['clear']:
+                    Variant.objects.filter(
+                        pk__in=[row['id'] for row in batch]
+                    ).update(snp=None, indel=None)
+            print(f'{i + len(batch)} of {len(rows)} samples, {total} calls '
+                  f'copied in {time.time() - start_time:.1f}s')
@@ -0,0 +1,34 @@
+"""Build the SNP and InDel catalogs read by the variant endpoints."""
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from api.variant_catalog import CATALOGS, build_catalog
+
+
+class Command(BaseCommand):
+    """Build the SNP and InDel catalogs read by the variant endpoints."""
+
+    help = 'Build the SNP and InDel catalogs read by the variant endpoints.'
+
+    def add_arguments(self, parser):
+        """Command line arguements."""
+        parser.add_argument('--kind', metavar='STR', choices=list(CATALOGS),
+                            help='Only build this catalog (snp or indel).')
+        parser.add_argument('--directory', metavar='DIRECTORY',
+                            default=settings.API_VARIANT_CATALOG_DIR,
+                            help=('Directory to write the catalogs to. '
+                                  '(Default: API_VARIANT_CATALOG_DIR)'))
+
+    def handle(self, *args, **opts):
+        """Write a new version of each catalog."""
+        if not opts['directory']:
+            raise CommandError('API_VARIANT_CATALOG_DIR is not set, please '
+                               'use --directory')
+
+        for kind in [opts['kind']] if opts['kind'] else CATALOGS:
+            start_time = time.time()
+            path, size = build_catalog(kind, directory=opts['directory'])
+            print(f'Wrote {kind} catalog of {size - 1} ids to {path} in '
+                  f'{time.time() - start_time:.1f}s')
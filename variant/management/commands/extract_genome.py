@@ -46,36 +46,33 @@ def get_variant_positions(reference_id, table='snp'):
 
 def get_variants(sample, snp_position, indel_position, reference_id, user_id):
     variants = OrderedDict()
-    sql = """SELECT v.sample_id, v.snp, v.indel
-             FROM variant_variant AS v
+    sql = """SELECT c.{0}_id AS variant_id, c.dp AS "DP", c.gq::text AS "GQ",
+                    COALESCE(c.qd::text, '.') AS "QD",
+                    c.quality::text AS quality
+             FROM variant_{0}call AS c
              LEFT JOIN sample_basic AS s
-             ON v.sample_id=s.sample_id
-             WHERE v.sample_id = {0} AND v.reference_id={1} AND
-                   (s.is_public=TRUE OR s.user_id={2});""".format(
-        sample, reference_id, user_id
-    )
-    for row in query_database(sql):
-        for snp in row['snp']:
-            snp_id = snp_position[str(snp['snp_id'])]
-            pos = snp_id['reference_position']
-            if pos not in variants:
-                snp['is_snp'] = True
-                snp['reference_base'] = snp_id['reference_base']
-                snp['alternate_base'] = snp_id['alternate_base']
-                variants[pos] = snp
-            else:
-                raise CommandError(
-                    f"Error {sample['name']} {pos} overlapping variants"
-                )
-
-        for indel in row['indel']:
-            indel_id = indel_position[str(indel['indel_id'])]
-            pos = indel_id['reference_position']
+             ON c.sample_id=s.sample_id
+             LEFT JOIN variant_{0} AS v
+             ON c.{0}_id=v.id
+             WHERE c.sample_id = {1} AND v.reference_id={2} AND
+                   (s.is_public=TRUE OR s.user_id={3})
+             ORDER BY c.reference_position;"""
+    for table, positions in [('snp', snp_position), ('indel', indel_position)]:
+        for row in query_database(sql.format(table, sample, reference_id,
+                                             user_id)):
+            variant_id = positions[str(row['variant_id'])]
+            pos = variant_id['reference_position']
             if pos not in variants:
-                indel['is_snp'] = False
-                indel['reference_base'] = indel_id['reference_base']
-                indel['alternate_base'] = indel_id['alternate_base']
-                variants[pos] = indel
+                # VCF fields as they were stored in Variant.snp
+                variants[pos] = {
+                    'is_snp': table == 'snp',
+                    'reference_base': variant_id['reference_base'],
+                    'alternate_base': variant_id['alternate_base'],
+                    'DP': (row['DP'],),
+                    'GQ': (row['GQ'],),
+                    'QD': (row['QD'],),
+                    'quality': row['quality']
+                }
             else:
                 raise CommandError(
                     f"Error {sample['name']} {pos} overlapping variants"
@@ -7,6 +7,7 @@ from django.db import connection, transaction
 from django.db.utils import IntegrityError
 from django.core.management.base import BaseCommand, CommandError
 
+from api.cache import bump_generation, catalog_stamp
 from staphopia.utils import timeit
 from variant.models import Annotation, Feature, Comment, Reference, SNP
 
@@ -55,6 +56,7 @@ class Command(BaseCommand):
 
         # Ready to insert variants
         self.insert_snps()
+        bump_generation(catalog_stamp('variant'))
 
     @timeit
     def open_vcf(self, vcf_file):
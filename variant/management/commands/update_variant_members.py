@@ -1,4 +1,9 @@
-"""Update members of SNP and InDel IDs."""
+"""
+Rebuild the members of SNP and InDel IDs.
+
+Ingest keeps the members up to date (see variant.members), this rebuilds them
+from the call tables for repair, or after samples are made public.
+"""
 from collections import OrderedDict
 import sys
 
@@ -6,27 +11,32 @@ from django.db import connection, transaction
 from django.db.utils import IntegrityError
 from django.core.management.base import BaseCommand, CommandError
 
-from api.utils import query_database
+from api.bitmaps import SampleBitmap
+from api.utils import stream_query
 from staphopia.utils import timeit
 from sample.models import Sample
+from variant.members import rebuild_counts
 from variant.models import (
-    Variant, SNP, Indel, Reference, IndelMember, SNPMember
+    SNP, Indel, Reference, IndelMember, SNPMember
 )
 
 
-@timeit
 def get_variant_members(reference_id, is_indel=False):
-    sql = """SELECT id
-             FROM variant_{0}
-             WHERE reference_id={1}
-             ORDER BY id ASC;""".format(
+    """Yield each SNP (or InDel) id and the public samples it was called in."""
+    sql = """SELECT v.id, ARRAY_REMOVE(ARRAY_AGG(s.id), NULL) AS members
+             FROM variant_{0} AS v
+             LEFT JOIN variant_{0}call AS c
+             ON c.{0}_id=v.id
+             LEFT JOIN sample_sample AS s
+             ON c.sample_id=s.id AND s.is_public=TRUE
+             WHERE v.reference_id={1}
+             GROUP BY v.id
+             ORDER BY v.id;""".format(
         'indel' if is_indel else 'snp',
         reference_id
     )
-    members = OrderedDict()
-    for row in query_database(sql):
-        members[row['id']] = []
-    return members
+    for row in stream_query(sql):
+        yield [row['id'], SampleBitmap(row['members'])]
 
 
 class Command(BaseCommand):
@@ -39,6 +49,9 @@ class Command(BaseCommand):
         parser.add_argument('--reference', metavar='REFERENCE',
                             default='gi|29165615|ref|NC_002745.2|',
                             help=('Reference genome.'))
+        parser.add_argument('--counts', action='store_true',
+                            help=('Also rebuild the counts by position from '
+                                  'the members.'))
 
     @transaction.atomic
     def handle(self, *args, **opts):
@@ -51,39 +64,15 @@ class Command(BaseCommand):
         # Full update, so empty tables
         self.delete_members(reference)
 
-        # Create of SNP and Indel IDs
-        snps = get_variant_members(reference.pk)
-        indels = get_variant_members(reference.pk, is_indel=True)
-
-        sql = """SELECT sample_id
-                 FROM variant_variant AS v
-                 LEFT JOIN sample_sample AS s
-                 ON v.sample_id=s.id
-                 WHERE s.is_public=TRUE AND v.reference_id={0}""".format(
-            reference.pk
-        )
-        print('Start variant reading/processing')
-        i = 1
-        rows = query_database(sql)
-        total = len(rows)
-        for row in rows:
-            try:
-                variant = Variant.objects.get(sample=row['sample_id'],
-                                              reference=reference)
-            except Variant.DoesNotExist:
-                pass
-            if i % 100 == 0:
-                print(f'{i} of {total} samples processed')
-            for snp in variant.snp:
-                snps[snp['snp_id']].append(row['sample_id'])
-
-            for indel in variant.indel:
-                indels[indel['indel_id']].append(row['sample_id'])
-            i += 1
-
         # Update member columns
-        self.insert_indels(indels, reference)
-        self.insert_snps(snps, reference)
+        self.insert_members(IndelMember, 'indel_id', reference,
+                            get_variant_members(reference.pk, is_indel=True))
+        self.insert_members(SNPMember, 'snp_id', reference,
+                            get_variant_members(reference.pk))
+
+        if opts['counts']:
+            print('Rebuilding counts by position')
+            rebuild_counts(reference)
 
     @timeit
     @transaction.atomic
@@ -96,33 +85,21 @@ class Command(BaseCommand):
 
     @timeit
     @transaction.atomic
-    def insert_snps(self, snps, reference):
-        """Bulk insert snp members."""
-        snp_members = []
-        print(f'Inserting members for {len(snps)} SNPs...')
-        for snp_id, members in snps.items():
-            members.sort()
-            snp_members.append(SNPMember(
-                reference=reference,
-                snp_id=snp_id,
-                count=len(members),
-                members=members
-            ))
-        SNPMember.objects.bulk_create(snp_members, batch_size=10000)
-
-
-    @timeit
-    @transaction.atomic
-    def insert_indels(self, indels, reference):
-        """Bulk insert indel members."""
-        indel_members = []
-        print(f'Inserting members for {len(indels)} Indels...')
-        for indel_id, members in indels.items():
-            members.sort()
-            indel_members.append(IndelMember(
-                reference=reference,
-                indel_id=indel_id,
-                count=len(members),
-                members=members
-            ))
-        IndelMember.objects.bulk_create(indel_members, batch_size=10000)
+    def insert_members(self, model, column, reference, variants):
+        """Bulk insert the members of each variant, as bitmaps."""
+        print(f'Inserting {model.__name__} rows...')
+        members = []
+        total = 0
+        for variant_id, bitmap in variants:
+            members.append(model(**{
+                'reference': reference,
+                column: variant_id,
+                'count': len(bitmap),
+                'bitmap': bitmap.to_bytes()
+            }))
+            if len(members) == 10000:
+                model.objects.bulk_create(members)
+                total += len(members)
+                members = []
+        model.objects.bulk_create(members)
+        print(f'Inserted {total + len(members)} {model.__name__} rows')
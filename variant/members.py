@@ -0,0 +1,202 @@
+"""
+Keep the SNP and InDel members, and the counts by position, up to date.
+
+A public sample is added to the member bitmaps (see api.bitmaps) and counts
+of the variants it was called with when they are inserted, and removed before
+its calls are deleted, in the same transaction. Bits are set in PostgreSQL
+with set_bit(), so only the member rows of the sample's variants are touched.
+Like the members, counts (is_mlst_set=False) are those of public samples
+only, as rebuilt by `update_variant_members`.
+
+A sample's variants are only counted once, when its bit is set, however many
+versions it was called in. A sample made public (or private) when saved is
+added to (or removed from) the members by update_visibility (see
+variant.models). Samples changed with QuerySet.update() need
+`update_variant_members`, which rebuilds the members from scratch.
+
+To use:
+from variant.members import add_sample, remove_sample
+"""
+from django.db import connection, transaction
+
+COUNT_COLUMNS = ['nongenic_indel', 'nongenic_snp', 'indel', 'synonymous',
+                 'nonsynonymous']
+# The count each variant is added to, see create_synthetic_data
+CATEGORIES = {
+    'snp': {
+        'synonymous': 'v.is_synonymous=1',
+        'nonsynonymous': 'v.is_synonymous=0 AND v.is_genic=1',
+        'nongenic_snp': 'v.is_synonymous=0 AND v.is_genic=0'
+    },
+    'indel': {'indel': 'TRUE'}
+}
+
+# Pads a bitmap with zero bytes so it holds the sample's bit
+PADDED = """CASE WHEN length(m.bitmap) > %(byte)s THEN m.bitmap
+                 ELSE m.bitmap || decode(
+                     repeat('00', %(byte)s + 1 - length(m.bitmap)), 'hex'
+                 ) END"""
+# Adds the counts by position of a positions CTE to variant_counts
+ADD_COUNTS = f"""
+    INSERT INTO variant_counts AS n (
+        reference_id, annotation_id, position, is_mlst_set,
+        {', '.join(COUNT_COLUMNS)}, total
+    )
+    SELECT reference_id, annotation_id, position, FALSE,
+           {', '.join(COUNT_COLUMNS)}, total
+    FROM positions
+    ORDER BY position
+    ON CONFLICT (reference_id, position, is_mlst_set)
+    DO UPDATE SET {', '.join(f'{col} = n.{col} + EXCLUDED.{col}'
+                             for col in COUNT_COLUMNS + ['total'])};"""
+# Joins the member rows (m) to the sample's calls (c)
+CALLS = """c.sample_id=%(sample_id)s {1} AND m.{0}_id=c.{0}_id"""
+
+
+def get_positions_sql(table):
+    """
+    Return a CTE of the counts by position of the `changed` variants.
+
+    `changed` has the variant ids and the number of samples (`samples`) to
+    add to their counts.
+    """
+    counts = ',\n'.join(
+        f'COALESCE(SUM(samples) FILTER '
+        f'(WHERE {CATEGORIES[table][col]}), 0) AS {col}'
+        if col in CATEGORIES[table] else f'0 AS {col}'
+        for col in COUNT_COLUMNS
+    )
+    return f"""positions AS (
+        SELECT v.reference_id, v.reference_position AS position,
+               MIN(v.annotation_id) AS annotation_id, {counts},
+               SUM(samples) AS total
+        FROM changed
+        JOIN variant_{table} AS v
+        ON v.id=changed.{table}_id
+        GROUP BY v.reference_id, v.reference_position
+    )"""
+
+
+def add_sample(sample, version=None):
+    """
+    Add a public sample to the members and counts of its variants.
+
+    Without `version`, variants of every version the sample was called in
+    are added.
+    """
+    if not sample.is_public:
+        return
+
+    values = {'sample_id': sample.pk, 'version_id': version.pk if version
+              else None, 'byte': sample.pk // 8, 'bit': sample.pk}
+    version_sql = 'AND c.version_id=%(version_id)s' if version else ''
+    with connection.cursor() as cursor:
+        for table in CATEGORIES:
+            # Variants first seen in this sample have no member row yet
+            cursor.execute(f"""
+                INSERT INTO variant_{table}member (reference_id, {table}_id,
+                                                   count, bitmap)
+                SELECT v.reference_id, v.id, 0, ''::bytea
+                FROM variant_{table}call AS c
+                JOIN variant_{table} AS v
+                ON c.{table}_id=v.id
+                WHERE c.sample_id=%(sample_id)s {version_sql}
+                ORDER BY v.id
+                ON CONFLICT ({table}_id) DO NOTHING;""", values)
+            lock_rows(cursor, table, version_sql, values)
+
+            cursor.execute(f"""
+                WITH changed AS (
+                    UPDATE variant_{table}member AS m
+                    SET bitmap = set_bit({PADDED}, %(bit)s, 1),
+                        count = m.count + 1
+                    FROM variant_{table}call AS c
+                    WHERE {CALLS.format(table, version_sql)} AND
+                        (length(m.bitmap) <= %(byte)s OR
+                         get_bit(m.bitmap, %(bit)s) = 0)
+                    RETURNING m.{table}_id, 1 AS samples
+                ), {get_positions_sql(table)}
+                {ADD_COUNTS}""", values)
+
+
+def remove_sample(sample, version=None):
+    """
+    Remove a sample from the members and counts of its variants.
+
+    With `version`, variants the sample was also called with in another
+    version are kept.
+    """
+    values = {'sample_id': sample.pk, 'version_id': version.pk if version
+              else None, 'byte': sample.pk // 8, 'bit': sample.pk}
+    with connection.cursor() as cursor:
+        for table in CATEGORIES:
+            version_sql = ''
+            if version:
+                version_sql = f"""AND c.version_id=%(version_id)s AND
+                    NOT EXISTS (
+                        SELECT 1 FROM variant_{table}call AS o
+                        WHERE o.sample_id=c.sample_id AND
+                              o.{table}_id=c.{table}_id AND
+                              o.version_id<>c.version_id
+                    )"""
+            lock_rows(cursor, table, version_sql, values)
+
+            update = ', '.join(
+                f'{col} = n.{col} - p.{col}'
+                for col in COUNT_COLUMNS + ['total']
+            )
+            cursor.execute(f"""
+                WITH changed AS (
+                    UPDATE variant_{table}member AS m
+                    SET bitmap = set_bit(m.bitmap, %(bit)s, 0),
+                        count = m.count - 1
+                    FROM variant_{table}call AS c
+                    WHERE {CALLS.format(table, version_sql)} AND
+                        length(m.bitmap) > %(byte)s AND
+                        get_bit(m.bitmap, %(bit)s) = 1
+                    RETURNING m.{table}_id, 1 AS samples
+                ), {get_positions_sql(table)}
+                UPDATE variant_counts AS n
+                SET {update}
+                FROM positions AS p
+                WHERE n.reference_id=p.reference_id AND
+                      n.position=p.position AND n.is_mlst_set=FALSE;""",
+                values)
+
+
+@transaction.atomic
+def update_visibility(sample):
+    """Add a sample made public to the members and counts, or remove it."""
+    if sample.is_public:
+        add_sample(sample)
+    else:
+        remove_sample(sample)
+
+
+def lock_rows(cursor, table, version_sql, values):
+    """Lock the member rows of a sample's variants, in id order."""
+    # Samples inserted at the same time share variants, locking in order
+    # keeps them from deadlocking
+    cursor.execute(f"""
+        SELECT m.id
+        FROM variant_{table}member AS m, variant_{table}call AS c
+        WHERE {CALLS.format(table, version_sql)}
+        ORDER BY m.{table}_id
+        FOR UPDATE OF m;""", values)
+
+
+def rebuild_counts(reference):
+    """Replace the counts by position of all samples with the members'."""
+    values = {'reference_id': reference.pk}
+    with connection.cursor() as cursor:
+        cursor.execute("""DELETE FROM variant_counts
+                          WHERE reference_id=%(reference_id)s AND
+                                is_mlst_set=FALSE;""", values)
+        for table in CATEGORIES:
+            cursor.execute(f"""
+                WITH changed AS (
+                    SELECT {table}_id, count AS samples
+                    FROM variant_{table}member
+                    WHERE reference_id=%(reference_id)s AND count > 0
+                ), {get_positions_sql(table)}
+                {ADD_COUNTS}""", values)
@@ -0,0 +1,82 @@
+# Generated by Django 2.2.28 on 2026-10-18 08:45
+
+import django.contrib.postgres.fields.jsonb
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('version', '0001_initial'),
+        ('sample', '0009_sample_visibility'),
+        ('variant', '0014_auto_20180330_1613'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='variant',
+            name='indel',
+            field=django.contrib.postgres.fields.jsonb.JSONField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='variant',
+            name='snp',
+            field=django.contrib.postgres.fields.jsonb.JSONField(null=True),
+        ),
+        migrations.CreateModel(
+            name='SNPCall',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('reference_position', models.PositiveIntegerField()),
+                ('quality', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('ac', models.SmallIntegerField(null=True)),
+                ('ad_ref', models.IntegerField()),
+                ('ad_alt', models.IntegerField()),
+                ('af', models.FloatField()),
+                ('dp', models.IntegerField()),
+                ('gq', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('gt', models.IntegerField()),
+                ('mq', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('pl_homref', models.IntegerField()),
+                ('pl_het', models.IntegerField()),
+                ('qd', models.DecimalField(decimal_places=2, max_digits=10, null=True)),
+                ('annotation', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='variant.Annotation')),
+                ('comment', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='variant.Comment')),
+                ('filter', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='variant.Filter')),
+                ('sample', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='sample.Sample')),
+                ('snp', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='variant.SNP')),
+                ('version', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='version.Version')),
+            ],
+            options={
+                'unique_together': {('sample', 'version', 'snp')},
+            },
+        ),
+        migrations.CreateModel(
+            name='IndelCall',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('reference_position', models.PositiveIntegerField()),
+                ('quality', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('ac', models.SmallIntegerField(null=True)),
+                ('ad_ref', models.IntegerField()),
+                ('ad_alt', models.IntegerField()),
+                ('af', models.FloatField()),
+                ('dp', models.IntegerField()),
+                ('gq', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('gt', models.IntegerField()),
+                ('mq', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('pl_homref', models.IntegerField()),
+                ('pl_het', models.IntegerField()),
+                ('qd', models.DecimalField(decimal_places=2, max_digits=10, null=True)),
+                ('annotation', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='variant.Annotation')),
+                ('filter', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='variant.Filter')),
+                ('indel', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='variant.Indel')),
+                ('sample', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='sample.Sample')),
+                ('version', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='version.Version')),
+            ],
+            options={
+                'unique_together': {('sample', 'version', 'indel')},
+            },
+        ),
+    ]
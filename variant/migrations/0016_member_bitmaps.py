@@ -0,0 +1,53 @@
+# Generated by Django 2.2.28 on 2026-10-18 08:50
+
+import zlib
+
+from django.db import migrations, models
+
+
+def members_to_bitmaps(apps, schema_editor):
+    """Copy each member list to a bitmap, as written by api.bitmaps."""
+    for name in ['SNPMember', 'IndelMember']:
+        model = apps.get_model('variant', name)
+        for member in model.objects.exclude(count=0).iterator():
+            if not member.members:
+                # Emptied by deletes, count was not updated
+                member.bitmap = b''
+                member.count = 0
+                member.save(update_fields=['bitmap', 'count'])
+                continue
+
+            data = bytearray(max(member.members) // 8 + 1)
+            for sample_id in member.members:
+                data[sample_id >> 3] |= 1 << (sample_id & 7)
+            member.bitmap = zlib.compress(bytes(data).rstrip(b'\x00'))
+            member.save(update_fields=['bitmap'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('variant', '0015_variant_calls'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='indelmember',
+            name='bitmap',
+            field=models.BinaryField(default=b''),
+        ),
+        migrations.AddField(
+            model_name='snpmember',
+            name='bitmap',
+            field=models.BinaryField(default=b''),
+        ),
+        migrations.RunPython(members_to_bitmaps, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='indelmember',
+            name='members',
+        ),
+        migrations.RemoveField(
+            model_name='snpmember',
+            name='members',
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 2.2.28 on 2026-10-18 09:20
+
+import zlib
+
+from django.db import migrations
+
+
+def decompress_bitmaps(apps, schema_editor):
+    """Store bitmaps uncompressed, so bits can be set with set_bit()."""
+    for name in ['SNPMember', 'IndelMember']:
+        model = apps.get_model('variant', name)
+        for member in model.objects.exclude(bitmap=b'').iterator():
+            member.bitmap = zlib.decompress(member.bitmap)
+            member.save(update_fields=['bitmap'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('variant', '0016_member_bitmaps'),
+    ]
+
+    operations = [
+        migrations.RunPython(decompress_bitmaps, migrations.RunPython.noop),
+    ]
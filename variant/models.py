@@ -7,10 +7,35 @@ pipeline.
 import os
 
 from django.db import models
+from django.db.models.signals import post_save, pre_delete, pre_save
+from django.dispatch import receiver
 from django.contrib.postgres.fields import JSONField
 
 from sample.models import Sample
 from version.models import Version
+from variant.members import remove_sample, update_visibility
+
+
+@receiver(pre_delete, sender=Sample)
+def remove_sample_members(sender, instance=None, **kwargs):
+    """Remove a deleted sample from the members, before its calls go."""
+    remove_sample(instance)
+
+
+@receiver(pre_save, sender=Sample)
+def get_sample_visibility(sender, instance=None, **kwargs):
+    """Keep whether a sample was public, before it is saved."""
+    instance._was_public = Sample.objects.filter(pk=instance.pk).values_list(
+        'is_public', flat=True
+    ).first() if instance.pk else None
+
+
+@receiver(post_save, sender=Sample)
+def update_sample_members(sender, instance=None, created=False, **kwargs):
+    """Add a sample made public to the members, or remove it if private."""
+    was_public = getattr(instance, '_was_public', None)
+    if not created and was_public not in (None, instance.is_public):
+        update_visibility(instance)
 
 
 class Variant(models.Model):
@@ -22,13 +47,72 @@ class Variant(models.Model):
     reference = models.ForeignKey('Reference', on_delete=models.CASCADE)
     snp_count = models.PositiveIntegerField(default=0)
     indel_count = models.PositiveIntegerField(default=0)
-    snp = JSONField()
-    indel = JSONField()
+    # Replaced by SNPCall and IndelCall, see backfill_variant_calls
+    snp = JSONField(null=True)
+    indel = JSONField(null=True)
 
     class Meta:
         unique_together = ('sample', 'version', 'reference')
 
 
+class Call(models.Model):
+    """
+    The VCF fields of a variant called in a sample.
+
+    The annotation and position of the variant are copied to each call, so
+    a sample's calls can be filtered by them without a join. Only the unique
+    index is kept, the tables hold a row per sample per variant.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    sample = models.ForeignKey(Sample, on_delete=models.CASCADE,
+                               db_index=False)
+    version = models.ForeignKey(Version, on_delete=models.CASCADE,
+                                db_index=False, related_name='+')
+    annotation = models.ForeignKey('Annotation', on_delete=models.CASCADE,
+                                   db_index=False)
+    reference_position = models.PositiveIntegerField()
+    filter = models.ForeignKey('Filter', on_delete=models.CASCADE,
+                               db_index=False)
+
+    quality = models.DecimalField(max_digits=10, decimal_places=2)
+    ac = models.SmallIntegerField(null=True)
+    ad_ref = models.IntegerField()
+    ad_alt = models.IntegerField()
+    af = models.FloatField()
+    dp = models.IntegerField()
+    gq = models.DecimalField(max_digits=10, decimal_places=2)
+    gt = models.IntegerField()
+    mq = models.DecimalField(max_digits=10, decimal_places=2)
+    pl_homref = models.IntegerField()
+    pl_het = models.IntegerField()
+    qd = models.DecimalField(max_digits=10, decimal_places=2, null=True)
+
+    class Meta:
+        abstract = True
+
+
+class SNPCall(Call):
+    """A SNP called in a sample."""
+
+    snp = models.ForeignKey('SNP', on_delete=models.CASCADE, db_index=False)
+    comment = models.ForeignKey('Comment', on_delete=models.CASCADE,
+                                db_index=False)
+
+    class Meta:
+        unique_together = ('sample', 'version', 'snp')
+
+
+class IndelCall(Call):
+    """An InDel called in a sample."""
+
+    indel = models.ForeignKey('Indel', on_delete=models.CASCADE,
+                              db_index=False)
+
+    class Meta:
+        unique_together = ('sample', 'version', 'indel')
+
+
 class Indel(models.Model):
     """Information unique to the SNP."""
 
@@ -65,7 +149,8 @@ class IndelMember(models.Model):
     reference = models.ForeignKey('Reference', on_delete=models.CASCADE)
     indel = models.OneToOneField('Indel', on_delete=models.CASCADE)
     count = models.PositiveIntegerField(db_index=True)
-    members = JSONField(default=[])
+    # Public samples the variant was called in, see api.bitmaps
+    bitmap = models.BinaryField(default=b'')
 
     class Meta:
         unique_together = ('reference', 'indel')
@@ -120,7 +205,8 @@ class SNPMember(models.Model):
     reference = models.ForeignKey('Reference', on_delete=models.CASCADE)
     snp = models.OneToOneField('SNP', on_delete=models.CASCADE)
     count = models.PositiveIntegerField(db_index=True)
-    members = JSONField(default=[])
+    # Public samples the variant was called in, see api.bitmaps
+    bitmap = models.BinaryField(default=b'')
 
     class Meta:
         unique_together = ('reference', 'snp')
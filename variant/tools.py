@@ -5,6 +5,8 @@ To use:
 from variant.tools import UTIL1, UTIL2, etc...
 """
 from collections import OrderedDict
+from decimal import Decimal
+from io import StringIO
 import sys
 import time
 from cyvcf2 import VCF
@@ -13,19 +15,107 @@ from django.db import connection, transaction
 from django.db.utils import IntegrityError
 from django.core.management.base import CommandError
 
+from api.cache import bump_generation, catalog_stamp
+from api.utils import IdArray, query_database
 from staphopia.utils import timeit
 from sample.tools import empty_results
+from variant.members import add_sample, remove_sample
 from variant.models import (
     Annotation,
     Comment,
     Feature,
     Filter,
     Indel,
+    IndelCall,
     Reference,
     SNP,
+    SNPCall,
     Variant
 )
 
+# Columns of variant_snp written by Variants.upsert_snps
+SNP_COPY_COLUMNS = [
+    'reference_id', 'annotation_id', 'feature_id', 'reference_position',
+    'reference_base', 'alternate_base', 'reference_codon', 'alternate_codon',
+    'reference_amino_acid', 'alternate_amino_acid', 'codon_position',
+    'snp_codon_position', 'amino_acid_change', 'is_synonymous',
+    'is_transition', 'is_genic'
+]
+
+
+def copy_value(value):
+    """Return a value escaped for COPY's text format."""
+    return str(value).replace('\\', '\\\\').replace(
+        '\t', '\\t'
+    ).replace('\n', '\\n').replace('\r', '\\r')
+
+
+def get_call_fields(variant):
+    """Return the Call fields of a variant, as stored in Variant.snp."""
+    # VCF fields are stored as 1-tuples, AD and PL as 'ref,alt'
+    ad_ref, ad_alt = variant['AD'][0].split(',')
+    pl_homref, pl_het = variant['PL'][0].split(',')
+    return {
+        'annotation_id': variant['annotation_id'],
+        'filter_id': variant['filter_id'],
+        'quality': Decimal(variant['quality']),
+        'ac': variant['AC'][0],
+        'ad_ref': int(ad_ref),
+        'ad_alt': int(ad_alt),
+        'af': variant['AF'][0],
+        'dp': variant['DP'][0],
+        'gq': Decimal(variant['GQ'][0]),
+        'gt': int(variant['GT'][0]),
+        'mq': Decimal(variant['MQ'][0]),
+        'pl_homref': int(pl_homref),
+        'pl_het': int(pl_het),
+        'qd': None if variant['QD'][0] == '.' else Decimal(variant['QD'][0])
+    }
+
+
+def get_positions(table, variants, id_column):
+    """
+    Return the reference position of SNPs or InDels by id.
+
+    Variants read from a VCF have their position, only those of the JSON
+    stored in Variant (see backfill_variant_calls) are queried.
+    """
+    positions = {}
+    ids = []
+    for variant in variants:
+        if 'reference_position' in variant:
+            positions[variant[id_column]] = variant['reference_position']
+        else:
+            ids.append(variant[id_column])
+
+    if ids:
+        sql = f"""SELECT id, reference_position
+                  FROM {table}
+                  WHERE id IN %s;"""
+        for row in query_database(sql, values=[IdArray(ids)]):
+            positions[row['id']] = row['reference_position']
+    return positions
+
+
+def insert_calls(sample, version, snps, indels):
+    """Insert the SNP and InDel calls of a sample."""
+    positions = get_positions('variant_snp', snps, 'snp_id')
+    SNPCall.objects.bulk_create([
+        SNPCall(sample=sample, version=version, snp_id=snp['snp_id'],
+                comment_id=snp['comment'],
+                reference_position=positions[snp['snp_id']],
+                **get_call_fields(snp))
+        for snp in snps
+    ], batch_size=5000)
+
+    positions = get_positions('variant_indel', indels, 'indel_id')
+    IndelCall.objects.bulk_create([
+        IndelCall(sample=sample, version=version, indel_id=indel['indel_id'],
+                  reference_position=positions[indel['indel_id']],
+                  **get_call_fields(indel))
+        for indel in indels
+    ], batch_size=5000)
+
 
 @timeit
 def insert_variants(sample, version, files, force=False):
@@ -33,11 +123,17 @@ def insert_variants(sample, version, files, force=False):
     if force:
         print(f'{sample.name}: Force used, emptying variant related results.')
         empty_results('variant_variant', sample.pk, version.pk)
+        remove_sample(sample, version=version)
+        empty_results('variant_snpcall', sample.pk, version.pk)
+        empty_results('variant_indelcall', sample.pk, version.pk)
 
     v = Variants(sample, version, files['variants'])
+    v.process_snps()
     v.process_indels()
     v.insert_variants()
 
+    bump_generation(sample.pk)
+
 
 class Variants(object):
     """Insert VCF into the database."""
@@ -57,10 +153,13 @@ class Variants(object):
         self.get_comment_instances()
         self.get_filters()
         self.get_filter_instances()
+        self.create_catalog_entries()
         self.get_snps()
 
         # Lists for bulk creation
         self.snps = []
+        self.temp_snps = []
+        self.new_snps = OrderedDict()
         self.temp_indels = []
         self.indel_queries = []
         self.indel_positions = []
@@ -79,10 +178,10 @@ class Variants(object):
                 version=self.version,
                 reference=self.reference,
                 snp_count=len(self.snps),
-                indel_count=len(self.indels),
-                snp=self.snps,
-                indel=self.indels
+                indel_count=len(self.indels)
             )
+            insert_calls(self.sample, self.version, self.snps, self.indels)
+            add_sample(self.sample, self.version)
         except IntegrityError as e:
             raise CommandError(f'{self.name} Error saving variants {e}')
 
@@ -103,6 +202,8 @@ class Variants(object):
             self.reference, created = Reference.objects.get_or_create(
                 name=r
             )
+            if created:
+                bump_generation(catalog_stamp('variant'))
         except IntegrityError:
             raise CommandError('Error getting/saving reference information')
 
@@ -130,6 +231,8 @@ class Variants(object):
                     feature=feature
                 )
                 self.features[feature] = feature_obj
+                bump_generation(catalog_stamp('variant'))
+                return feature_obj
             except IntegrityError:
                 raise CommandError('Error getting/saving feature information')
 
@@ -170,85 +273,113 @@ class Variants(object):
             pks.append(ks.pk)
         self.filter_instances = Filter.objects.in_bulk(pks)
 
-    @transaction.atomic
     def get_annotation(self, record):
-        """Check if annotation is already in db, if not insert it."""
-        annotation = None
+        """Return the annotation of a record, see create_catalog_entries."""
         locus_tag = record.INFO['LocusTag']
-        if locus_tag in self.locus_tags:
-            pk = self.locus_tags[locus_tag]
-            annotation = self.annotations[pk]
-        elif locus_tag == '.':
-            if 'inter_genic' not in self.locus_tags:
-                annotation = Annotation.objects.create(
-                    reference=self.reference,
-                    locus_tag='inter_genic',
-                    protein_id='inter_genic',
-                    gene='inter_genic',
-                    product='inter_genic',
-                    note='inter_genic',
-                    is_pseudo=record.INFO['IsPseudo']
-                )
-                self.locus_tags['inter_genic'] = annotation.pk
-                self.annotations[annotation.pk] = annotation
-            else:
-                pk = self.locus_tags['inter_genic']
-                annotation = self.annotations[pk]
-        else:
-            protein_id = record.INFO['ProteinID']
-            if protein_id == '.':
-                protein_id = "not_applicable"
-
-            annotation = Annotation.objects.create(
+        if locus_tag == '.':
+            locus_tag = 'inter_genic'
+        return self.annotations[self.locus_tags[locus_tag]]
+
+    def new_annotation(self, record, locus_tag):
+        """Return an unsaved annotation of a locus tag new to the reference."""
+        if locus_tag == 'inter_genic':
+            return Annotation(
                 reference=self.reference,
-                locus_tag=locus_tag,
-                protein_id=protein_id,
-                gene=('.' if record.INFO['Gene'] is None
-                      else record.INFO['Gene']),
-                product=('.' if record.INFO['Product'] is None
-                         else record.INFO['Product']),
-                note=('.' if record.INFO['Note'] is None
-                      else record.INFO['Note']),
+                locus_tag='inter_genic',
+                protein_id='inter_genic',
+                gene='inter_genic',
+                product='inter_genic',
+                note='inter_genic',
                 is_pseudo=record.INFO['IsPseudo']
             )
-            self.locus_tags[locus_tag] = annotation.pk
-            self.annotations[annotation.pk] = annotation
 
-        return annotation
+        protein_id = record.INFO['ProteinID']
+        if protein_id == '.':
+            protein_id = "not_applicable"
+
+        return Annotation(
+            reference=self.reference,
+            locus_tag=locus_tag,
+            protein_id=protein_id,
+            gene=('.' if record.INFO['Gene'] is None
+                  else record.INFO['Gene']),
+            product=('.' if record.INFO['Product'] is None
+                     else record.INFO['Product']),
+            note=('.' if record.INFO['Note'] is None
+                  else record.INFO['Note']),
+            is_pseudo=record.INFO['IsPseudo']
+        )
 
-    @transaction.atomic
     def get_filter(self, name):
         """Get the GATK filter applid to the entry."""
-        record_filters = None
-        if not name:
-            name = 'PASS'
-
-        if name in self.filters:
-            pk = self.filters[name]
-            record_filters = self.filter_instances[pk]
-        else:
-            record_filters = Filter.objects.create(name=name)
-            self.filters[name] = record_filters.pk
-            self.filter_instances[record_filters.pk] = record_filters
-
-        return record_filters
+        return self.filter_instances[self.filters[name or 'PASS']]
 
-    @transaction.atomic
     def get_comment(self, c):
         """Get any comments associated with the entry."""
-        comment = None
-        if c is None:
-            c = 'None'
+        return self.comment_instances[self.comments['None' if c is None
+                                                   else c]]
 
-        if c in self.comments:
-            pk = self.comments[c]
-            comment = self.comment_instances[pk]
-        else:
-            comment = Comment.objects.create(comment=c)
-            self.comments[c] = comment.pk
-            self.comment_instances[comment.pk] = comment
-
-        return comment
+    @timeit
+    @transaction.atomic
+    def create_catalog_entries(self):
+        """
+        Create the annotations, features, filters and comments new to the VCF.
+
+        They are created in bulk before the records are read, so reading a
+        record only looks them up.
+        """
+        annotations = OrderedDict()
+        features = set()
+        filters = set()
+        comments = set()
+        for record in self.records:
+            locus_tag = record.INFO['LocusTag']
+            if locus_tag == '.':
+                locus_tag = 'inter_genic'
+            is_new = locus_tag not in self.locus_tags
+            if is_new and locus_tag not in annotations:
+                annotations[locus_tag] = self.new_annotation(record,
+                                                             locus_tag)
+            features.add(record.INFO['FeatureType'])
+            filters.add(record.FILTER or 'PASS')
+            if record.is_snp:
+                comment = record.INFO['Comments'][0]
+                comments.add('None' if comment is None else comment)
+
+        features = features - set(self.features)
+        filters = filters - set(self.filters)
+        comments = comments - set(self.comments)
+        if annotations:
+            for annotation in Annotation.objects.bulk_create(
+                annotations.values()
+            ):
+                self.locus_tags[annotation.locus_tag] = annotation.pk
+                self.annotations[annotation.pk] = annotation
+        if features:
+            for feature in Feature.objects.bulk_create([
+                Feature(reference=self.reference, feature=feature)
+                for feature in features
+            ]):
+                self.features[feature.feature] = feature
+        if filters:
+            # Samples inserted at the same time may create the same ones
+            Filter.objects.bulk_create([Filter(name=name) for name in filters],
+                                       ignore_conflicts=True)
+            for f in Filter.objects.filter(name__in=filters):
+                self.filters[f.name] = f.pk
+                self.filter_instances[f.pk] = f
+        if comments:
+            Comment.objects.bulk_create([Comment(comment=c) for c in comments],
+                                        ignore_conflicts=True)
+            for c in Comment.objects.filter(comment__in=comments):
+                self.comments[c.comment] = c.pk
+                self.comment_instances[c.pk] = c
+
+        if annotations or features or filters or comments:
+            bump_generation(catalog_stamp('variant'))
+            print(f'{self.name}, added {len(annotations)} annotations, '
+                  f'{len(features)} features, {len(filters)} filters and '
+                  f'{len(comments)} comments.')
 
     @timeit
     def get_snps(self):
@@ -257,69 +388,96 @@ class Variants(object):
         for snp in SNP.objects.filter(
             reference=self.reference,
             reference_position__in=[record.POS for record in self.records]
-        ):
-            key = (
-                snp.reference_position,
-                snp.reference_base,
-                snp.alternate_base
-            )
-            self.all_snps[key] = snp
+        ).values_list('reference_position', 'reference_base',
+                      'alternate_base', 'id', 'annotation_id'):
+            self.all_snps[snp[:3]] = snp[3:]
+
+    def get_snp(self, record, annotation, feature):
+        """Return the SNP_COPY_COLUMNS of a new snp."""
+        return (
+            self.reference.pk,
+            annotation.pk,
+            feature.pk,
+            record.POS,
+            record.REF,
+            str(record.ALT[0]),
+            ('.' if record.INFO['RefCodon'][0] is None
+             else record.INFO['RefCodon'][0]),
+            ('.' if record.INFO['AltCodon'][0] is None
+             else record.INFO['AltCodon'][0]),
+            ('.' if record.INFO['RefAminoAcid'][0] is None
+             else record.INFO['RefAminoAcid'][0]),
+            ('.' if record.INFO['AltAminoAcid'][0] is None
+             else record.INFO['AltAminoAcid'][0]),
+            (0 if record.INFO['CodonPosition'] is None
+             else record.INFO['CodonPosition']),
+            (0 if record.INFO['SNPCodonPosition'] is None
+             else record.INFO['SNPCodonPosition']),
+            ('.' if record.INFO['AminoAcidChange'][0] is None
+             else record.INFO['AminoAcidChange'][0]),
+            record.INFO['IsSynonymous'],
+            record.INFO['IsTransition'],
+            record.INFO['IsGenic']
+        )
 
+    @timeit
     @transaction.atomic
-    def get_snp(self, record, reference, annotation, feature):
-        """Get an individual snp."""
-        snp = False
-        while not snp:
-            try:
-                print(record.POS, feature.feature)
-                snp = SNP.objects.create(
-                    reference=reference,
-                    annotation=annotation,
-                    feature=feature,
-                    reference_position=record.POS,
-                    reference_base=record.REF,
-                    alternate_base=record.ALT[0],
-
-                    reference_codon=(
-                        '.' if record.INFO['RefCodon'][0] is None
-                        else record.INFO['RefCodon'][0]
-                    ),
-                    alternate_codon=(
-                        '.' if record.INFO['AltCodon'][0] is None
-                        else record.INFO['AltCodon'][0]
-                    ),
-                    reference_amino_acid=(
-                        '.' if record.INFO['RefAminoAcid'][0] is None
-                        else record.INFO['RefAminoAcid'][0]
-                    ),
-                    alternate_amino_acid=(
-                        '.' if record.INFO['AltAminoAcid'][0] is None
-                        else record.INFO['AltAminoAcid'][0]
-                    ),
-                    codon_position=(
-                        0 if record.INFO['CodonPosition'] is None
-                        else record.INFO['CodonPosition']
-                    ),
-                    snp_codon_position=(
-                        0 if record.INFO['SNPCodonPosition'] is None
-                        else record.INFO['SNPCodonPosition']
-                    ),
-                    amino_acid_change=(
-                        '.' if record.INFO['AminoAcidChange'][0] is None
-                        else record.INFO['AminoAcidChange'][0]
-                    ),
-                    is_synonymous=record.INFO['IsSynonymous'],
-                    is_transition=record.INFO['IsTransition'],
-                    is_genic=record.INFO['IsGenic'],
-                )
-            except IntegrityError:
-                print("Trying SNP ({0},{1}->{2}) again".format(
-                    record.POS, record.REF, record.ALT[0]
-                ), file=sys.stderr)
-                time.sleep(0.33)
-                continue
+    def upsert_snps(self, snps):
+        """
+        Insert new snps, return the id and annotation of each.
+
+        The snps are copied into a staging table, then merged into
+        variant_snp. Snps inserted by another sample in the meantime are
+        kept, their ids are read back with the new ones.
+        """
+        columns = ','.join(SNP_COPY_COLUMNS)
+        data = StringIO(''.join(
+            '\t'.join(copy_value(value) for value in snp) + '\n'
+            for snp in snps
+        ))
+        with connection.cursor() as cursor:
+            cursor.execute(f"""
+                CREATE TEMPORARY TABLE IF NOT EXISTS variant_snp_staging
+                ON COMMIT DROP AS
+                SELECT {columns} FROM variant_snp WITH NO DATA;
+                TRUNCATE variant_snp_staging;""")
+            cursor.copy_expert(
+                f'COPY variant_snp_staging ({columns}) FROM STDIN;', data
+            )
+            # Sorted, so samples inserted at the same time wait on each
+            # other instead of deadlocking
+            cursor.execute(f"""
+                INSERT INTO variant_snp ({columns})
+                SELECT {columns}
+                FROM variant_snp_staging
+                ORDER BY reference_position, reference_base, alternate_base
+                ON CONFLICT DO NOTHING;""")
+            print(f'{self.name}, added {cursor.rowcount} new snps.')
+            cursor.execute("""
+                SELECT v.reference_position, v.reference_base,
+                       v.alternate_base, v.id, v.annotation_id
+                FROM variant_snp AS v
+                JOIN variant_snp_staging AS s
+                ON v.reference_id=s.reference_id AND
+                   v.reference_position=s.reference_position AND
+                   v.reference_base=s.reference_base AND
+                   v.alternate_base=s.alternate_base;""")
+            return {row[:3]: row[3:] for row in cursor.fetchall()}
 
-        return snp
+    @timeit
+    def process_snps(self):
+        """Add the id and annotation of each snp, inserting new snps."""
+        if self.new_snps:
+            self.all_snps.update(self.upsert_snps(
+                list(self.new_snps.values())
+            ))
+
+        for snp in self.temp_snps:
+            variant = snp['data']
+            snp_id, annotation_id = self.all_snps[snp['key']]
+            variant['annotation_id'] = annotation_id
+            variant['snp_id'] = snp_id
+            self.snps.append(variant)
 
     @timeit
     def get_indels(self):
@@ -396,7 +554,7 @@ class Variants(object):
         for indel in self.temp_indels:
             variant = indel['data']
             indel_obj = self.all_indels[indel['key']]
-            variant['annotation_id'] = indel_obj.annotation.pk
+            variant['annotation_id'] = indel_obj.annotation_id
             variant['indel_id'] = indel_obj.pk
             self.indels.append(variant)
 
@@ -411,6 +569,7 @@ class Variants(object):
             record_filters = self.get_filter(record.FILTER)
             variant = {}
             variant['filter_id'] = record_filters.pk
+            variant['reference_position'] = record.POS
             # Store variant confidence
             AD = f'{record.gt_ref_depths[0]},{record.gt_alt_depths[0]}'
             PL = f'{record.gt_phred_ll_homref[0]}, {record.gt_phred_ll_het[0]}'
@@ -431,19 +590,12 @@ class Variants(object):
 
             if record.is_snp:
                 comment = self.get_comment(record.INFO['Comments'][0])
-                try:
-                    snp_obj = self.all_snps[(
-                        record.POS,
-                        record.REF,
-                        str(record.ALT[0])
-                    )]
-                except KeyError:
-                    snp_obj = self.get_snp(record, self.reference, annotation,
-                                           feature)
+                key = (record.POS, record.REF, str(record.ALT[0]))
+                if key not in self.all_snps and key not in self.new_snps:
+                    self.new_snps[key] = self.get_snp(record, annotation,
+                                                      feature)
                 variant['comment'] = comment.pk
-                variant['annotation_id'] = snp_obj.annotation.pk
-                variant['snp_id'] = snp_obj.pk
-                self.snps.append(variant)
+                self.temp_snps.append({'key': key, 'data': variant})
             else:
                 key = (record.POS, record.REF, str(record.ALT[0]))
                 self.indel_positions.append(record.POS)
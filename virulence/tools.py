@@ -10,6 +10,7 @@ from django.db import transaction
 from django.db.utils import IntegrityError
 from django.core.management.base import CommandError
 
+from api.cache import bump_generation
 from assembly.tools import get_contigs
 from sccmec.tools import insert_blast
 from staphopia.utils import read_fasta, timeit
@@ -50,6 +51,8 @@ def insert_virulence(sample, version, files, force=False):
             f'Please use --force to update stats. Error: {e}'
         ]))
 
+    bump_generation(sample.pk)
+
 
 def get_clusters():
     """Get clusters."""